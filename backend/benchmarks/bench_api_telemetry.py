@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""/api/telemetry benchmark'ı: her istekte to_dict + jsonify vs. sürümlü JSON snapshot
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_api_telemetry.py [istek_sayısı]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import jsonify  # noqa: E402
+
+import main_system  # noqa: E402
+from main_system import app, ground_station  # noqa: E402
+from station_log import OFF  # noqa: E402
+
+
+def legacy_api_telemetry():
+    """Snapshot önbelleğinden önceki /api/telemetry (referans)
+
+    Eski sürüm asdict kullanıyordu; liquid_levels artık bytes olduğundan
+    aynı işi (her istekte sözlük + jsonify) JSON'a uygun to_dict() yapar.
+    """
+    return jsonify({
+        'success': True,
+        'data': ground_station.telemetry.to_dict()
+    })
+
+
+app.add_url_rule('/bench/legacy-telemetry', 'bench_legacy_telemetry', legacy_api_telemetry)
+
+
+def _measure_client(client, url, count, headers=None):
+    """Tam WSGI istek döngüsü (Flask test client)"""
+    start = time.perf_counter()
+    for _ in range(count):
+        client.get(url, headers=headers)
+    return count / (time.perf_counter() - start)
+
+
+def _measure_handler(view, count, headers=None):
+    """Yalnızca route fonksiyonu (istek bağlamı bir kez kurulur)"""
+    with app.test_request_context('/api/telemetry', headers=headers):
+        start = time.perf_counter()
+        for _ in range(count):
+            view()
+        return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    ground_station.log.set_level(OFF)
+    ground_station.parse_lora_data(
+        "ALT:1204.3m|maxALT:1210.0m|dY:-3.4|F:1|P1:1|P2:0|gX:12.4|gY:-0.7|gZ:3.3|"
+        "aX:-0.52|aY:0.41|aZ:-2.10|pitch:12.0|GPS:39.925019,32.836954|GPS_ALT:1198.2")
+    client = app.test_client()
+    etag = {'If-None-Match': client.get('/api/telemetry').headers['ETag']}
+
+    rows = [
+        ("to_dict + jsonify",
+         _measure_handler(legacy_api_telemetry, count),
+         _measure_client(client, '/bench/legacy-telemetry', count)),
+        ("Snapshot (200)",
+         _measure_handler(main_system.api_telemetry, count),
+         _measure_client(client, '/api/telemetry', count)),
+        ("Snapshot, If-None-Match (304)",
+         _measure_handler(main_system.api_telemetry, count, etag),
+         _measure_client(client, '/api/telemetry', count, etag)),
+    ]
+
+    print(f"İstek sayısı: {count}")
+    print(f"{'Senaryo':<32}{'Handler':>16}{'Test client':>16}")
+    for name, handler_rate, client_rate in rows:
+        print(f"{name:<32}{handler_rate:>10,.0f} ist/s{client_rate:>10,.0f} ist/s")
+    print("Not: snapshot JSON'u her yeni örnekte bir kez, ilk istekte üretilir.")
+
+
+if __name__ == "__main__":
+    main()
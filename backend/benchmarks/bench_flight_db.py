@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Uçuş veritabanı: kayıt maliyeti ve 30 dakikalık oturumun dışa aktarımı
+
+record() alıcı thread'inin ödediği süredir (satır başına birkaç µs olmalı).
+Ardından 50 Hz'de 30 dakikalık roket tablosu (90.000 satır) yazılır ve
+CSV, JSON Lines ve sütun bazlı formatta, ayrıca tek sütunla dışa aktarım
+süreleri ölçülür.
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_flight_db.py [satır_sayısı]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flight_db import EXPORTERS, FlightDatabase, table_path  # noqa: E402
+from main_system import TEKNOFESTGroundStation, flight_tables  # noqa: E402
+from simulator import FlightProfile, rocket_line  # noqa: E402
+from station_log import OFF  # noqa: E402
+
+
+def _export(path: str, export_format: str, fields=None):
+    start = time.perf_counter()
+    size = sum(len(chunk) for chunk in EXPORTERS[export_format](path, fields))
+    return time.perf_counter() - start, size
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 90_000
+    directory = tempfile.mkdtemp(prefix='flight_db_bench_')
+    try:
+        station = TEKNOFESTGroundStation()
+        station.log.set_level(OFF)
+        station.running = True
+        profile = FlightProfile(seed=1)
+        lines = [rocket_line(profile.state(i * 0.02)) for i in range(1000)]
+        for line in lines:
+            station.handle_lora_chunk(line)
+        telemetry = station.telemetry
+
+        db = FlightDatabase(directory, flight_tables(), flush_interval=0.2)
+        db.open('bench')
+        start = time.perf_counter()
+        for _ in range(rows):
+            db.record('rocket', telemetry)
+        record = (time.perf_counter() - start) / rows * 1e6
+        db.close()
+
+        path = table_path(directory, 'bench', 'rocket')
+        print(f"Satır sayısı: {rows} (roket tablosu {os.path.getsize(path) / 1e6:.1f} MB)")
+        print(f"record(): {record:.2f} µs/satır")
+        print(f"{'Dışa aktarım':<28}{'süre (s)':>10}{'boyut (MB)':>12}")
+        for name, export_format, fields in (
+            ("CSV", 'csv', None),
+            ("JSON Lines", 'jsonl', None),
+            ("Sütun bazlı (etudb)", 'etudb', None),
+            ("CSV (altitude)", 'csv', ['altitude']),
+            ("etudb (altitude)", 'etudb', ['altitude']),
+        ):
+            seconds, size = _export(path, export_format, fields)
+            print(f"{name:<28}{seconds:>10.3f}{size / 1e6:>12.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""create_hyi_packet benchmark'ı: alan alan struct.pack vs. önceden derlenmiş düzen
+
+Çalıştırmadan önce paketleyici tests/test_hyi_packet.py'deki sabit (golden)
+paketlerle ve eski implementasyonla karşılaştırılır.
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_hyi_packet.py [paket_sayısı]
+"""
+
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hyi_packet import HYI_PACKET_SIZE  # noqa: E402
+from main_system import TEKNOFESTGroundStation, TelemetryData  # noqa: E402
+from station_log import OFF  # noqa: E402
+from tests.test_hyi_packet import FLIGHT_SAMPLE, GOLDEN_PACKETS  # noqa: E402
+
+
+def legacy_create_hyi_packet(self, telemetry: TelemetryData = None) -> bytes:
+    """struct.Struct düzeninden önceki create_hyi_packet (referans)"""
+    # Tüm alanlar tek bir tutarlı snapshot'tan okunur
+    if telemetry is None:
+        telemetry = self.telemetry
+    packet = bytearray(78)
+
+    # Header (Byte 1-4: 0xFF, 0xFF, 0x54, 0x52)
+    packet[0:4] = [0xFF, 0xFF, 0x54, 0x52]
+
+    # Takım ID (Byte 5)
+    packet[4] = self.team_id
+
+    # Paket Sayacı (Byte 6)
+    packet[5] = self.packet_counter
+
+    # İrtifa (Byte 7-10) - Basınç sensörü irtifası
+    packet[6:10] = struct.pack('<f', telemetry.altitude)
+
+    # Roket GPS İrtifa (Byte 11-14)
+    packet[10:14] = struct.pack('<f', telemetry.gps_altitude if telemetry.gps_valid else 0.0)
+
+    # Roket Enlem (Byte 15-18)
+    packet[14:18] = struct.pack('<f', telemetry.gps_latitude if telemetry.gps_valid else 0.0)
+
+    # Roket Boylam (Byte 19-22)
+    packet[18:22] = struct.pack('<f', telemetry.gps_longitude if telemetry.gps_valid else 0.0)
+
+    # Görev yükü GPS İrtifa (Byte 23-26) - Payload GPS'den
+    packet[22:26] = struct.pack('<f', telemetry.payload_gps_altitude)
+
+    # Görev yükü Enlem (Byte 27-30) - Payload GPS'den
+    packet[26:30] = struct.pack('<f', telemetry.payload_latitude)
+
+    # Görev yükü Boylam (Byte 31-34) - Payload GPS'den
+    packet[30:34] = struct.pack('<f', telemetry.payload_longitude)
+
+    # Debug: Payload GPS verilerini log'la
+    if (telemetry.payload_latitude != 0.0 or telemetry.payload_longitude != 0.0 or 
+        telemetry.payload_gps_altitude != 0.0):
+        self.add_log(f"📡 HYİ'ye gönderilen Payload GPS: Alt={telemetry.payload_gps_altitude:.1f}m, Lat={telemetry.payload_latitude:.6f}, Lon={telemetry.payload_longitude:.6f}")
+
+    # Kademe GPS İrtifa (Byte 35-38) - Sıfır
+    packet[34:38] = struct.pack('<f', 0.0)
+
+    # Kademe Enlem (Byte 39-42) - Sıfır
+    packet[38:42] = struct.pack('<f', 0.0)
+
+    # Kademe Boylam (Byte 43-46) - Sıfır
+    packet[42:46] = struct.pack('<f', 0.0)
+
+    # Jiroskop X (Byte 47-50)
+    packet[46:50] = struct.pack('<f', telemetry.gyro_x)
+
+    # Jiroskop Y (Byte 51-54)
+    packet[50:54] = struct.pack('<f', telemetry.gyro_y)
+
+    # Jiroskop Z (Byte 55-58)
+    packet[54:58] = struct.pack('<f', telemetry.gyro_z)
+
+    # İvme X (Byte 59-62)
+    packet[58:62] = struct.pack('<f', telemetry.accel_x)
+
+    # İvme Y (Byte 63-66)
+    packet[62:66] = struct.pack('<f', telemetry.accel_y)
+
+    # İvme Z (Byte 67-70)
+    packet[66:70] = struct.pack('<f', telemetry.accel_z)
+
+    # Açı (Byte 71-74)
+    packet[70:74] = struct.pack('<f', telemetry.pitch)
+
+    # Durum (Byte 75) - Paraşüt durumu
+    # P1 ve P2 değerlerine göre durum hesapla
+    if telemetry.p1 and telemetry.p2:
+        packet[74] = 4  # Her iki paraşüt de tetiklendi
+    elif telemetry.p1 and not telemetry.p2:
+        packet[74] = 2  # Sadece birincil paraşüt tetiklendi
+    elif not telemetry.p1 and telemetry.p2:
+        packet[74] = 3  # Sadece ikincil paraşüt tetiklendi
+    else:
+        packet[74] = 1  # Hiçbir paraşüt tetiklenmedi
+
+    # CheckSum (Byte 76) - Byte 5'ten Byte 75'e kadar toplam mod 256
+    checksum = sum(packet[4:75]) % 256
+    packet[75] = checksum
+
+    # Footer (Byte 77-78: 0x0D, 0x0A)
+    packet[76] = 0x0D
+    packet[77] = 0x0A
+
+    return bytes(packet)
+
+
+def _quiet_station():
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)
+    return station
+
+
+def check_golden():
+    """Paketleyiciyi sabit paketlerle ve eski implementasyonla karşılaştır"""
+    station = _quiet_station()
+    for team_id, counter, updates, expected in GOLDEN_PACKETS:
+        expected = bytes.fromhex(expected)
+        telemetry = TelemetryData().evolve(updates)
+        station.team_id, station.packet_counter = team_id, counter
+        packet = station.create_hyi_packet(telemetry)
+        assert len(packet) == HYI_PACKET_SIZE == 78
+        assert packet[75] == sum(packet[4:75]) % 256
+        assert packet == expected, (packet.hex(), expected.hex())
+        if not telemetry.stage_gps_valid:  # Eski implementasyon kademe GPS'i hep 0 yazar
+            assert legacy_create_hyi_packet(station, telemetry) == expected
+
+
+def _measure(build, snapshots, count):
+    start = time.perf_counter()
+    for i in range(count):
+        build(snapshots[i % len(snapshots)])
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    check_golden()
+
+    station = _quiet_station()
+    station.team_id, station.packet_counter = 42, 7
+    # Her pakette yeni snapshot (gövde yeniden paketlenir) ve aynı snapshot'ın
+    # yeniden gönderimi (yalnızca sayaç + artımlı CheckSum) ayrı ölçülür
+    fresh = [TelemetryData().evolve({**FLIGHT_SAMPLE, 'altitude': 1000.0 + i}) for i in range(1000)]
+    same = [TelemetryData().evolve(FLIGHT_SAMPLE)]
+    legacy_rate = _measure(lambda t: legacy_create_hyi_packet(station, t), fresh, count)
+    fresh_rate = _measure(station.create_hyi_packet, fresh, count)
+    same_rate = _measure(station.create_hyi_packet, same, count)
+
+    print(f"Paket sayısı: {count} (golden paketler: {len(GOLDEN_PACKETS)} / OK)")
+    print(f"{'Yöntem':<36}{'Paket/s':>14}{'Hızlanma':>10}")
+    print(f"{'Alan alan struct.pack':<36}{legacy_rate:>14,.0f}{1.0:>9.2f}x")
+    print(f"{'pack_into (yeni snapshot)':<36}{fresh_rate:>14,.0f}{fresh_rate / legacy_rate:>9.2f}x")
+    print(f"{'pack_into (aynı snapshot)':<36}{same_rate:>14,.0f}{same_rate / legacy_rate:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
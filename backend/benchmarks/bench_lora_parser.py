@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""parse_lora_data mikro benchmark'ı: alan tablosu vs. eski regex parser
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_lora_parser.py [satır_sayısı]
+"""
+
+import os
+import re
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main_system import TEKNOFESTGroundStation, TelemetryData  # noqa: E402
+from station_log import OFF  # noqa: E402
+
+
+SAMPLE_LINES = [
+    "ALT:837.9m|maxALT:838.6m|dY:1.9|F:0|P1:0|P2:0|gX:-1.9|gY:-4.2|gZ:0.0|aX:0.12|aY:-0.03|aZ:9.81|pitch:87.5|GPS:invalid",
+    "ALT:1204.3m|maxALT:1210.0m|dY:-3.4|F:1|P1:1|P2:0|gX:12.4|gY:-0.7|gZ:3.3|aX:-0.52|aY:0.41|aZ:-2.10|pitch:12.0|GPS:39.925019,32.836954|GPS_ALT:1198.2",
+    "ALT:402.0m|maxALT:1210.0m|dY:-8.1|F:1|P1:1|P2:1|gX:0.4|gY:0.2|gZ:-0.1|aX:0.01|aY:0.02|aZ:9.79|pitch:-3.5|GPS:39.925101,32.837002|GPS_ALT:399.1",
+]
+
+
+def legacy_extract(telemetry, data_str):
+    """Alan tablosundan önceki regex tabanlı alan çıkarma (referans)"""
+    alt_match = re.search(r'ALT:([\d.-]+)m', data_str)
+    if alt_match:
+        telemetry.altitude = float(alt_match.group(1))
+    max_alt_match = re.search(r'maxALT:([\d.-]+)m', data_str)
+    if max_alt_match:
+        telemetry.max_altitude = float(max_alt_match.group(1))
+    dy_match = re.search(r'dY:([\d.-]+)', data_str)
+    if dy_match:
+        telemetry.delta_y = float(dy_match.group(1))
+    f_match = re.search(r'F:([01])', data_str)
+    if f_match:
+        telemetry.fired = f_match.group(1) == '1'
+    p1_match = re.search(r'P1:([01])', data_str)
+    if p1_match:
+        telemetry.p1 = p1_match.group(1) == '1'
+    p2_match = re.search(r'P2:([01])', data_str)
+    if p2_match:
+        telemetry.p2 = p2_match.group(1) == '1'
+    for key, attr in (('gX', 'gyro_x'), ('gY', 'gyro_y'), ('gZ', 'gyro_z'),
+                      ('aX', 'accel_x'), ('aY', 'accel_y'), ('aZ', 'accel_z'),
+                      ('pitch', 'pitch')):
+        match = re.search(key + r':([\d.-]+)', data_str)
+        if match:
+            setattr(telemetry, attr, float(match.group(1)))
+    if 'GPS:invalid' in data_str:
+        telemetry.gps_valid = False
+        telemetry.gps_altitude = 0.0
+        telemetry.gps_latitude = 0.0
+        telemetry.gps_longitude = 0.0
+    else:
+        gps_match = re.search(r'GPS:([\d.-]+),([\d.-]+)', data_str)
+        if gps_match:
+            telemetry.gps_latitude = float(gps_match.group(1))
+            telemetry.gps_longitude = float(gps_match.group(2))
+            telemetry.gps_valid = True
+            alt_gps_match = re.search(r'GPS_ALT:([\d.-]+)', data_str)
+            if alt_gps_match:
+                telemetry.gps_altitude = float(alt_gps_match.group(1))
+
+
+class LegacyStation:
+    """Eski parser'ın yerinde değiştirdiği telemetri nesnesi"""
+
+    def __init__(self):
+        self.telemetry = SimpleNamespace(**asdict(TelemetryData()))
+
+    def add_log(self, message):
+        pass
+
+
+def legacy_parse_lora_data(station, data_str):
+    """Alan tablosundan önceki parse_lora_data (referans)"""
+    telemetry = station.telemetry
+    station.add_log(f"📡 Raw LoRa: {data_str}")
+    legacy_extract(telemetry, data_str)
+    telemetry.last_update = datetime.now().strftime("%H:%M:%S")
+    telemetry.packet_count += 1
+    gps_status = f"{telemetry.gps_latitude:.6f},{telemetry.gps_longitude:.6f}" if telemetry.gps_valid else "INVALID"
+    parachute_status = f"P1={'AÇIK' if telemetry.p1 else 'KAPALI'}, P2={'AÇIK' if telemetry.p2 else 'KAPALI'}"
+    station.add_log(f"📊 Roket Telemetri: Alt={telemetry.altitude:.1f}m, GPS={gps_status}, Paraşüt={parachute_status}")
+    return True
+
+
+def _quiet_station():
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)  # Sadece parse maliyetini ölç
+    return station
+
+
+def _measure(parse, count):
+    lines = SAMPLE_LINES
+    n = len(lines)
+    start = time.perf_counter()
+    for i in range(count):
+        parse(lines[i % n])
+    return count / (time.perf_counter() - start)
+
+
+def check_equivalence():
+    """Yeni parser'ın eski parser ile aynı telemetriyi ürettiğini doğrula"""
+    for line in SAMPLE_LINES:
+        legacy, table = LegacyStation(), _quiet_station()
+        legacy_parse_lora_data(legacy, line)
+        table.parse_lora_data(line)
+        legacy.telemetry.last_update = table.telemetry.last_update
+        assert vars(legacy.telemetry) == asdict(table.telemetry), line
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    check_equivalence()
+
+    legacy = LegacyStation()
+    table = _quiet_station()
+    results = [
+        ("Alan çıkarma",
+         _measure(lambda line: legacy_extract(legacy.telemetry, line), count),
+         _measure(table.parse_lora_fields, count)),
+        ("parse_lora_data*",
+         _measure(lambda line: legacy_parse_lora_data(legacy, line), count),
+         _measure(table.parse_lora_data, count)),
+    ]
+
+    print(f"Satır sayısı: {count}")
+    print(f"{'Aşama':<18}{'Eski regex':>16}{'Alan tablosu':>16}{'Hızlanma':>10}")
+    for name, legacy_rate, table_rate in results:
+        print(f"{name:<18}{legacy_rate:>12,.0f} s/s{table_rate:>12,.0f} s/s"
+              f"{table_rate / legacy_rate:>9.2f}x")
+    print("* Yeni parse_lora_data ayrıca geçmiş kaydı, snapshot ve SSE yayınını da yapar.")
+
+
+if __name__ == "__main__":
+    main()
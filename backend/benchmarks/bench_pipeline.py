@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Uçtan uca işlem hattı benchmark'ı
+
+Her aşama ayrı ayrı ve tüm hat (seri byte girişi -> HYİ byte çıkışı) ölçülür:
+    parse_lora_data, parse_payload_gps_data, parse_all_liquid_data,
+    create_hyi_packet, /api/telemetry, serial_to_hyi
+
+Her aşama için:
+    throughput     zamanlama olmadan ölçülen mesaj/s
+    p50/p99/p999   mesaj başına gecikme (µs)
+    alloc          tracemalloc ile mesaj başına tepe (geçici) ve kalıcı bellek
+                   (CPython toplam ayırma sayısı vermediğinden byte olarak)
+
+Girdi sentetik (simülatörün uçuş profili) veya --capture ile kayıtlı bir
+uçuş (.etulog) ya da düz metin satır dökümüdür. Sonuçlar --output ile JSON
+olarak kaydedilir, --compare ile önceki bir sonuçla karşılaştırılır.
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_pipeline.py [--count 20000] [--capture kayit.etulog]
+        [--output sonuc.json] [--compare onceki.json] [--flight-rate 20]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main_system  # noqa: E402
+from flight_recorder import CHANNEL_LORA, CHANNEL_PAYLOAD  # noqa: E402
+from main_system import TEKNOFESTGroundStation, app, ground_station  # noqa: E402
+from replay import load_events  # noqa: E402
+from simulator import FlightProfile, liquid_frame, nmea_gpgga, payload_lines, rocket_line  # noqa: E402
+from station_log import OFF  # noqa: E402
+
+
+class NullPort:
+    """HYİ çıkışı için yazılan byte'ları sayan sahte port"""
+
+    is_open = True
+
+    def __init__(self):
+        self.bytes_written = 0
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        return len(data)
+
+
+def _station():
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)
+    station.running = True
+    return station
+
+
+def synthetic_inputs(count: int, seed: int = 1) -> dict:
+    """Uçuş profilinden satırlar (tüm uçuş boyunca eşit aralıklı)"""
+    profile = FlightProfile(seed=seed)
+    step = profile.duration / count
+    lora, payload, nmea, liquid = [], [], [], []
+    for index in range(count):
+        t = index * step
+        state = profile.state(t)
+        lora.append(rocket_line(state))
+        payload.extend(payload_lines(state).splitlines())
+        nmea.append(nmea_gpgga(state, t))
+        liquid.append(liquid_frame(t))
+    return {
+        'lora': [line.decode().strip() for line in lora],
+        'payload': [line.decode().strip() for line in payload + nmea],
+        'liquid': [line.decode().strip() for line in liquid],
+        'lora_chunks': lora,
+    }
+
+
+def recorded_inputs(path: str) -> dict:
+    """Kayıtlı uçuştan satırlar; LoRa ham chunk'ları uçtan uca aşama için korunur"""
+    lora, payload, chunks = [], [], []
+    buffers = {CHANNEL_LORA: b'', CHANNEL_PAYLOAD: b''}
+    for channel, _, data in load_events(path):
+        if channel not in buffers:
+            continue
+        if channel == CHANNEL_LORA:
+            chunks.append(bytes(data))
+        *lines, buffers[channel] = (buffers[channel] + bytes(data)).replace(b'\r', b'\n').split(b'\n')
+        target = lora if channel == CHANNEL_LORA else payload
+        target.extend(line.decode('utf-8', 'ignore').strip() for line in lines if line.strip())
+    liquid = [line for line in payload if 'ALL=' in line or 'ALL:' in line]
+    return {'lora': lora, 'payload': payload, 'liquid': liquid, 'lora_chunks': chunks}
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_stage(func, inputs, count: int, warmup: int = 200) -> dict:
+    """func(input) çağrısını ölç; girdiler count'a ulaşana kadar döngüyle kullanılır"""
+    size = len(inputs)
+    items = [inputs[index % size] for index in range(count)]
+    for item in items[:warmup]:
+        func(item)
+
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    throughput = count / (time.perf_counter() - start)
+
+    clock = time.perf_counter_ns
+    latencies = []
+    record = latencies.append
+    for item in items:
+        before = clock()
+        func(item)
+        record(clock() - before)
+    latencies.sort()
+
+    sample = items[:min(count, 2000)]
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for item in sample:
+        func(item)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'count': count,
+        'throughput_per_s': round(throughput, 1),
+        'p50_us': round(_percentile(latencies, 0.50) / 1000, 3),
+        'p99_us': round(_percentile(latencies, 0.99) / 1000, 3),
+        'p999_us': round(_percentile(latencies, 0.999) / 1000, 3),
+        'max_us': round(latencies[-1] / 1000, 3),
+        'alloc_peak_bytes': peak - baseline,
+        'alloc_retained_bytes_per_msg': round((current - baseline) / len(sample), 1),
+    }
+
+
+def build_stages(inputs: dict) -> dict:
+    """Aşama adı -> (fonksiyon, girdiler)"""
+    lora_station = _station()
+    payload_station = _station()
+    liquid_station = _station()
+    hyi_station = _station()
+    for line in inputs['lora'][:50]:
+        hyi_station.parse_lora_data(line)
+
+    def api_telemetry(_):
+        with app.test_request_context('/api/telemetry'):
+            return main_system.api_telemetry()
+
+    def api_telemetry_new_sample(altitude):
+        ground_station.update_telemetry({'altitude': altitude})
+        return api_telemetry(None)
+
+    # Seri byte'lar -> parse -> snapshot -> HYİ paketi -> port yazımı
+    pipeline_station = _station()
+    pipeline_station.hyi_connection = NullPort()
+    handle = pipeline_station.handle_lora_chunk
+    transmit = pipeline_station.transmit_hyi
+
+    def serial_to_hyi(chunk):
+        handle(chunk)
+        transmit()
+
+    return {
+        'parse_lora_data': (lora_station.parse_lora_data, inputs['lora']),
+        'parse_payload_gps_data': (payload_station.parse_payload_gps_data, inputs['payload']),
+        'parse_all_liquid_data': (liquid_station.parse_all_liquid_data, inputs['liquid']),
+        'create_hyi_packet': (lambda telemetry: hyi_station.create_hyi_packet(telemetry), [hyi_station.telemetry]),
+        'api_telemetry': (api_telemetry, [None]),
+        'api_telemetry_new_sample': (api_telemetry_new_sample, [float(index) for index in range(1000)]),
+        'serial_to_hyi': (serial_to_hyi, inputs['lora_chunks']),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def compare(results: dict, baseline: dict):
+    print(f"\nKarşılaştırma ({baseline['meta'].get('commit')} -> {results['meta'].get('commit')}):")
+    print(f"{'Aşama':<28}{'Throughput':>12}{'p99':>10}")
+    for name, stage in results['stages'].items():
+        old = baseline['stages'].get(name)
+        if not old:
+            continue
+        print(f"{name:<28}{stage['throughput_per_s'] / old['throughput_per_s']:>11.2f}x"
+              f"{stage['p99_us'] / old['p99_us'] if old['p99_us'] else 0:>9.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uçtan uca işlem hattı benchmark'ı")
+    parser.add_argument('--count', type=int, default=20000, help="Aşama başına mesaj sayısı")
+    parser.add_argument('--capture', help="Kayıtlı uçuş (.etulog) veya metin dökümü")
+    parser.add_argument('--stages', help="Virgülle ayrılmış aşama listesi (varsayılan: tümü)")
+    parser.add_argument('--flight-rate', type=float, default=20.0, help="Uçuş bilgisayarının gönderim hızı (Hz)")
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--compare', help="Karşılaştırılacak önceki sonuç JSON dosyası")
+    args = parser.parse_args(argv)
+
+    ground_station.log.set_level(OFF)
+    inputs = recorded_inputs(args.capture) if args.capture else synthetic_inputs(min(args.count, 5000))
+    stages = build_stages(inputs)
+    selected = args.stages.split(',') if args.stages else list(stages)
+    unknown = [name for name in selected if name not in stages]
+    if unknown:
+        parser.error(f"Bilinmeyen aşama: {', '.join(unknown)}")
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'input': args.capture or 'synthetic',
+            'count': args.count,
+        },
+        'stages': {},
+    }
+    print(f"{'Aşama':<28}{'msg/s':>12}{'p50 µs':>10}{'p99 µs':>10}{'p999 µs':>10}{'tepe B':>10}")
+    for name in selected:
+        func, stage_inputs = stages[name]
+        if not stage_inputs:
+            print(f"{name:<28}{'(girdi yok)':>12}")
+            continue
+        stage = run_stage(func, stage_inputs, args.count)
+        results['stages'][name] = stage
+        print(f"{name:<28}{stage['throughput_per_s']:>12,.0f}{stage['p50_us']:>10.1f}{stage['p99_us']:>10.1f}"
+              f"{stage['p999_us']:>10.1f}{stage['alloc_peak_bytes']:>10,}")
+
+    pipeline = results['stages'].get('serial_to_hyi')
+    if pipeline:
+        headroom = pipeline['throughput_per_s'] / args.flight_rate
+        results['headroom'] = {
+            'flight_rate_hz': args.flight_rate,
+            'max_rate_hz': pipeline['throughput_per_s'],
+            'factor': round(headroom, 1),
+        }
+        print(f"\nUçtan uca kapasite: {pipeline['throughput_per_s']:,.0f} mesaj/s "
+              f"= {args.flight_rate:g} Hz uçuş hızının {headroom:,.0f} katı (tek çekirdek, seri port hariç)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Sonuçlar: {args.output}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Log çağrısı maliyeti: eski add_log (strftime + print + Queue) vs. StationLogger
+
+Ölçülen süre çağıran (parser) thread'inin ödediği süredir; StationLogger'da
+formatlama ve yazma arka plan thread'inde yapılır. Konsol çıktısı /dev/null'a
+yönlendirilir.
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_station_log.py [çağrı_sayısı]
+"""
+
+import contextlib
+import os
+import queue
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from station_log import INFO, ApiSink, ConsoleSink, StationLogger  # noqa: E402
+
+LINE = "PAYLOAD_GPS fix 39.925101,32.837002 alt:399.1 gX(0.4) gY(0.2) gZ(-0.1)"
+
+
+class LegacyLog:
+    """StationLogger'dan önceki add_log (referans)"""
+
+    def __init__(self):
+        self.log_queue = queue.Queue(maxsize=100)
+
+    def add_log(self, message):
+        try:
+            timestamp = datetime.now().strftime('%H:%M:%S')
+            log_entry = f"[{timestamp}] {message}"
+            self.log_queue.put(log_entry, block=False)
+            print(log_entry)
+        except queue.Full:
+            try:
+                for _ in range(10):
+                    self.log_queue.get_nowait()
+                self.log_queue.put(f"[{timestamp}] {message}", block=False)
+            except queue.Empty:
+                pass
+
+
+def _measure(call, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        call()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    legacy = LegacyLog()
+    log = StationLogger(level=INFO, capacity=count + 1, rate_limits={})
+    log.add_sink(ConsoleSink())
+    log.add_sink(ApiSink())
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        rows = [
+            ("add_log (eski)", _measure(lambda: legacy.add_log(f"🛰️ Payload Line: {LINE}"), count)),
+            ("log.info (kuyruğa ekle)", _measure(lambda: log.info('payload', "🛰️ Payload Line: %s", LINE), count)),
+            ("log.debug (kapalı)", _measure(lambda: log.debug('payload', "🛰️ Payload Line: %s", LINE), count)),
+        ]
+        log.start()
+        start = time.perf_counter()
+        log.flush(timeout=60)
+        drain = time.perf_counter() - start
+
+    print(f"Çağrı sayısı: {count}")
+    print(f"{'Çağrı':<28}{'µs/çağrı':>12}")
+    for name, micros in rows:
+        print(f"{name:<28}{micros:>12.3f}")
+    print(f"Arka plan yazıcısı {count} kaydı {drain:.2f} s'de yazdı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Metrik maliyeti: sıcak yoldaki güncelleme ve /metrics çıktısı
+
+Sayaç artırma ve histogram gözlemi parser thread'inin ödediği süredir;
+uçuş boyunca açık kalabilmesi için satır başına parse süresinin (~100 µs)
+yanında ihmal edilebilir olmalıdır. Ayrıca gerçek parser ile metrikli ve
+metriksiz satır başına süre karşılaştırılır.
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_station_metrics.py [çağrı_sayısı]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main_system import TEKNOFESTGroundStation  # noqa: E402
+from station_log import OFF  # noqa: E402
+from simulator import FlightProfile, rocket_line  # noqa: E402
+from station_metrics import MetricsRegistry  # noqa: E402
+
+LINE = rocket_line(FlightProfile().state(10.0))
+
+
+class NullHistogram:
+    """Metrikler kapalıymış gibi ölçüm için"""
+
+    def observe(self, value):
+        pass
+
+
+class NullCounter:
+    def inc(self, amount=1):
+        pass
+
+
+def _measure(call, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        call()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def _station(instrumented: bool):
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)
+    station.running = True
+    if not instrumented:
+        link = station.lora_link
+        link.text_parse_time = NullHistogram()
+        link.parsed = link.rejected = NullCounter()
+        for stats in station.latency.values():
+            stats.histogram = None
+    return station
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    registry = MetricsRegistry()
+    counter = registry.counter('bench_total', "bench")
+    histogram = registry.histogram('bench_seconds', "bench")
+    family = registry.counter_family('bench_labeled_total', "bench")
+
+    rows = [
+        ("counter.inc", _measure(counter.inc, count)),
+        ("histogram.observe", _measure(lambda: histogram.observe(0.000123), count)),
+        ("family.labels(...).inc", _measure(lambda: family.labels(port='lora', format='text').inc(), count)),
+    ]
+
+    # Gürültüyü azaltmak için iki durum dönüşümlü ölçülür, en iyisi alınır
+    lines = max(count // 10, 1000)
+    stations = {False: _station(False), True: _station(True)}
+    best = {False: float('inf'), True: float('inf')}
+    for _ in range(5):
+        for instrumented, station in stations.items():
+            best[instrumented] = min(best[instrumented], _measure(lambda: station.handle_lora_chunk(LINE), lines))
+    rows.append(("LoRa satırı (metriksiz)", best[False]))
+    rows.append(("LoRa satırı (metrikli)", best[True]))
+
+    station = _station(True)
+    for _ in range(1000):
+        station.handle_lora_chunk(LINE)
+    render = _measure(station.metrics.render_prometheus, 200)
+
+    print(f"Çağrı sayısı: {count}")
+    print(f"{'Çağrı':<28}{'µs/çağrı':>12}")
+    for name, micros in rows:
+        print(f"{name:<28}{micros:>12.3f}")
+    print(f"/metrics çıktısı: {render:.1f} µs ({len(station.metrics.render_prometheus())} byte)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Kalıcı uçuş veritabanı (sütun bazlı, oturum başına bir dizin)
+
+Her oturum flights/<ad>/ altında tablo başına bir dosyadır:
+
+    rocket.etudb    roket telemetrisi (her LoRa örneği)
+    payload.etudb   görev yükü GPS / gyro örnekleri
+    stage.etudb     kademe GPS örnekleri
+    liquid.etudb    sıvı seviye çerçeveleri (24 byte)
+    hyi.etudb       hakeme gönderilen HYİ paketleri (78 byte)
+
+Dosya düzeni (Arrow/Parquet'teki kayıt grupları gibi):
+
+    [magic 'ETUFDB01'][şema uzunluğu u32][şema JSON]
+    tekrar: [batch başlığı: 'BTCH', satır u32, gövde u32, crc32 u32][gövde]
+
+Şema sütun adlarını ve tiplerini tutar: 'd' float64, 'q' int64, 'B' uint8
+(bool), 'Ns' N byte'lık sabit genişlikli ikili. Gövdede her sütun ardışık
+bir dizi olarak yer alır (ilk sütun Unix zamanı); bir sütunu okumak için
+yalnızca o sütunun byte aralığı çözülür.
+
+record() alıcı thread'lerinden çağrılır ve bloklamaz; satırlar bellekte
+biriktirilir ve yazıcı thread'i flush_interval saniyede bir (veya batch_rows
+dolunca) her tablonun bekleyenlerini tek batch olarak yazar. Batch (başlık +
+gövde) tek write ile yazılır; yazma hatasında dosya batch'ten önceki boyuna
+kesilir ve satırlar kuyruğa geri konur (flight_recorder ile aynı politika).
+Okuma ve dışa aktarma batch batch ilerler; uçuşun tamamı belleğe alınmaz.
+"""
+
+import csv
+import io
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+from datetime import datetime
+from operator import attrgetter
+from zlib import crc32
+
+from flight_recorder import write_all
+
+FILE_MAGIC = b'ETUFDB01'
+SCHEMA_LENGTH = struct.Struct('<I')
+BATCH_MAGIC = b'BTCH'
+BATCH_HEADER = struct.Struct('<4sIII')
+TABLE_EXTENSION = '.etudb'
+TIME_COLUMN = 'time'
+
+
+def column_type(default) -> str:
+    """TelemetryData alanının varsayılan değerinden sütun tipi"""
+    if isinstance(default, bool):
+        return 'B'
+    if isinstance(default, int):
+        return 'q'
+    if isinstance(default, float):
+        return 'd'
+    if isinstance(default, bytes):
+        return f'{len(default)}s'
+    raise TypeError(f"Desteklenmeyen sütun tipi: {type(default).__name__}")
+
+
+def column_width(kind: str) -> int:
+    return int(kind[:-1]) if kind.endswith('s') else array(kind).itemsize
+
+
+class Table:
+    """Bir tablonun şeması ve bekleyen satırları
+
+    getter, record()'a verilen kaynaktan (telemetri nesnesi, sıvı çerçevesi,
+    HYİ paketi) sütun değerlerini tuple olarak çıkarır.
+    """
+
+    def __init__(self, name: str, columns, getter=None):
+        self.name = name
+        self.columns = tuple(columns)  # (ad, tip), zaman sütunu hariç
+        if getter is None:
+            getter = attrgetter(*(column for column, _ in self.columns))
+            if len(self.columns) == 1:
+                getter = (lambda get: lambda source: (get(source),))(getter)
+        self.getter = getter
+        self.pending = deque()
+        self.file = None
+        self.path = None
+        self.rows = 0
+        self.batches = 0
+        self.bytes_written = 0
+
+    def schema(self) -> dict:
+        return {
+            'table': self.name,
+            'byteorder': sys.byteorder,
+            'columns': [{'name': TIME_COLUMN, 'type': 'd'}] +
+                       [{'name': name, 'type': kind} for name, kind in self.columns],
+        }
+
+
+def telemetry_table(name: str, telemetry_fields, field_names) -> Table:
+    """TelemetryData alanlarından (dataclasses.fields) tablo oluştur"""
+    defaults = {field.name: field.default for field in telemetry_fields}
+    return Table(name, [(field, column_type(defaults[field])) for field in field_names])
+
+
+def encode_batch(kinds, columns) -> bytes:
+    """Sütun listelerini (aynı uzunlukta) batch gövdesine çevir"""
+    body = bytearray()
+    for kind, values in zip(kinds, columns):
+        if kind.endswith('s'):
+            body += b''.join(values)
+        else:
+            body += array(kind, values).tobytes()
+    return bytes(body)
+
+
+def decode_batch(schema: dict, rows: int, body, fields=None) -> dict:
+    """Batch gövdesinden istenen sütunları (ad -> liste) çöz"""
+    swap = schema['byteorder'] != sys.byteorder
+    result = {}
+    offset = 0
+    for column in schema['columns']:
+        name, kind = column['name'], column['type']
+        size = column_width(kind) * rows
+        if fields is None or name in fields:
+            chunk = body[offset:offset + size]
+            if kind.endswith('s'):
+                width = column_width(kind)
+                result[name] = [bytes(chunk[i:i + width]) for i in range(0, size, width)]
+            else:
+                values = array(kind)
+                values.frombytes(chunk)
+                if swap:
+                    values.byteswap()
+                result[name] = values.tolist()
+        offset += size
+    return result
+
+
+def read_schema(f) -> dict:
+    if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+        raise ValueError(f"Geçersiz uçuş tablosu: {f.name}")
+    length, = SCHEMA_LENGTH.unpack(f.read(SCHEMA_LENGTH.size))
+    return json.loads(f.read(length))
+
+
+def read_batches(path: str, fields=None):
+    """(şema, satır sayısı, sütunlar) üret; yarım kalmış veya CRC'si tutmayan batch'te durur
+
+    Dosya yazılırken de okunabilir: henüz tamamlanmamış son batch atlanır.
+    """
+    with open(path, 'rb') as f:
+        schema = read_schema(f)
+        if fields is not None:
+            known = {column['name'] for column in schema['columns']}
+            unknown = [name for name in fields if name not in known]
+            if unknown:
+                raise KeyError(', '.join(unknown))
+            fields = set(fields) | {TIME_COLUMN}
+        while True:
+            header = f.read(BATCH_HEADER.size)
+            if len(header) < BATCH_HEADER.size:
+                return
+            magic, rows, length, checksum = BATCH_HEADER.unpack(header)
+            if magic != BATCH_MAGIC:
+                return
+            body = f.read(length)
+            if len(body) < length or crc32(body) != checksum:
+                return
+            yield schema, rows, decode_batch(schema, rows, body, fields)
+
+
+def _binary_columns(schema: dict) -> set:
+    return {column['name'] for column in schema['columns'] if column['type'].endswith('s')}
+
+
+def _columns(schema: dict, fields=None) -> list:
+    names = [column['name'] for column in schema['columns']]
+    if fields is None:
+        return names
+    return [TIME_COLUMN] + [name for name in names if name in fields and name != TIME_COLUMN]
+
+
+def _text_value(value):
+    return value.hex() if isinstance(value, bytes) else value
+
+
+def export_csv(path: str, fields=None):
+    """Tabloyu CSV olarak batch batch üret (başlık satırı dahil)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    names = None
+    for schema, _, data in read_batches(path, fields):
+        if names is None:
+            names = _columns(schema, fields)
+            binary = _binary_columns(schema)
+            writer.writerow(names)
+        writer.writerows(zip(*([value.hex() for value in data[name]] if name in binary else data[name]
+                               for name in names)))
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if names is None:
+        # Boş tablo: yalnızca başlık
+        with open(path, 'rb') as f:
+            writer.writerow(_columns(read_schema(f), fields))
+        yield buffer.getvalue().encode()
+
+
+def export_jsonl(path: str, fields=None):
+    """Tabloyu satır başına bir JSON nesnesi olarak batch batch üret"""
+    dumps = json.dumps
+    for schema, _, data in read_batches(path, fields):
+        names = _columns(schema, fields)
+        columns = [data[name] for name in names]
+        lines = [dumps(dict(zip(names, map(_text_value, row))), separators=(',', ':')) for row in zip(*columns)]
+        if lines:
+            yield ('\n'.join(lines) + '\n').encode()
+
+
+def export_columnar(path: str, fields=None, chunk_size: int = 64 * 1024):
+    """Tabloyu aynı sütun bazlı formatta üret
+
+    Alan seçilmezse dosya olduğu gibi (tamamlanmış batch'lere kadar) parça parça
+    gönderilir, seçilirse yalnızca o sütunlarla yeniden paketlenir.
+    """
+    if fields is None:
+        yield from _complete_batches(path, chunk_size)
+        return
+    header_written = False
+    for schema, rows, data in read_batches(path, fields):
+        names = _columns(schema, fields)
+        if not header_written:
+            subset = dict(schema, byteorder=sys.byteorder,
+                          columns=[column for column in schema['columns'] if column['name'] in names])
+            yield _file_header(subset)
+            header_written = True
+        kinds = [column['type'] for column in subset['columns']]
+        body = encode_batch(kinds, [data[column['name']] for column in subset['columns']])
+        yield BATCH_HEADER.pack(BATCH_MAGIC, rows, len(body), crc32(body)) + body
+    if not header_written:
+        with open(path, 'rb') as f:
+            schema = read_schema(f)
+        names = _columns(schema, fields)
+        yield _file_header(dict(schema, columns=[column for column in schema['columns'] if column['name'] in names]))
+
+
+def _complete_batches(path: str, chunk_size: int):
+    """Dosyayı başlıktan son tamamlanmış batch'in sonuna kadar parça parça üret"""
+    with open(path, 'rb') as f:
+        read_schema(f)
+        end = f.tell()
+        while True:
+            header = f.read(BATCH_HEADER.size)
+            if len(header) < BATCH_HEADER.size:
+                break
+            magic, _, length, _ = BATCH_HEADER.unpack(header)
+            if magic != BATCH_MAGIC or f.seek(length, os.SEEK_CUR) > os.fstat(f.fileno()).st_size:
+                break
+            end = f.tell()
+        f.seek(0)
+        remaining = end
+        while remaining:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _file_header(schema: dict) -> bytes:
+    encoded = json.dumps(schema, separators=(',', ':')).encode()
+    return FILE_MAGIC + SCHEMA_LENGTH.pack(len(encoded)) + encoded
+
+
+EXPORTERS = {'csv': export_csv, 'jsonl': export_jsonl, 'etudb': export_columnar}
+
+
+class FlightDatabase:
+    """Oturumun tüm tablolarını arka planda batch'ler halinde diske yazan veritabanı
+
+    Disk geride kalırsa bellekte en fazla max_pending satır tutulur, fazlası
+    atılıp sayılır (FlightRecorder ile aynı politika). Yazma hataları
+    on_error(exception) ile bildirilir (istasyon log'u).
+    """
+
+    def __init__(self, directory: str, tables, flush_interval: float = 1.0, batch_rows: int = 4096,
+                 max_pending: int = 1_000_000, on_error=None):
+        self.directory = directory
+        self.on_error = on_error
+        self.tables = {table.name: table for table in tables}
+        self.flush_interval = flush_interval
+        self.batch_rows = batch_rows
+        self.max_pending = max_pending
+        self.path = None
+        self.epoch_offset = time.time() - time.monotonic()
+        self.pending_rows = 0
+        self.dropped_rows = 0
+        self.write_errors = 0
+        self.flush_last = 0.0
+        self.flush_max = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self.thread = None
+
+    def open(self, name: str = None) -> str:
+        """Oturum dizinini ve tablo dosyalarını oluştur, yazıcıyı başlat"""
+        if name is None:
+            name = datetime.now().strftime('flight_%Y%m%d_%H%M%S')
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, name)
+        suffix = 1
+        while os.path.exists(path):
+            path = os.path.join(self.directory, f"{name}_{suffix}")
+            suffix += 1
+        os.makedirs(path)
+        for table in self.tables.values():
+            table.path = os.path.join(path, table.name + TABLE_EXTENSION)
+            # Tamponsuz: hatada tamponda yarım batch kalmaz
+            table.file = open(table.path, 'xb', buffering=0)
+            write_all(table.file, _file_header(table.schema()))
+        self.path = path
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._loop, name="flight-db")
+        self.thread.daemon = True
+        self.thread.start()
+        return path
+
+    @property
+    def name(self):
+        return os.path.basename(self.path) if self.path else None
+
+    def record(self, table: str, source, timestamp: float = None):
+        """Kaynaktan bir satır ekle (alıcı thread'lerinden, bloklamaz)"""
+        if self.path is None:
+            return
+        target = self.tables[table]
+        row = target.getter(source)
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self._lock:
+            if self.pending_rows >= self.max_pending:
+                self.dropped_rows += 1
+                return
+            target.pending.append((timestamp + self.epoch_offset,) + row)
+            self.pending_rows += 1
+            full = len(target.pending) >= self.batch_rows
+        if full:
+            self._wake.set()
+
+    def close(self):
+        """Bekleyen satırları yaz ve dosyaları kapat"""
+        if self.path is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        if self.thread:
+            self.thread.join(timeout=5)
+        try:
+            self._flush()
+        except Exception as e:
+            self._report(e)
+        for table in self.tables.values():
+            table.file.close()
+            table.file = None
+        self.path = None
+
+    def _flush(self):
+        """Her tablonun bekleyen satırlarını tek batch olarak yaz
+
+        Bir tablodaki hata diğerlerini durdurmaz; ilk hata en sonda yükseltilir.
+        """
+        start = time.perf_counter()
+        error = None
+        for table in self.tables.values():
+            try:
+                self._write_batch(table)
+            except Exception as e:
+                error = error or e
+        elapsed = time.perf_counter() - start
+        self.flush_last = elapsed
+        if elapsed > self.flush_max:
+            self.flush_max = elapsed
+        if error is not None:
+            raise error
+
+    def _write_batch(self, table: Table):
+        pending = table.pending
+        rows = []
+        while pending:
+            try:
+                rows.append(pending.popleft())
+            except IndexError:
+                break
+        if not rows:
+            return
+        kinds = ('d',) + tuple(kind for _, kind in table.columns)
+        body = encode_batch(kinds, zip(*rows))
+        file = table.file
+        offset = file.tell()
+        try:
+            write_all(file, BATCH_HEADER.pack(BATCH_MAGIC, len(rows), len(body), crc32(body)) + body)
+            os.fsync(file.fileno())
+        except Exception:
+            # Yarım batch sonraki batch'lerin okunmasını engellemesin; satırlar sıranın başına döner
+            try:
+                file.seek(offset)
+                file.truncate(offset)
+            except (OSError, ValueError):
+                pass
+            with self._lock:
+                pending.extendleft(reversed(rows))
+            raise
+        with self._lock:
+            self.pending_rows -= len(rows)
+        table.rows += len(rows)
+        table.batches += 1
+        table.bytes_written += BATCH_HEADER.size + len(body)
+
+    def _report(self, error: Exception):
+        self.write_errors += 1
+        if self.on_error:
+            self.on_error(error)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self._flush()
+            except Exception as e:
+                # Disk hatası alıcıları durdurmamalı; satırlar kuyrukta kalır, sonraki turda yeniden denenir
+                self._report(e)
+                self._stop.wait(1.0)
+
+    def snapshot(self) -> dict:
+        return {
+            'path': self.path,
+            'pending_rows': self.pending_rows,
+            'dropped_rows': self.dropped_rows,
+            'write_errors': self.write_errors,
+            'tables': {name: {'rows': table.rows, 'batches': table.batches, 'bytes_written': table.bytes_written}
+                       for name, table in self.tables.items()},
+            'flush_last_ms': round(self.flush_last * 1000, 3),
+            'flush_max_ms': round(self.flush_max * 1000, 3),
+        }
+
+
+def list_flights(directory: str) -> list:
+    """Kayıtlı oturumları (yeniden eskiye) tablo dosya boyutlarıyla listele"""
+    if not os.path.isdir(directory):
+        return []
+    flights = []
+    for name in sorted(os.listdir(directory), reverse=True):
+        path = os.path.join(directory, name)
+        if not os.path.isdir(path):
+            continue
+        tables = {}
+        for entry in sorted(os.listdir(path)):
+            if entry.endswith(TABLE_EXTENSION):
+                tables[entry[:-len(TABLE_EXTENSION)]] = os.path.getsize(os.path.join(path, entry))
+        flights.append({'name': name, 'tables': tables})
+    return flights
+
+
+def table_path(directory: str, flight: str, table: str) -> str:
+    """Oturum ve tablo adından dosya yolu (dizin dışına çıkan adlar reddedilir)"""
+    if not flight or not table or flight.startswith('.') or table.startswith('.') \
+            or os.path.basename(flight) != flight or os.path.basename(table) != table:
+        raise ValueError("Geçersiz oturum veya tablo adı")
+    path = os.path.join(directory, flight, table + TABLE_EXTENSION)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"{flight}/{table} bulunamadı")
+    return path
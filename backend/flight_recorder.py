@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Ham seri veri kaydedici (uçuş kaydı)
+
+LoRa ve payload portlarından okunan her byte ile HYİ'ye yazılan her paket,
+oturum başına tek bir ek-yalnız (append-only) ikili dosyaya zaman damgasıyla
+kaydedilir. Alıcı thread'leri kısa bir kilit altında yalnızca deque.append yapar; dosyaya yazma,
+chunk'lama ve fsync arka plandaki yazıcı thread'indedir.
+
+Dosya yapısı (little-endian):
+    Başlık   FILE_HEADER: sihirli değer b'ETUFLOG1', sürüm, oturum başlangıcı (unix)
+    Chunk    CHUNK_HEADER: b'CHNK', kayıt sayısı, gövde uzunluğu, CRC32(gövde)
+             gövde: kayıtlar art arda
+    Kayıt    RECORD_HEADER: kanal, zaman damgası (unix, float64), veri uzunluğu + veri
+
+Her chunk (başlık + gövde) tek bir write ile yazılır ve ardından fsync
+yapılır. Elektrik kesintisinde en fazla yazılmakta olan chunk kaybolur; yarım
+kalan son chunk CRC ile tespit edilip okunurken atlanır. Yazma hatasında dosya
+chunk'tan önceki boyuna kesilir ve kayıtlar kuyruğa geri konur, bir sonraki
+turda yeniden yazılır; yarım chunk sonraki chunk'ların okunmasını engellemez.
+"""
+
+import os
+import struct
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from zlib import crc32
+
+FILE_MAGIC = b'ETUFLOG1'
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct('<8sHd')
+CHUNK_MAGIC = b'CHNK'
+CHUNK_HEADER = struct.Struct('<4sIII')
+RECORD_HEADER = struct.Struct('<BdI')
+
+CHANNEL_LORA = 1
+CHANNEL_PAYLOAD = 2
+CHANNEL_HYI = 3
+CHANNEL_LINKS = 16  # Ek linkler (yedek LoRa, kademe GPS) kayıt sırasıyla 16, 17, ... kanallarına yazılır
+CHANNEL_NAMES = {CHANNEL_LORA: 'lora', CHANNEL_PAYLOAD: 'payload', CHANNEL_HYI: 'hyi'}
+
+RECORDING_EXTENSION = '.etulog'
+
+
+def write_all(file, data: bytes):
+    """Tamponsuz dosyaya veriyi eksiksiz yaz (kısa yazımlarda devam et)"""
+    view = memoryview(data)
+    while view:
+        written = file.write(view)
+        if not written:
+            raise OSError("Diske yazılamadı (0 byte)")
+        view = view[written:]
+
+
+class FlightRecorder:
+    """Kanallardan gelen ham byte'ları chunk'lar halinde diske yazan kaydedici
+
+    record() alıcı thread'lerinden çağrılır ve bloklamaz. Yazıcı thread'i
+    chunk_interval saniyede bir (veya chunk_bytes dolunca) bekleyen kayıtları
+    tek bir chunk olarak yazar ve fsync yapar. Disk geride kalırsa bellekte
+    en fazla max_pending byte tutulur, fazlası atılıp sayılır. Yazma hataları
+    on_error(exception) ile bildirilir (istasyon log'u).
+    """
+
+    def __init__(self, directory: str, chunk_interval: float = 1.0, chunk_bytes: int = 64 * 1024,
+                 max_pending: int = 16 * 1024 * 1024, on_error=None):
+        self.directory = directory
+        self.on_error = on_error
+        self.chunk_interval = chunk_interval
+        self.chunk_bytes = chunk_bytes
+        self.max_pending = max_pending
+        self.path = None
+        self.file = None
+        self.pending = deque()
+        self.pending_bytes = 0
+        self.epoch_offset = time.time() - time.monotonic()
+        self.records = 0
+        self.chunks = 0
+        self.write_errors = 0
+        self.bytes_written = 0
+        self.dropped_records = 0
+        self.channel_bytes = {channel: 0 for channel in CHANNEL_NAMES}
+        self.fsync_last = 0.0
+        self.fsync_max = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self.thread = None
+
+    def open(self, name: str = None) -> str:
+        """Yeni oturum dosyasını oluştur ve yazıcıyı başlat"""
+        os.makedirs(self.directory, exist_ok=True)
+        if name is None:
+            name = datetime.now().strftime('flight_%Y%m%d_%H%M%S')
+        path = os.path.join(self.directory, name + RECORDING_EXTENSION)
+        suffix = 1
+        while os.path.exists(path):
+            path = os.path.join(self.directory, f"{name}_{suffix}{RECORDING_EXTENSION}")
+            suffix += 1
+        # 'x': aynı dosyaya iki oturum asla yazmaz; tamponsuz: hatada tamponda yarım chunk kalmaz
+        self.file = open(path, 'xb', buffering=0)
+        write_all(self.file, FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, time.time()))
+        self._sync()
+        self.path = path
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._loop, name="flight-recorder")
+        self.thread.daemon = True
+        self.thread.start()
+        return path
+
+    def record(self, channel: int, data, received_at: float = None):
+        """Ham byte'ları kayda ekle (alıcı thread'lerinden, bloklamaz)"""
+        if self.file is None:
+            return
+        if received_at is None:
+            received_at = time.monotonic()
+        size = len(data)
+        # Birden fazla alıcı thread'i yazar; kilit yalnızca sayaç ve append'i kapsar
+        with self._lock:
+            if self.pending_bytes + size > self.max_pending:
+                self.dropped_records += 1
+                return
+            self.pending.append((channel, received_at + self.epoch_offset, bytes(data)))
+            self.pending_bytes += size
+            full = self.pending_bytes >= self.chunk_bytes
+        if full:
+            self._wake.set()
+
+    def close(self):
+        """Bekleyen kayıtları yaz ve dosyayı kapat"""
+        if self.file is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        if self.thread:
+            self.thread.join(timeout=5)
+        try:
+            self._write_chunk()
+        except Exception as e:
+            self._report(e)
+        self.file.close()
+        self.file = None
+
+    def _sync(self):
+        start = time.perf_counter()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        elapsed = time.perf_counter() - start
+        self.fsync_last = elapsed
+        if elapsed > self.fsync_max:
+            self.fsync_max = elapsed
+
+    def _write_chunk(self):
+        """Bekleyen kayıtları tek chunk olarak yaz; hata olursa kayıtları geri koy ve hatayı yükselt"""
+        pending = self.pending
+        if not pending:
+            return
+        records = []
+        body = bytearray()
+        data_bytes = 0
+        pack = RECORD_HEADER.pack
+        while pending:
+            try:
+                record = pending.popleft()
+            except IndexError:
+                break
+            channel, timestamp, data = record
+            records.append(record)
+            body += pack(channel, timestamp, len(data))
+            body += data
+            data_bytes += len(data)
+
+        file = self.file
+        offset = file.tell()
+        try:
+            write_all(file, CHUNK_HEADER.pack(CHUNK_MAGIC, len(records), len(body), crc32(body)) + body)
+            self._sync()
+        except Exception:
+            # Yarım chunk dosyada kalmasın; kayıtlar sıranın başına geri döner
+            try:
+                file.seek(offset)
+                file.truncate(offset)
+            except (OSError, ValueError):
+                pass
+            with self._lock:
+                pending.extendleft(reversed(records))
+            raise
+
+        with self._lock:
+            self.pending_bytes -= data_bytes
+        channel_bytes = self.channel_bytes
+        for channel, _, data in records:
+            channel_bytes[channel] = channel_bytes.get(channel, 0) + len(data)
+        self.records += len(records)
+        self.chunks += 1
+        self.bytes_written += CHUNK_HEADER.size + len(body)
+
+    def _report(self, error: Exception):
+        self.write_errors += 1
+        if self.on_error:
+            self.on_error(error)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.chunk_interval)
+            self._wake.clear()
+            try:
+                self._write_chunk()
+            except Exception as e:
+                # Disk hatası alıcıları durdurmamalı; kayıtlar kuyrukta kalır, sonraki turda yeniden denenir
+                self._report(e)
+                self._stop.wait(1.0)
+
+    def snapshot(self) -> dict:
+        return {
+            'path': self.path,
+            'recording': self.file is not None,
+            'records': self.records,
+            'chunks': self.chunks,
+            'bytes_written': self.bytes_written,
+            'pending_bytes': self.pending_bytes,
+            'dropped_records': self.dropped_records,
+            'write_errors': self.write_errors,
+            'channel_bytes': {CHANNEL_NAMES.get(channel, channel): size for channel, size in self.channel_bytes.items()},
+            'fsync_last_ms': round(self.fsync_last * 1000, 3),
+            'fsync_max_ms': round(self.fsync_max * 1000, 3),
+        }
+
+
+def read_recording(path: str):
+    """Kayıt dosyasındaki (kanal, unix_zaman, veri) kayıtlarını sırayla üret
+
+    Yarım kalmış veya CRC'si tutmayan chunk'ta okuma durur (kesinti anı).
+    """
+    with open(path, 'rb') as f:
+        header = f.read(FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size:
+            raise ValueError(f"Geçersiz kayıt dosyası: {path}")
+        magic, version, _ = FILE_HEADER.unpack(header)
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            raise ValueError(f"Desteklenmeyen kayıt dosyası: {path}")
+        while True:
+            chunk_header = f.read(CHUNK_HEADER.size)
+            if len(chunk_header) < CHUNK_HEADER.size:
+                return
+            magic, count, length, checksum = CHUNK_HEADER.unpack(chunk_header)
+            body = f.read(length)
+            if magic != CHUNK_MAGIC or len(body) < length or crc32(body) != checksum:
+                return
+            offset = 0
+            for _ in range(count):
+                channel, timestamp, size = RECORD_HEADER.unpack_from(body, offset)
+                offset += RECORD_HEADER.size
+                yield channel, timestamp, body[offset:offset + size]
+                offset += size
+
+
+def recording_info(path: str) -> dict:
+    """Kayıt dosyasının özet bilgisi"""
+    with open(path, 'rb') as f:
+        _, version, started = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+    records = 0
+    channel_bytes = {}
+    first = last = None
+    for channel, timestamp, data in read_recording(path):
+        records += 1
+        name = CHANNEL_NAMES.get(channel, channel)
+        channel_bytes[name] = channel_bytes.get(name, 0) + len(data)
+        if first is None:
+            first = timestamp
+        last = timestamp
+    return {
+        'path': path,
+        'version': version,
+        'started': started,
+        'records': records,
+        'duration': (last - first) if records else 0.0,
+        'channel_bytes': channel_bytes,
+    }
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""HYİ (Hakem Yer İstasyonu) paket formatı
+
+Paket yapısı (78 byte, little-endian):
+    1-4    Header 0xFF 0xFF 0x54 0x52
+    5      Takım ID
+    6      Paket sayacı
+    7-74   17 float: irtifa, roket GPS (irtifa, enlem, boylam),
+           görev yükü GPS (irtifa, enlem, boylam), kademe GPS (irtifa, enlem, boylam),
+           jiroskop X/Y/Z, ivme X/Y/Z, açı
+    75     Durum (paraşüt)
+    76     CheckSum - Byte 5'ten Byte 75'e kadar toplam mod 256
+    77-78  Footer 0x0D 0x0A
+
+Tüm düzen tek bir önceden derlenmiş struct.Struct ile tanımlıdır; paket her
+seferinde yeniden ayrılan bir bytearray yerine aynı tampona pack_into ile yazılır.
+CheckSum artımlı tutulur: float alanları ve durum byte'ı (HYI_BODY) yalnızca
+telemetri snapshot'ı değiştiğinde paketlenip toplanır, aynı snapshot yeniden
+gönderilirken yalnızca takım ID ve sayaç byte'ları eklenir.
+"""
+
+import struct
+
+HYI_HEADER = b'\xFF\xFF\x54\x52'
+HYI_FOOTER = b'\x0D\x0A'
+HYI_PACKET = struct.Struct('<4sBB17fBB2s')
+HYI_PACKET_SIZE = HYI_PACKET.size  # 78
+
+# HYI_PACKET içindeki telemetri gövdesi: 17 float + durum (byte 7-75)
+HYI_BODY = struct.Struct('<17fB')
+BODY_START = 6
+BODY_END = BODY_START + HYI_BODY.size
+
+# CheckSum'a dahil olan aralık (0 tabanlı, byte 5-75)
+CHECKSUM_START = 4
+CHECKSUM_END = 75
+
+# Durum byte'ı: [P1][P2]
+HYI_STATUS = (
+    (1, 3),  # Hiçbir paraşüt / sadece ikincil paraşüt tetiklendi
+    (2, 4),  # Sadece birincil / her iki paraşüt de tetiklendi
+)
+
+
+def hyi_status(p1, p2) -> int:
+    """P1 ve P2 değerlerine göre durum byte'ı"""
+    return HYI_STATUS[bool(p1)][bool(p2)]
+
+
+class HyiPacketBuilder:
+    """HYİ paketlerini tek bir tampon üzerinde üreten paketleyici
+
+    Tampon her çağrıda yeniden kullanılır; aynı anda tek thread'den
+    çağrılmalıdır (istasyonda HYİ kilidi altında çağrılır).
+    """
+
+    def __init__(self):
+        self.buffer = bytearray(HYI_PACKET_SIZE)
+        self._view = memoryview(self.buffer)
+        self._body_view = self._view[BODY_START:BODY_END]
+        self._body = None  # Gövdesi tamponda olan telemetri snapshot'ı
+        self._body_sum = 0
+        # Header ve footer sabittir, bir kez yazılır
+        HYI_PACKET.pack_into(self.buffer, 0, HYI_HEADER, 0, 0, *[0.0] * 17, 0, 0, HYI_FOOTER)
+
+    def build(self, team_id: int, counter: int, telemetry) -> bytes:
+        """Telemetri snapshot'ından 78 byte'lık paketi üret"""
+        t = telemetry
+        if t is not self._body:
+            self._pack_body(t)
+        self.buffer[4] = team_id
+        self.buffer[5] = counter
+        self.buffer[CHECKSUM_END] = (team_id + counter + self._body_sum) & 0xFF
+        return bytes(self.buffer)
+
+    def _pack_body(self, t):
+        """Float alanları ve durum byte'ını yaz, CheckSum'daki paylarını hesapla"""
+        if t.gps_valid:
+            gps_altitude, gps_latitude, gps_longitude = t.gps_altitude, t.gps_latitude, t.gps_longitude
+        else:
+            gps_altitude = gps_latitude = gps_longitude = 0.0
+        if t.stage_gps_valid:
+            stage_altitude, stage_latitude, stage_longitude = t.stage_gps_altitude, t.stage_latitude, t.stage_longitude
+        else:
+            stage_altitude = stage_latitude = stage_longitude = 0.0
+
+        HYI_BODY.pack_into(
+            self.buffer, BODY_START,
+            t.altitude,
+            gps_altitude, gps_latitude, gps_longitude,
+            t.payload_gps_altitude, t.payload_latitude, t.payload_longitude,
+            stage_altitude, stage_latitude, stage_longitude,  # Kademe GPS (fix yoksa 0)
+            t.gyro_x, t.gyro_y, t.gyro_z,
+            t.accel_x, t.accel_y, t.accel_z,
+            t.pitch,
+            hyi_status(t.p1, t.p2),
+        )
+        # Tampondan kopyasız toplanır; snapshot'lar değişmez olduğundan sonuç
+        # aynı snapshot yeniden gönderildikçe tekrar kullanılır
+        self._body_sum = sum(self._body_view)
+        self._body = t
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""HYİ gönderim zamanlayıcısı
+
+HYİ paketleri LoRa alıcı thread'inde değil, kendi thread'inde sabit bir
+hızda (varsayılan 10 Hz) gönderilir. Her tikte en güncel telemetri snapshot'ı
+paketlenir; iki tik arasında gelen ara örnekler birleştirilir (coalescing).
+Böylece hakem beslemesi roket linki ne kadar düzensiz olursa olsun sabit
+hızda akar ve seri port yazımı LoRa parse işlemini hiçbir zaman bekletmez.
+start(loop) ile thread yerine verilen asyncio olay döngüsünde bir görev
+olarak çalışır; tik hesabı ve istatistikler iki durumda da aynıdır. Döngüde
+bloklayan seri port yazımı (send) zamanlayıcının tek işçili executor'ında
+yapılır, yazım sürerken döngü portları okumaya ve HTTP'ye devam eder.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Dokümana göre paketler arası en az 100 ms
+HYI_MAX_RATE = 10.0
+
+
+class HyiScheduler:
+    """Sabit periyotlu HYİ gönderim thread'i
+
+    send() her tikte çağrılır ve (gönderildi_mi, yazma_süresi_saniye) döndürür.
+    version() en güncel telemetri sürümünü döndürür; birleştirilen örnek
+    sayısını hesaplamak için kullanılır. enabled() False döndürdüğü sürece
+    (otomatik gönderim kapalı) tikler gönderim yapmadan geçer.
+    jitter_histogram verilirse her tikin gecikmesi ona da eklenir (/metrics).
+    """
+
+    def __init__(self, send, version, rate_hz: float = HYI_MAX_RATE, enabled=lambda: True,
+                 jitter_histogram=None):
+        self.send = send
+        self.version = version
+        self.enabled = enabled
+        self.jitter_histogram = jitter_histogram
+        self.rate_hz = min(max(float(rate_hz), 0.1), HYI_MAX_RATE)
+        self.period = 1.0 / self.rate_hz
+        self._stop = threading.Event()
+        self.thread = None
+        self._last_version = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.ticks = 0
+        self.sent = 0
+        self.failed = 0
+        self.late = 0  # Bir periyottan fazla geciken (atlanan) tikler
+        self.coalesced = 0  # Gönderilmeden üzerine yazılan ara örnekler
+        self.jitter_last = 0.0
+        self.jitter_max = 0.0
+        self.jitter_total = 0.0
+        self.write_last = 0.0
+        self.write_max = 0.0
+        self.write_total = 0.0
+
+    def start(self, loop: asyncio.AbstractEventLoop = None):
+        """Zamanlayıcıyı kendi thread'inde veya loop verilirse olay döngüsünde başlat"""
+        self._stop.clear()
+        if loop is not None:
+            self.thread = None
+            asyncio.run_coroutine_threadsafe(self._run_async(), loop)
+            return
+        self.thread = threading.Thread(target=self._loop, name="hyi-scheduler")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        self._last_version = self.version()
+        deadline = time.monotonic() + self.period
+        while not self._stop.wait(max(0.0, deadline - time.monotonic())):
+            deadline, due = self._tick(deadline)
+            if due:
+                self._sent(*self.send())
+
+    async def _run_async(self):
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hyi-writer")
+        self._last_version = self.version()
+        deadline = time.monotonic() + self.period
+        try:
+            while not self._stop.is_set():
+                await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+                if self._stop.is_set():
+                    break
+                deadline, due = self._tick(deadline)
+                if due:
+                    self._sent(*await loop.run_in_executor(executor, self.send))
+        finally:
+            executor.shutdown(wait=False)
+
+    def _tick(self, deadline: float):
+        """Bir tik: gecikmeyi ölç; (bir sonraki tikin zamanı, gönderilecek_mi) döndür"""
+        period = self.period
+        now = time.monotonic()
+        jitter = now - deadline
+        if jitter >= period:
+            # Tik(ler) kaçırıldı - birikmiş gönderim yapma, takvimi yeniden hizala
+            missed = int(jitter // period)
+            self.late += missed
+            deadline += missed * period
+            jitter -= missed * period
+        deadline += period
+
+        version = self.version()
+        if version - self._last_version > 1:
+            self.coalesced += version - self._last_version - 1
+        self._last_version = version
+
+        self.ticks += 1
+        self.jitter_last = jitter
+        self.jitter_total += jitter
+        if jitter > self.jitter_max:
+            self.jitter_max = jitter
+        if self.jitter_histogram is not None:
+            self.jitter_histogram.observe(jitter)
+
+        return deadline, self.enabled()
+
+    def _sent(self, sent: bool, write_time: float):
+        """send() sonucunu istatistiklere işle"""
+        if sent:
+            self.sent += 1
+            self.write_last = write_time
+            self.write_total += write_time
+            if write_time > self.write_max:
+                self.write_max = write_time
+        else:
+            self.failed += 1
+
+    def snapshot(self) -> dict:
+        ticks = self.ticks or 1
+        sent = self.sent or 1
+        return {
+            'rate_hz': self.rate_hz,
+            'ticks': self.ticks,
+            'sent': self.sent,
+            'failed': self.failed,
+            'late': self.late,
+            'coalesced': self.coalesced,
+            'jitter_last_ms': round(self.jitter_last * 1000, 3),
+            'jitter_avg_ms': round(self.jitter_total / ticks * 1000, 3),
+            'jitter_max_ms': round(self.jitter_max * 1000, 3),
+            'write_last_ms': round(self.write_last * 1000, 3),
+            'write_avg_ms': round(self.write_total / sent * 1000, 3),
+            'write_max_ms': round(self.write_max * 1000, 3),
+        }
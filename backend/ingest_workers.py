@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Süreç izolasyonlu alım işçileri (opsiyonel)
+
+LoRa ve Payload GPS portlarının her biri kendi sürecinde okunur ve parse
+edilir. HTTP istekleri, JSON üretimi ve konsol çıktısı ana süreçte kaldığından
+API'deki bir yük artışı seri alımı hiçbir zaman bekletmez (ayrı GIL).
+
+İşçi her telemetri güncellemesini kendi multiprocessing.shared_memory
+bloğundaki sabit düzenli bir halka tampona yazar:
+
+    başlık   <QQ     yazılan son örneğin sıra numarası (head), durdurma bayrağı
+    slot     <QdQ    sıra no, yayın zamanı (time.monotonic), değişen alan maskesi
+             + TelemetryData alanları (float 'd', bool '?', int 'q', str '16s', bytes 'Ns')
+
+str alanları UTF-8 olarak en fazla STRING_SIZE byte tutar (saat metinleri
+8 byte); daha uzun bir değer sessizce kesilmez, yazımda ValueError verir.
+
+Tek yazıcı olduğundan kilit yoktur: slotun sıra numarası önce 0 yazılır,
+veri yazıldıktan sonra gerçek değeri alır (seqlock). Okuyucu numarayı
+okumadan önce ve sonra kontrol eder; arada üzerine yazılan slot kayıp sayılır.
+Ana süreç (API + HYİ) bloğu eşler ve örnekleri doğrudan paylaşılan bellekten
+çözer; pipe veya pickle yoktur. Her yayından sonra ortak bir semafor
+artırılır, ana süreçteki denetleyici thread'i onu bekler (yoklama yok).
+Durdurma isteği de bloktaki bayrakla iletilir: multiprocessing.Event'i
+bekleyen bir işçi öldürülürse Event kilitli kalabilir, bayrak kalmaz.
+
+Yalnızca değişen alanlar ana süreçteki telemetriye işlenir; iki port farklı
+alanlara yazdığından örnekler birbirini ezmez. Ölen işçi aynı blokla yeniden
+başlatılır ve son örnekteki sayaçlardan devam eder; diğer portlar etkilenmez.
+Parse sayaçları (/metrics) işçi süreçlerinde kalır, ana süreç yalnızca
+işçi başına örnek / kayıp / yeniden başlatma sayılarını görür.
+"""
+
+import multiprocessing
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from operator import attrgetter
+
+from serial_io import LatencyStats
+
+RING_SLOTS = 256  # 20 Hz'de ~12 s; ana süreç bu kadar geride kalırsa örnek kaybı sayılır
+RESTART_DELAY = 1.0
+MAX_RESTART_DELAY = 30.0  # Örnek üretmeden ölen işçi (ör. port açılamıyor) için üst sınır
+
+HEADER = struct.Struct('<QQ')
+SEQ = struct.Struct('<Q')
+STOP_OFFSET = 8
+SLOT_HEADER = '<QdQ'
+STRING_SIZE = 16
+
+
+def _field_code(default) -> str:
+    if isinstance(default, bool):
+        return '?'
+    if isinstance(default, int):
+        return 'q'
+    if isinstance(default, float):
+        return 'd'
+    if isinstance(default, str):
+        return f'{STRING_SIZE}s'
+    if isinstance(default, bytes):
+        return f'{len(default)}s'
+    raise TypeError(f"Paylaşılan bellekte desteklenmeyen alan tipi: {type(default).__name__}")
+
+
+class TelemetryRing:
+    """Paylaşılan bellekte tek yazıcılı telemetri halka tamponu
+
+    fields: (alan_adı, varsayılan) listesi; düzen varsayılan değerlerin
+    tiplerinden çıkarılır, yazıcı ve okuyucu aynı listeyi kullanmalıdır.
+    str alanları en fazla STRING_SIZE byte olabilir (varsayılan dahil).
+    """
+
+    def __init__(self, fields, name: str = None, create: bool = False, slots: int = RING_SLOTS):
+        self.names = tuple(name for name, _ in fields)
+        if len(self.names) > 64:
+            raise ValueError("Değişen alan maskesi en fazla 64 alan destekler")
+        self.slot = struct.Struct(SLOT_HEADER + ''.join(_field_code(default) for _, default in fields))
+        self.slots = slots
+        self.strings = tuple(index for index, (_, default) in enumerate(fields) if isinstance(default, str))
+        for index in self.strings:
+            self._encode(index, fields[index][1])
+        self.bits = {name: 1 << index for index, name in enumerate(self.names)}
+        self._values = attrgetter(*self.names)
+        size = HEADER.size + self.slot.size * slots
+        self.memory = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+        self.buffer = self.memory.buf
+        if create:
+            self.buffer[:size] = bytes(size)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def head(self) -> int:
+        return SEQ.unpack_from(self.buffer, 0)[0]
+
+    def stop_requested(self) -> bool:
+        return bool(SEQ.unpack_from(self.buffer, STOP_OFFSET)[0])
+
+    def request_stop(self, stop: bool = True):
+        SEQ.pack_into(self.buffer, STOP_OFFSET, int(stop))
+
+    def write(self, telemetry, changed=None):
+        """Örneği bir sonraki slota yaz (yalnızca tek yazıcı süreçten)"""
+        index = self.head() + 1
+        offset = HEADER.size + (index % self.slots) * self.slot.size
+        values = list(self._values(telemetry))
+        for position in self.strings:
+            values[position] = self._encode(position, values[position])
+        if changed is None:
+            mask = (1 << len(self.names)) - 1
+        else:
+            bits = self.bits
+            mask = 0
+            for name in changed:
+                mask |= bits[name]
+        buffer = self.buffer
+        SEQ.pack_into(buffer, offset, 0)
+        self.slot.pack_into(buffer, offset, 0, time.monotonic(), mask, *values)
+        SEQ.pack_into(buffer, offset, index)
+        SEQ.pack_into(buffer, 0, index)
+
+    def _encode(self, position: int, value: str) -> bytes:
+        encoded = value.encode()
+        if len(encoded) > STRING_SIZE:
+            raise ValueError(f"{self.names[position]} alanı {STRING_SIZE} byte'ı aşıyor: {value!r}")
+        return encoded
+
+    def read(self, index: int, changed_only: bool = True):
+        """index numaralı örneği (yayın_zamanı, {alan: değer}) olarak oku; üzerine yazıldıysa None"""
+        offset = HEADER.size + (index % self.slots) * self.slot.size
+        seq, published_at, mask, *values = self.slot.unpack_from(self.buffer, offset)
+        if seq != index or SEQ.unpack_from(self.buffer, offset)[0] != index:
+            return None
+        for position in self.strings:
+            values[position] = values[position].rstrip(b'\0').decode()
+        names = self.names
+        if not changed_only:
+            return published_at, dict(zip(names, values))
+        return published_at, {names[position]: values[position]
+                              for position in range(len(names)) if mask >> position & 1}
+
+    def close(self):
+        self.buffer = None
+        self.memory.close()
+
+    def unlink(self):
+        self.memory.unlink()
+
+
+def _run_worker(port: str, device: str, baudrate: int, ring_name: str, fields, lora_mode: str,
+                log_level: str, record: bool, doorbell):
+    """İşçi süreci: portu aç, parse et, örnekleri halka tampona yaz"""
+    from main_system import TelemetryData, TEKNOFESTGroundStation
+
+    ring = TelemetryRing(fields, ring_name)
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(log_level)
+    station.lora_mode = lora_mode
+    head = ring.head()
+    if head:
+        # Yeniden başlatma: sayaçlar son yayınlanan örnekten devam eder
+        last = ring.read(head, changed_only=False)
+        if last:
+            station.telemetry = TelemetryData(**last[1])
+
+    def publish(telemetry, version, changed=None):
+        ring.write(telemetry, changed)
+        doorbell.release()
+
+    # Snapshot / SSE ana süreçte; işçide her güncelleme yalnızca paylaşılan belleğe yazılır
+    station.commit_telemetry = publish
+
+    connect = station.connect_lora if port == 'lora' else station.connect_payload_gps
+    if not connect(device, baudrate):
+        raise SystemExit(2)
+    station.running = True
+    if record:
+        # Sütun bazlı uçuş veritabanı ana süreçte bir kez yazılır
+        station.start_recording(database=False)
+    if port == 'lora':
+        station.start_lora_receiver()
+    else:
+        station.start_payload_gps_receiver()
+
+    parent = multiprocessing.parent_process()
+    while not ring.stop_requested():
+        if parent is not None and not parent.is_alive():
+            break
+        time.sleep(0.2)
+    station.stop_system()
+    station.log.flush()
+    ring.close()
+
+
+class IngestWorker:
+    """Ana süreçte bir işçinin durumu (süreç, halka tampon, okuma imleci)"""
+
+    def __init__(self, port: str, device: str, baudrate: int, ring: TelemetryRing):
+        self.port = port
+        self.device = device
+        self.baudrate = baudrate
+        self.ring = ring
+        self.process = None
+        self.cursor = 0
+        self.samples = 0
+        self.lost = 0
+        self.restarts = 0
+        self.failures = 0  # Örnek üretmeden art arda ölme sayısı
+        self.exitcode = None
+        self.restart_at = 0.0
+        self.samples_at_start = 0
+        self.delay = LatencyStats()  # Yayın -> ana süreçte işlenme
+
+    def snapshot(self) -> dict:
+        return {
+            'device': self.device,
+            'pid': self.process.pid if self.process else None,
+            'alive': bool(self.process and self.process.is_alive()),
+            'samples': self.samples,
+            'lost': self.lost,
+            'restarts': self.restarts,
+            'last_exitcode': self.exitcode,
+            'delay': self.delay.snapshot(),
+        }
+
+
+class IngestSupervisor:
+    """İşçi süreçlerini başlatan, izleyen ve örneklerini ana sürece aktaran denetleyici
+
+    apply(updates) her örneğin değişen alanlarıyla denetleyici thread'inde çağrılır.
+    """
+
+    def __init__(self, fields, apply, log, lora_mode: str = 'auto', log_level: str = 'info',
+                 record: bool = False, slots: int = RING_SLOTS):
+        self.fields = [(name, default) for name, default in fields]
+        self.apply = apply
+        self.log = log
+        self.lora_mode = lora_mode
+        self.log_level = log_level
+        self.record = record
+        self.slots = slots
+        self.context = multiprocessing.get_context('spawn')
+        self.doorbell = self.context.Semaphore(0)
+        self.workers = {}
+        self.running = False
+        self.thread = None
+
+    def start(self, ports: dict, baudrate: int = 9600):
+        """ports: {'lora' | 'payload': cihaz adı}"""
+        self.running = True
+        for port, device in ports.items():
+            ring = TelemetryRing(self.fields, create=True, slots=self.slots)
+            worker = self.workers[port] = IngestWorker(port, device, baudrate, ring)
+            self._spawn(worker)
+        self.thread = threading.Thread(target=self._loop, name="ingest-supervisor")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _spawn(self, worker: IngestWorker):
+        worker.samples_at_start = worker.samples
+        worker.process = self.context.Process(
+            target=_run_worker, name=f"{worker.port}-ingest",
+            args=(worker.port, worker.device, worker.baudrate, worker.ring.name, self.fields, self.lora_mode,
+                  self.log_level, self.record, self.doorbell),
+        )
+        worker.process.daemon = True
+        worker.process.start()
+        self.log.info('system', "🧩 %s işçisi başlatıldı (pid %s, %s)", worker.port, worker.process.pid, worker.device)
+
+    def _loop(self):
+        next_check = 0.0
+        while self.running:
+            self.doorbell.acquire(timeout=0.5)
+            for worker in self.workers.values():
+                self._drain(worker)
+            now = time.monotonic()
+            if now >= next_check:
+                next_check = now + 0.5
+                self._supervise(now)
+        for worker in self.workers.values():
+            self._drain(worker)
+
+    def _drain(self, worker: IngestWorker):
+        ring = worker.ring
+        head = ring.head()
+        index = worker.cursor
+        if head - index > self.slots:
+            # Ana süreç halka boyundan fazla geride kaldı
+            worker.lost += head - index - self.slots
+            index = head - self.slots
+        while index < head:
+            index += 1
+            sample = ring.read(index)
+            if sample is None:
+                worker.lost += 1
+                continue
+            published_at, updates = sample
+            worker.samples += 1
+            if updates:
+                try:
+                    self.apply(updates)
+                except Exception as e:
+                    self.log.error('system', "❌ %s örneği işlenemedi: %s", worker.port, e)
+            worker.delay.record(time.monotonic() - published_at)
+        worker.cursor = index
+
+    def _supervise(self, now: float):
+        for worker in self.workers.values():
+            process = worker.process
+            if process is None or process.is_alive():
+                if process is None and now >= worker.restart_at:
+                    worker.restarts += 1
+                    self._spawn(worker)
+                continue
+            # Beklenmedik çıkış: kalan örnekleri al, kısa bir beklemeden sonra yeniden başlat
+            worker.exitcode = process.exitcode
+            worker.process = None
+            self._drain(worker)
+            worker.failures = worker.failures + 1 if worker.samples == worker.samples_at_start else 0
+            delay = min(RESTART_DELAY * 2 ** worker.failures, MAX_RESTART_DELAY)
+            worker.restart_at = now + delay
+            self.log.error('system', "❌ %s işçisi durdu (çıkış kodu %s), %g s sonra yeniden başlatılacak",
+                           worker.port, worker.exitcode, delay)
+
+    def stop(self, timeout: float = 2.0):
+        self.running = False
+        self.doorbell.release()
+        for worker in self.workers.values():
+            worker.ring.request_stop()
+        for worker in self.workers.values():
+            if worker.process is not None:
+                worker.process.join(timeout)
+                if worker.process.is_alive():
+                    worker.process.terminate()
+                    worker.process.join(timeout)
+        if self.thread:
+            self.thread.join(timeout)
+        for worker in self.workers.values():
+            worker.ring.close()
+            worker.ring.unlink()
+        self.log.info('system', "🧩 Alım işçileri durduruldu")
+
+    def snapshot(self) -> dict:
+        return {port: worker.snapshot() for port, worker in self.workers.items()}
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sıvı seviye zaman serisi (delta/RLE kodlu) ve çalkalanma analizi
+
+Her sıvı çerçevesi (24 sensör x 8 temas noktası) zaman damgasıyla saklanır.
+Çerçeveler FRAMES_PER_BLOCK'luk bloklarda tutulur; her blok tam bir anahtar
+çerçeveyle başlar, sonraki çerçeveler yalnızca değişen sensörleri içerir:
+
+    değişen sensör maskesi (3 byte, little-endian) + değişen seviyeler
+    maske 0 ise: 1 byte tekrar sayısı (RLE; değişmeyen ardışık çerçeveler)
+
+Zaman damgaları blok başlangıcına göre float32 ofset olarak tutulur. Çoğu
+çerçevede sensörler değişmediğinden çerçeve başına ~0-4 byte + 4 byte zaman
+tutulur. Blok sayısı sınırlıdır (ring), en kötü durumda (her çerçevede tüm
+sensörler değişirse) bellek kapasite * 31 byte'tır.
+
+Analiz her çerçevede artımlı güncellenir (kayan zaman penceresi):
+    moving_average   sensör başına ıslak temas sayısı ortalaması (0-8)
+    fill_fraction    ıslak temas / 192
+    slosh_hz         sıvı ağırlık merkezinin pencere ortalaması etrafında
+                     yön değiştirme sıklığından frekans tahmini (x ve z ekseni)
+
+Sensör başına toplamlar 16 bit'lik şeritlere paketlenmiş tek bir tamsayıda
+tutulur; çerçeve ekleme/çıkarma 24 elemanlı Python döngüsü yerine tek bir
+toplama/çıkarmadır. Şeritler taşmasın diye pencere zamanın yanında çerçeve
+sayısıyla da (ANALYTICS_MAX_FRAMES) sınırlıdır.
+"""
+
+import threading
+import time
+from array import array
+from collections import deque
+from operator import mul
+
+from liquid_levels import LIQUID_SENSORS
+
+# 30 dakika @ 50 Hz (telemetry_history.HISTORY_CAPACITY ile aynı)
+LIQUID_HISTORY_CAPACITY = 90_000
+FRAMES_PER_BLOCK = 256
+ANALYTICS_WINDOW = 10.0  # saniye
+# Ağırlık merkezi pencere ortalamasından bu kadar (ızgara birimi) sapmadan yön değişimi sayılmaz
+SLOSH_HYSTERESIS = 0.05
+# Daha kısa pencerede frekans tahmini anlamsız (null döner)
+MIN_SLOSH_SPAN = 1.0
+
+# Byte -> ıslak temas sayısı (bit sayısı)
+WET_CONTACTS = bytes(bin(value).count('1') for value in range(256))
+CONTACTS_PER_SENSOR = 8
+TOTAL_CONTACTS = LIQUID_SENSORS * CONTACTS_PER_SENSOR
+# 16 bit'lik şeritte taşmadan toplanabilecek en fazla çerçeve (8191; 50 Hz'de ~160 s)
+ANALYTICS_MAX_FRAMES = 0xFFFF // CONTACTS_PER_SENSOR
+
+# Panel yerleşimi (src/components/LiquidLevel3D.js): satır başına çubuk ve sensör numaraları
+_ROD_ROWS = (
+    (4, 1), (3, 5, 2), (12, 6, 7), (11, 9, 10, 8),
+    (18, 16, 15, 13), (17, 19, 14), (23, 20, 22), (24, 21),
+)
+_SPACING_X = 2.5
+_SPACING_Z = 1.2
+
+
+def _sensor_positions():
+    """Sensör indeksi (0-23) sırasıyla (x, z) konumları, merkez 0"""
+    positions = {}
+    rows = len(_ROD_ROWS)
+    for row, sensors in enumerate(_ROD_ROWS):
+        z = (row - (rows - 1) / 2) * _SPACING_Z
+        start_x = -(len(sensors) - 1) * _SPACING_X / 2
+        for column, sensor in enumerate(sensors):
+            positions[sensor - 1] = (start_x + column * _SPACING_X, z)
+    return [positions[index] for index in range(LIQUID_SENSORS)]
+
+
+SENSOR_X, SENSOR_Z = (tuple(axis) for axis in zip(*_sensor_positions()))
+
+
+class _Block:
+    __slots__ = ('base', 'offsets', 'keyframe', 'last', 'data', 'run_pos')
+
+    def __init__(self, timestamp: float, levels: bytes):
+        self.base = timestamp
+        self.offsets = array('f', (0.0,))
+        self.keyframe = levels
+        self.last = levels
+        self.data = bytearray()
+        self.run_pos = -1  # Uzatılabilecek son RLE sayacının konumu
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @property
+    def last_time(self) -> float:
+        return self.base + self.offsets[-1]
+
+    def add(self, timestamp: float, levels: bytes):
+        self.offsets.append(timestamp - self.base)
+        data = self.data
+        if levels == self.last:
+            run_pos = self.run_pos
+            if run_pos >= 0 and data[run_pos] < 255:
+                data[run_pos] += 1
+            else:
+                data += b'\x00\x00\x00\x01'
+                self.run_pos = len(data) - 1
+            return
+        last = self.last
+        changed = [index for index in range(LIQUID_SENSORS) if levels[index] != last[index]]
+        mask = 0
+        for index in changed:
+            mask |= 1 << index
+        data += mask.to_bytes(3, 'little')
+        data += bytes(levels[index] for index in changed)
+        self.last = levels
+        self.run_pos = -1
+
+    def frames(self):
+        """Bloktaki çerçeveleri sırayla çöz"""
+        return _decode_frames(self.keyframe, self.data)
+
+    @property
+    def nbytes(self) -> int:
+        return LIQUID_SENSORS + len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+
+def _decode_frames(keyframe: bytes, data):
+    """Anahtar çerçeve ve delta/RLE verisinden çerçeveleri sırayla üret"""
+    current = bytearray(keyframe)
+    yield bytes(current)
+    pos = 0
+    end = len(data)
+    while pos < end:
+        mask = int.from_bytes(data[pos:pos + 3], 'little')
+        pos += 3
+        if not mask:
+            frame = bytes(current)
+            for _ in range(data[pos]):
+                yield frame
+            pos += 1
+            continue
+        index = 0
+        while mask:
+            if mask & 1:
+                current[index] = data[pos]
+                pos += 1
+            mask >>= 1
+            index += 1
+        yield bytes(current)
+
+
+class LiquidAnalytics:
+    """Kayan zaman penceresinde artımlı sensör ortalaması, doluluk ve çalkalanma tahmini"""
+
+    def __init__(self, window: float = ANALYTICS_WINDOW, hysteresis: float = SLOSH_HYSTERESIS,
+                 max_frames: int = ANALYTICS_MAX_FRAMES):
+        self.window = window
+        self.hysteresis = hysteresis
+        self.max_frames = min(max_frames, ANALYTICS_MAX_FRAMES)
+        self.samples = deque()  # (zaman, şeritli temas sayıları, toplam temas, merkez x, merkez z)
+        self.lane_sums = 0  # Sensör başına temas toplamları, 16 bit'lik şeritler
+        self.wet_sum = 0
+        self.center_sums = [0.0, 0.0]
+        self.crossings = (deque(), deque())  # Eksen başına yön değişim zamanları
+        self._sides = [0, 0]
+        self._lanes = bytearray(2 * LIQUID_SENSORS)
+        self._last_levels = None
+        self._last_sample = None
+        self.latest = None
+
+    def add(self, timestamp: float, levels: bytes):
+        if levels is self._last_levels or levels == self._last_levels:
+            lanes, wet, center_x, center_z = self._last_sample
+        else:
+            counts = levels.translate(WET_CONTACTS)
+            # Her sensörün sayısı 16 bit'lik şeridin düşük byte'ına
+            self._lanes[1::2] = counts
+            lanes = int.from_bytes(self._lanes, 'big')
+            wet = sum(counts)
+            if wet:
+                center_x = sum(map(mul, counts, SENSOR_X)) / wet
+                center_z = sum(map(mul, counts, SENSOR_Z)) / wet
+            else:
+                center_x = center_z = 0.0
+            self._last_levels = levels
+            self._last_sample = (lanes, wet, center_x, center_z)
+
+        samples = self.samples
+        samples.append((timestamp, lanes, wet, center_x, center_z))
+        self.lane_sums += lanes
+        self.wet_sum += wet
+        sums = self.center_sums
+        sums[0] += center_x
+        sums[1] += center_z
+
+        horizon = timestamp - self.window
+        max_frames = self.max_frames
+        while samples[0][0] < horizon or len(samples) > max_frames:
+            _, old_lanes, old_wet, old_x, old_z = samples.popleft()
+            self.lane_sums -= old_lanes
+            self.wet_sum -= old_wet
+            sums[0] -= old_x
+            sums[1] -= old_z
+        # Çerçeve sınırı pencereyi kısalttıysa yön değişimleri de en eski örnekten başlar
+        horizon = max(horizon, samples[0][0])
+
+        count = len(samples)
+        for axis, value in enumerate((center_x, center_z)):
+            deviation = value - sums[axis] / count
+            side = 1 if deviation > self.hysteresis else -1 if deviation < -self.hysteresis else 0
+            if side and side != self._sides[axis]:
+                if self._sides[axis]:
+                    self.crossings[axis].append(timestamp)
+                self._sides[axis] = side
+            crossings = self.crossings[axis]
+            while crossings and crossings[0] < horizon:
+                crossings.popleft()
+        self.latest = (timestamp, wet)
+
+    def snapshot(self) -> dict:
+        samples = self.samples
+        count = len(samples)
+        if not count:
+            return {'window_s': self.window, 'frames': 0}
+        sums = self.lane_sums.to_bytes(2 * LIQUID_SENSORS, 'big')
+        span = samples[-1][0] - samples[0][0]
+        slosh = {}
+        for axis, name in enumerate(('x', 'z')):
+            # İki yön değişimi bir tam salınım
+            slosh[name] = round(len(self.crossings[axis]) / (2 * span), 3) if span >= MIN_SLOSH_SPAN else None
+        return {
+            'window_s': self.window,
+            'frames': count,
+            'span_s': round(span, 3),
+            'moving_average': [round(int.from_bytes(sums[index:index + 2], 'big') / count, 3)
+                               for index in range(0, 2 * LIQUID_SENSORS, 2)],
+            'fill_fraction': round(self.latest[1] / TOTAL_CONTACTS, 4),
+            'fill_fraction_avg': round(self.wet_sum / count / TOTAL_CONTACTS, 4),
+            'center': {'x': round(self.center_sums[0] / count, 3), 'z': round(self.center_sums[1] / count, 3)},
+            'slosh_hz': slosh,
+        }
+
+
+class LiquidHistory:
+    """Sıvı çerçevelerini delta/RLE kodlu bloklarda saklayan sınırlı depo"""
+
+    def __init__(self, capacity: int = LIQUID_HISTORY_CAPACITY, block_frames: int = FRAMES_PER_BLOCK,
+                 window: float = ANALYTICS_WINDOW):
+        self.block_frames = block_frames
+        self.blocks = deque(maxlen=max(2, capacity // block_frames))
+        self.analytics = LiquidAnalytics(window)
+        self.total = 0
+        self.epoch_offset = time.time() - time.monotonic()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(block) for block in self.blocks)
+
+    def append(self, levels: bytes, timestamp: float = None):
+        """Çerçeveyi ekle ve analizi güncelle"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        levels = bytes(levels)
+        with self.lock:
+            blocks = self.blocks
+            if blocks and len(blocks[-1]) < self.block_frames:
+                blocks[-1].add(timestamp, levels)
+            else:
+                blocks.append(_Block(timestamp, levels))
+            self.analytics.add(timestamp, levels)
+            self.total += 1
+
+    def clear(self):
+        with self.lock:
+            self.blocks.clear()
+            analytics = self.analytics
+            self.analytics = LiquidAnalytics(analytics.window, analytics.hysteresis, analytics.max_frames)
+            self.total = 0
+
+    def query(self, start: float = None, end: float = None, step: int = 1) -> dict:
+        """Unix zamanı [start, end] aralığındaki çerçeveleri çözüp döndür
+
+        Negatif start/end değerleri "şu andan N saniye önce" olarak yorumlanır.
+        Yalnızca aralıkla kesişen bloklar çözülür.
+        """
+        step = max(1, int(step))
+        now = time.monotonic()
+        offset = self.epoch_offset
+        lo_time = float('-inf') if start is None else (now + start if start < 0 else start - offset)
+        hi_time = float('inf') if end is None else (now + end if end < 0 else end - offset)
+
+        # Kilit altında yalnızca blok referansları alınır; çözme kilit dışında
+        # yapılır, alıcı thread'i uzun sorgularda beklemez. Dolan bloklar artık
+        # değişmez, yalnızca yazılmakta olan son bloğun verisi kopyalanır.
+        selected = []
+        with self.lock:
+            blocks = self.blocks
+            last = blocks[-1] if blocks else None
+            for block in blocks:
+                if block.last_time < lo_time:
+                    continue
+                if block.base > hi_time:
+                    break
+                if block is last:
+                    selected.append((block.base, block.offsets[:], block.keyframe, bytes(block.data)))
+                else:
+                    selected.append((block.base, block.offsets, block.keyframe, block.data))
+            analytics = self.analytics.snapshot()
+
+        times, levels = [], []
+        index = 0
+        for base, offsets, keyframe, data in selected:
+            for block_offset, frame in zip(offsets, _decode_frames(keyframe, data)):
+                timestamp = base + block_offset
+                if lo_time <= timestamp <= hi_time:
+                    if index % step == 0:
+                        times.append(timestamp + offset)
+                        levels.append(list(frame))
+                    index += 1
+
+        return {
+            'count': len(times),
+            'time': times,
+            'levels': levels,
+            'analytics': analytics,
+        }
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            frames = len(self)
+            nbytes = sum(block.nbytes for block in self.blocks)
+        return {
+            'frames': frames,
+            'total': self.total,
+            'blocks': len(self.blocks),
+            'bytes': nbytes,
+            # Ham saklama (24 byte + 8 byte zaman damgası) ile karşılaştırma
+            'compression': round((LIQUID_SENSORS + 8) * frames / nbytes, 2) if nbytes else 0.0,
+        }
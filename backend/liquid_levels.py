@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sıvı seviye çerçevesi (24 sensör x 8 bit) çözümü
+
+Metin çerçevesi 'ALL=' veya eski 'ALL:' ön ekinden sonra 192 karakterlik bit
+dizisidir. Bitler tek geçişte çözülür: translate ile yalnızca 0/1 içerdiği
+doğrulanır, int(..., 2) ile tek bir tamsayıya, to_bytes ile 24 byte'a
+çevrilir. Seviyeler telemetride 24 byte'lık bytes olarak tutulur; API'nin
+beklediği 192 karakterlik dizi ve liste yalnızca JSON üretilirken oluşturulur.
+"""
+
+from functools import lru_cache
+
+LIQUID_SENSORS = 24
+LIQUID_BITS = LIQUID_SENSORS * 8
+EMPTY_LEVELS = bytes(LIQUID_SENSORS)
+
+# Ön ek -> log'daki format adı
+LIQUID_PREFIXES = (('ALL=', 'yeni'), ('ALL:', 'eski'))
+
+# 0 ve 1 dışındaki her karakteri silen tablo; sonuç boş değilse dizi geçersiz
+_NON_BITS = str.maketrans('', '', '01')
+
+
+def decode_liquid_bits(bits: str):
+    """192 karakterlik bit dizisini 24 byte'a çevir; geçersizse None"""
+    if len(bits) != LIQUID_BITS or bits.translate(_NON_BITS):
+        return None
+    return int(bits, 2).to_bytes(LIQUID_SENSORS, 'big')
+
+
+def find_liquid_levels(data_str: str):
+    """Satırdaki ALL= / ALL: çerçevesini bul, (seviyeler, format_adı) döndür
+
+    Regex'teki ([01]{192}) ile aynı şekilde ön ekten sonraki ilk 192 karakter
+    kullanılır; ön ek yoksa veya bitler geçersizse (None, None).
+    """
+    for prefix, format_type in LIQUID_PREFIXES:
+        index = data_str.find(prefix)
+        while index >= 0:
+            start = index + len(prefix)
+            levels = decode_liquid_bits(data_str[start:start + LIQUID_BITS])
+            if levels is not None:
+                return levels, format_type
+            index = data_str.find(prefix, start)
+    return None, None
+
+
+@lru_cache(maxsize=16)
+def liquid_json_fields(levels: bytes) -> tuple:
+    """(all_liquid_data, liquid_levels) API gösterimi; seviye yoksa ("", sıfırlar)
+
+    Aynı çerçeve her telemetri güncellemesinde yeniden serileştirildiğinden sonuç önbelleğe alınır.
+    """
+    if levels == EMPTY_LEVELS:
+        return "", tuple(levels)
+    return format(int.from_bytes(levels, 'big'), f'0{LIQUID_BITS}b'), tuple(levels)
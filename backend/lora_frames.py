@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""LoRa ikili (binary) çerçeve protokolü
+
+Çerçeve yapısı (little-endian):
+    0-1   Senkron kelimesi 0xAA 0x55
+    2     Yük uzunluğu (byte)
+    3-..  Yük (ROCKET_FRAME düzeni)
+    son 2 CRC16-CCITT (uzunluk + yük üzerinden, başlangıç 0xFFFF)
+
+Aynı bilgiyi taşıyan metin satırı ~150 byte iken ikili çerçeve 60 byte'tır;
+9600 baud'da aynı radyo ayarlarıyla yaklaşık 2.5 kat daha sık paket gönderilebilir.
+
+Aynı çerçeve yapısı payload linkinde sıvı seviye verisi için de kullanılır
+(LIQUID_FRAME, 31 byte; metin ALL= satırı 198 byte). Payload portu metin
+olduğundan bu çerçeveler satırların arasına gömülü gelir ve
+EmbeddedFrameExtractor ile metinden ayrılır.
+"""
+
+import struct
+from binascii import crc_hqx
+
+SYNC_WORD = b'\xAA\x55'
+HEADER_SIZE = 3  # senkron + uzunluk
+CRC_SIZE = 2
+MAX_PAYLOAD = 255
+
+# Sıra no, durum bitleri, 13 float: ALT, maxALT, dY, gX, gY, gZ, aX, aY, aZ, pitch, enlem, boylam, GPS irtifa
+ROCKET_FRAME = struct.Struct('<HB13f')
+ROCKET_FIELDS = (
+    'altitude', 'max_altitude', 'delta_y',
+    'gyro_x', 'gyro_y', 'gyro_z',
+    'accel_x', 'accel_y', 'accel_z',
+    'pitch',
+    'gps_latitude', 'gps_longitude', 'gps_altitude',
+)
+
+# Sıra no, 24 sensör seviyesi (her biri 1 byte)
+LIQUID_FRAME = struct.Struct('<H24s')
+
+FLAG_FIRED = 0x01
+FLAG_P1 = 0x02
+FLAG_P2 = 0x04
+FLAG_GPS_VALID = 0x08
+
+_CRC = struct.Struct('<H')
+
+
+def crc16(data, crc: int = 0xFFFF) -> int:
+    """CRC16-CCITT (poly 0x1021)"""
+    return crc_hqx(data, crc)
+
+
+def encode_rocket_frame(sample: dict, seq: int = 0) -> bytes:
+    """Telemetri sözlüğünden ikili çerçeve üret (uçuş bilgisayarı / simülatör için)"""
+    flags = 0
+    if sample.get('fired'):
+        flags |= FLAG_FIRED
+    if sample.get('p1'):
+        flags |= FLAG_P1
+    if sample.get('p2'):
+        flags |= FLAG_P2
+    if sample.get('gps_valid'):
+        flags |= FLAG_GPS_VALID
+    payload = ROCKET_FRAME.pack(seq & 0xFFFF, flags,
+                                *(float(sample.get(name, 0.0)) for name in ROCKET_FIELDS))
+    return _frame(payload)
+
+
+def encode_liquid_frame(levels: bytes, seq: int = 0) -> bytes:
+    """24 byte'lık sıvı seviyelerinden ikili çerçeve üret (görev yükü / simülatör için)"""
+    return _frame(LIQUID_FRAME.pack(seq & 0xFFFF, bytes(levels)))
+
+
+def _frame(payload: bytes) -> bytes:
+    body = bytes((len(payload),)) + payload
+    return SYNC_WORD + body + _CRC.pack(crc16(body))
+
+
+def decode_rocket_payload(buffer, offset: int):
+    """Yükü (sıra no, TelemetryData güncellemeleri) olarak çöz"""
+    values = ROCKET_FRAME.unpack_from(buffer, offset)
+    seq, flags = values[0], values[1]
+    updates = dict(zip(ROCKET_FIELDS, values[2:]))
+    updates['fired'] = bool(flags & FLAG_FIRED)
+    updates['p1'] = bool(flags & FLAG_P1)
+    updates['p2'] = bool(flags & FLAG_P2)
+    gps_valid = bool(flags & FLAG_GPS_VALID)
+    updates['gps_valid'] = gps_valid
+    if not gps_valid:
+        # Metin formatındaki GPS:invalid ile aynı davranış
+        updates['gps_latitude'] = 0.0
+        updates['gps_longitude'] = 0.0
+        updates['gps_altitude'] = 0.0
+    return seq, updates
+
+
+class BinaryFrameDecoder:
+    """Akış halinde gelen byte'lardan ikili çerçeveleri ayıklar
+
+    Alınan veri tek bir bytearray'de biriktirilir, çerçeveler memoryview
+    üzerinde struct.unpack_from ile kopyalanmadan çözülür. CRC hatasında
+    senkron kelimesinin bir byte ilerisinden aranarak yeniden senkronize olunur.
+    """
+
+    def __init__(self, payload_size: int = ROCKET_FRAME.size):
+        self.buffer = bytearray()
+        self.payload_size = payload_size
+        self.frames_ok = 0
+        self.crc_errors = 0
+        self.length_errors = 0
+        self.dropped_bytes = 0
+
+    def feed(self, data) -> list:
+        """Yeni byte'ları ekle, tamamlanan çerçeveleri (seq, updates) listesi olarak döndür"""
+        buffer = self.buffer
+        buffer += data
+        frames = []
+        offset = 0
+        end = len(buffer)
+        view = memoryview(buffer)
+        try:
+            while True:
+                start = buffer.find(SYNC_WORD, offset)
+                if start < 0:
+                    # Son byte bir sonraki senkron kelimesinin ilk yarısı olabilir
+                    keep = end - 1 if end and buffer[end - 1] == SYNC_WORD[0] else end
+                    self.dropped_bytes += keep - offset
+                    offset = keep
+                    break
+                self.dropped_bytes += start - offset
+                offset = start
+                if end - start < HEADER_SIZE:
+                    break
+                length = buffer[start + 2]
+                if length != self.payload_size:
+                    self.length_errors += 1
+                    offset = start + 1
+                    continue
+                frame_end = start + HEADER_SIZE + length + CRC_SIZE
+                if frame_end > end:
+                    break
+                expected = _CRC.unpack_from(view, frame_end - CRC_SIZE)[0]
+                if crc16(view[start + 2:frame_end - CRC_SIZE]) != expected:
+                    self.crc_errors += 1
+                    offset = start + 1
+                    continue
+                frames.append(decode_rocket_payload(view, start + HEADER_SIZE))
+                self.frames_ok += 1
+                offset = frame_end
+        finally:
+            view.release()
+        if offset:
+            del buffer[:offset]
+        return frames
+
+    def reset(self):
+        """Tamponu temizle"""
+        self.buffer.clear()
+
+
+class EmbeddedFrameExtractor:
+    """Metin akışının içine gömülü ikili çerçeveleri ayırır
+
+    feed() metin byte'larını ve çözülen çerçeve yüklerini (payload_size byte,
+    kopya) ayrı ayrı döndürür; metin satır ayırıcıya verilir. ASCII metinde
+    0xAA geçmediğinden, tamponda bekleyen çerçeve yokken 0xAA içermeyen
+    chunk'lar kopyalanmadan aynen döner. Uzunluğu veya CRC'si tutmayan
+    senkron kelimesi metin sayılır.
+    """
+
+    def __init__(self, payload_size: int = LIQUID_FRAME.size):
+        self.buffer = bytearray()
+        self.payload_size = payload_size
+        self.frame_size = HEADER_SIZE + payload_size + CRC_SIZE
+        self.frames_ok = 0
+        self.crc_errors = 0
+
+    def feed(self, data):
+        """(metin, [yük, ...]) döndür"""
+        if not self.buffer and SYNC_WORD[0] not in data:
+            return data, ()
+        buffer = self.buffer
+        buffer += data
+        text = bytearray()
+        payloads = []
+        offset = 0
+        end = len(buffer)
+        while True:
+            start = buffer.find(SYNC_WORD, offset)
+            if start < 0:
+                # Son byte bir sonraki senkron kelimesinin ilk yarısı olabilir
+                keep = end - 1 if end and buffer[end - 1] == SYNC_WORD[0] else end
+                text += buffer[offset:keep]
+                offset = keep
+                break
+            text += buffer[offset:start]
+            offset = start
+            if end - start < HEADER_SIZE:
+                break
+            if buffer[start + 2] != self.payload_size:
+                text += buffer[start:start + 1]
+                offset = start + 1
+                continue
+            frame_end = start + self.frame_size
+            if frame_end > end:
+                break
+            body = bytes(buffer[start + 2:frame_end - CRC_SIZE])
+            if crc16(body) != _CRC.unpack_from(buffer, frame_end - CRC_SIZE)[0]:
+                self.crc_errors += 1
+                text += buffer[start:start + 1]
+                offset = start + 1
+                continue
+            payloads.append(body[1:])
+            self.frames_ok += 1
+            offset = frame_end
+        if offset:
+            del buffer[:offset]
+        return text, payloads
+
+    def reset(self):
+        """Tamponu temizle"""
+        self.buffer.clear()
@@ -3,25 +3,53 @@
 
 import serial
 import serial.tools.list_ports
-import struct
 import time
 import threading
 import re
 import json
-from dataclasses import dataclass, asdict, field
-from typing import Optional, List
+import math
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Dict, Optional, List
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
-import queue
 from flask import Flask, send_from_directory
 import os
 import pyfiglet
 
+from flight_db import EXPORTERS, FlightDatabase, Table, list_flights, table_path, telemetry_table
+from flight_recorder import CHANNEL_HYI, CHANNEL_LINKS, CHANNEL_LORA, CHANNEL_PAYLOAD, FlightRecorder
+from hyi_packet import HYI_PACKET_SIZE, HyiPacketBuilder
+from hyi_scheduler import HYI_MAX_RATE, HyiScheduler
+from ingest_workers import IngestSupervisor
+from liquid_history import LiquidHistory
+from liquid_levels import EMPTY_LEVELS, LIQUID_SENSORS, find_liquid_levels, liquid_json_fields
+from lora_frames import LIQUID_FRAME
+from serial_io import AsyncSerialReader, SerialReader
+from station_links import Link, LinkArbiter
+from station_log import DEBUG, INFO, ApiSink, ConsoleSink, RotatingFileSink, StationLogger
+from station_metrics import MetricsRegistry
+from telemetry_history import PAYLOAD_HISTORY_FIELDS, ROCKET_HISTORY_FIELDS, TelemetryHistory
+from telemetry_stream import TelemetryBroadcaster
 
-@dataclass
+# Ham seri veri kayıtları (oturum başına bir dosya)
+RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recordings')
+# Uçuş veritabanı (oturum başına bir dizin, tablo başına sütun bazlı dosya)
+FLIGHTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'flights')
+
+# /metrics'te satır sayaçlarının format etiketleri (payload işleyicilerinin döndürdüğü adlar)
+PAYLOAD_FORMATS = ('nofix', 'fix', 'nofix_simple', 'legacy', 'fields', 'nmea', 'gyro', 'liquid', 'unknown')
+
+
+@dataclass(frozen=True)
 class TelemetryData:
-    """Telemetri verilerini tutan sınıf"""
+    """Telemetri verilerini tutan sınıf
+
+    Değiştirilemez (immutable): parser'lar yeni bir örnek oluşturup
+    TEKNOFESTGroundStation.update_telemetry ile tek referans değişimiyle yayınlar.
+    Okuyucular self.telemetry'yi bir kez okuyarak tutarlı bir snapshot elde eder.
+    """
     altitude: float = 0.0
     max_altitude: float = 0.0
     gps_altitude: float = 0.0
@@ -46,20 +74,173 @@ class TelemetryData:
     payload_gyro_x: float = 0.0
     payload_gyro_y: float = 0.0
     payload_gyro_z: float = 0.0
+    stage_gps_altitude: float = 0.0  # Kademe GPS (kademe linki bağlıysa)
+    stage_latitude: float = 0.0
+    stage_longitude: float = 0.0
+    stage_gps_valid: bool = False
     last_update: str = ""
     packet_count: int = 0
     payload_last_update: str = ""
     payload_packet_count: int = 0
-    all_liquid_data: str = ""  # 192-bit binary string
-    liquid_levels: List[int] = field(default_factory=lambda: [0] * 24)
+    stage_last_update: str = ""
+    stage_packet_count: int = 0
+    liquid_levels: bytes = EMPTY_LEVELS  # 24 sensör x 8 bit
+
+    @property
+    def all_liquid_data(self) -> str:
+        """192 karakterlik bit dizisi (seviye verisi yoksa boş)"""
+        return liquid_json_fields(self.liquid_levels)[0]
+
+    def to_dict(self) -> dict:
+        """Sığ sözlük kopyası (alanlar değiştirilemez olduğundan asdict'in derin kopyasına gerek yok)
+
+        Sıvı seviyeleri API'nin beklediği bit dizisi + liste olarak verilir.
+        """
+        data = dict(self.__dict__)
+        data['all_liquid_data'], data['liquid_levels'] = liquid_json_fields(self.liquid_levels)
+        return data
+
+    def evolve(self, updates: dict) -> 'TelemetryData':
+        """updates uygulanmış yeni örnek (dataclasses.replace'in __init__ çağırmayan hızlı eşdeğeri)"""
+        if not updates.keys() <= TELEMETRY_FIELDS:
+            raise TypeError(f"Bilinmeyen telemetri alanı: {', '.join(updates.keys() - TELEMETRY_FIELDS)}")
+        telemetry = object.__new__(TelemetryData)
+        state = telemetry.__dict__
+        state.update(self.__dict__)
+        state.update(updates)
+        return telemetry
+
+
+TELEMETRY_FIELDS = frozenset(field.name for field in fields(TelemetryData))
+
+
+_clock = (0, "")
+
+
+def clock_text() -> str:
+    """Yerel saat HH:MM:SS (saniyede bir biçimlendirilir, örnek başına strftime yok)"""
+    global _clock
+    second = int(time.time())
+    if second != _clock[0]:
+        _clock = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+    return _clock[1]
+
+
+def _lora_number(value: str) -> float:
+    """Sayısal LoRa alanı (ALT:837.9m gibi birimli değerleri de kabul eder; nan/inf geçersiz)"""
+    number = float(value.rstrip(' m'))
+    if not math.isfinite(number):
+        raise ValueError(value)
+    return number
+
+
+def _lora_flag(value: str) -> bool:
+    """0/1 durum alanı"""
+    value = value.strip()
+    if value != '0' and value != '1':
+        raise ValueError(value)
+    return value == '1'
+
+
+def _lora_gps(value: str) -> tuple:
+    """GPS:lat,lon veya GPS:invalid -> (enlem, boylam, geçerli)"""
+    if value.strip() == 'invalid':
+        return 0.0, 0.0, False
+    lat, lon = value.split(',')[:2]
+    return float(lat), float(lon), True
+
+
+# LoRa alan tablosu: anahtar -> (hedef TelemetryData alanları, dönüştürücü)
+# Çoklu alanlarda dönüştürücü bir tuple döndürür; None olan değerler atlanır.
+LORA_FIELDS = {
+    'ALT': ('altitude', _lora_number),
+    'maxALT': ('max_altitude', _lora_number),
+    'dY': ('delta_y', _lora_number),
+    'F': ('fired', _lora_flag),  # Eski format için geriye uyumluluk
+    'P1': ('p1', _lora_flag),
+    'P2': ('p2', _lora_flag),
+    'gX': ('gyro_x', _lora_number),
+    'gY': ('gyro_y', _lora_number),
+    'gZ': ('gyro_z', _lora_number),
+    'aX': ('accel_x', _lora_number),
+    'aY': ('accel_y', _lora_number),
+    'aZ': ('accel_z', _lora_number),
+    'pitch': ('pitch', _lora_number),
+    'GPS': (('gps_latitude', 'gps_longitude', 'gps_valid'), _lora_gps),
+    'GPS_ALT': ('gps_altitude', _lora_number),
+}
+
+# Payload satır ön ekleri -> işleyici metot. Satırın ilk 3 karakteriyle aday
+# listesi bulunur, adaylar startswith ile sırayla denenir. İşleyici satırı
+# updates sözlüğüne çözer ve /metrics için format adını döndürür.
+PAYLOAD_PREFIXES = (
+    ('PAYLOAD_GPS fix ', '_parse_payload_fix'),
+    ('PAYLOAD_GPS nofix ', '_parse_payload_nofix'),
+    ('PAYLOAD_GPS:', '_parse_payload_legacy'),
+    ('$GPGGA', '_parse_payload_nmea'),
+    ('ALL=', '_parse_payload_liquid'),
+    ('ALL:', '_parse_payload_liquid'),
+    ('gX(', '_parse_payload_gyro'),
+    ('gY(', '_parse_payload_gyro'),
+    ('gZ(', '_parse_payload_gyro'),
+    ('GPS:', '_parse_payload_fields'),
+    ('PL_', '_parse_payload_fields'),
+)
+
+# Ön ekten önce gürültü olan satırlarda bilinen ön ekin yeri (yalnızca tanınmayan satırlarda)
+PAYLOAD_PREFIX_SEARCH = re.compile(r'PAYLOAD_GPS[ :]|\$GPGGA|ALL[=:]|g[XYZ]\(|(?:PL_)?GPS:')
+PAYLOAD_FIX = re.compile(r'PAYLOAD_GPS fix ([\d.-]+) ([\d.-]+) ([\d.-]+)')
+PAYLOAD_NOFIX_LABELED = re.compile(r'PAYLOAD_GPS nofix lat=([\d.-]+), lon=([\d.-]+), alt=([\d.-]+) m')
+PAYLOAD_NOFIX = re.compile(r'PAYLOAD_GPS nofix ([\d.-]+) ([\d.-]+) ([\d.-]+)')
+PAYLOAD_LEGACY = re.compile(r'PAYLOAD_GPS:([\d.-]+),([\d.-]+),([\d.-]+)')
+PAYLOAD_FIELDS_GPS = re.compile(r'GPS:([\d.-]+),([\d.-]+)')
+PAYLOAD_FIELDS_ALT = re.compile(r'GPS_ALT:([\d.-]+)')
+PAYLOAD_GYRO = re.compile(r'gX\(roll\)=([\d.-]+) gY\(pitch\)=([\d.-]+) gZ\(yaw\)=([\d.-]+)')
+PAYLOAD_GYRO_AXES = (
+    ('payload_gyro_x', re.compile(r'gX\(roll\)=([\d.-]+)')),
+    ('payload_gyro_y', re.compile(r'gY\(pitch\)=([\d.-]+)')),
+    ('payload_gyro_z', re.compile(r'gZ\(yaw\)=([\d.-]+)')),
+)
+
+# Kademe linkinde yalnızca konum formatları
+STAGE_PREFIXES = tuple(entry for entry in PAYLOAD_PREFIXES
+                       if entry[1] not in ('_parse_payload_gyro', '_parse_payload_liquid'))
+
+# Payload parser'ı çıktısının yazıldığı bölümler:
+# bölüm -> (alan eşlemesi veya None, paket sayacı, son güncelleme alanı, log adı)
+PAYLOAD_SECTIONS = {
+    'payload': (None, 'payload_packet_count', 'payload_last_update', 'Payload'),
+    'stage': ({
+        'payload_latitude': 'stage_latitude',
+        'payload_longitude': 'stage_longitude',
+        'payload_gps_altitude': 'stage_gps_altitude',
+        'payload_gps_valid': 'stage_gps_valid',
+    }, 'stage_packet_count', 'stage_last_update', 'Kademe'),
+}
+PAYLOAD_POSITION_FIELDS = ('payload_latitude', 'payload_longitude', 'payload_gps_altitude')
+
+
+STAGE_FIELDS = ('stage_gps_altitude', 'stage_latitude', 'stage_longitude', 'stage_gps_valid', 'stage_packet_count')
+
+
+def flight_tables() -> list:
+    """Uçuş veritabanı tabloları (her oturum için yeni)"""
+    telemetry_fields = fields(TelemetryData)
+    return [
+        telemetry_table('rocket', telemetry_fields, ROCKET_HISTORY_FIELDS + ('packet_count',)),
+        telemetry_table('payload', telemetry_fields, PAYLOAD_HISTORY_FIELDS + ('payload_packet_count',)),
+        telemetry_table('stage', telemetry_fields, STAGE_FIELDS),
+        Table('liquid', [('levels', f'{LIQUID_SENSORS}s')], getter=lambda levels: (levels,)),
+        Table('hyi', [('packet', f'{HYI_PACKET_SIZE}s')], getter=lambda packet: (packet,)),
+    ]
+
 
 class TEKNOFESTGroundStation:
     """TEKNOFEST Yer İstasyonu Ana Sınıfı"""
     
     def __init__(self):
-        self.lora_connection: Optional[serial.Serial] = None
-        self.payload_gps_connection: Optional[serial.Serial] = None
         self.hyi_connection: Optional[serial.Serial] = None
+        self.metrics: Optional[MetricsRegistry] = None
 
         self.running = False
         self.telemetry = TelemetryData()
@@ -67,35 +248,239 @@ class TEKNOFESTGroundStation:
         self.team_id = 68
         self.auto_send = True
         self.last_hyi_send = 0
+        self.hyi_rate = HYI_MAX_RATE
+        self.hyi_scheduler: Optional[HyiScheduler] = None
+        self._hyi_lock = threading.Lock()
+        self.hyi_packer = HyiPacketBuilder()
+        self.recorder: Optional[FlightRecorder] = None
+        self.flight_db: Optional[FlightDatabase] = None
+        self.lora_fields = dict(LORA_FIELDS)
+        self._payload_unknown_logged = 0.0
+        
+        # Port bazında ilk byte -> parse edilmiş telemetri gecikmesi
+        self.latency = {}
+        
+        # Telemetri kaynakları (ad -> Link); LoRa ve Payload GPS her zaman kayıtlı,
+        # yedek alıcılar ve kademe GPS add_link ile eklenir
+        self.links: Dict[str, Link] = {}
+        self.arbiters: Dict[str, LinkArbiter] = {}  # Bölüm -> yedek linklerin hakemi
+        self.lora_link = self.add_link('lora', 'lora', channel=CHANNEL_LORA)
+        self.payload_link = self.add_link('payload', 'payload', channel=CHANNEL_PAYLOAD, latency_key='payload_gps')
+        self.lora_decoder = self.lora_link.decoder
+        self.lora_framer = self.lora_link.framer
+        self.payload_framer = self.payload_link.framer
+        self.payload_frames = self.payload_link.frames
+        # station_async ile çalışırken alıcılar ve HYİ zamanlayıcısı bu döngüde çalışır
+        self.event_loop = None
+        # Süreç izolasyonlu modda LoRa / Payload GPS alımı işçi süreçlerinde
+        self.ingest: Optional[IngestSupervisor] = None
         
-        # Log queue
-        self.log_queue = queue.Queue(maxsize=100)
+        # Uçuş boyunca tüm roket ve payload örnekleri
+        self.rocket_history = TelemetryHistory(ROCKET_HISTORY_FIELDS)
+        self.payload_history = TelemetryHistory(PAYLOAD_HISTORY_FIELDS)
+        # Tüm sıvı seviye çerçeveleri (delta/RLE kodlu) ve çalkalanma analizi
+        self.liquid_history = LiquidHistory()
         
+        # Sürümlü telemetri snapshot'ı (/api/telemetry ve /health için hazır JSON)
+        self.telemetry_version = 0
+        self._snapshot = (0, self.telemetry, None, None)
+        self._snapshot_lock = threading.Lock()
+        # Yalnızca yazıcılar (alıcı thread'leri) arasında; okuyucular kilit almaz
+        self._write_lock = threading.Lock()
+        
+        # Dashboard'lara SSE ile anlık yayın
+        self.stream = TelemetryBroadcaster()
+        
+        # Loglar kuyruğa kayıt olarak eklenir, arka plan thread'i formatlayıp dağıtır
+        self.log = StationLogger()
+        self.log.add_sink(ConsoleSink())
+        self.log_sink = self.log.add_sink(ApiSink())
+        self.log.start()
+        
+        # Sıcak yol sayaçları ve histogramları (/metrics ve /health)
+        self.metrics = MetricsRegistry()
+        self.register_metrics()
+        
+    @property
+    def lora_mode(self) -> str:
+        """Birincil LoRa linkinin modu: auto, text veya binary"""
+        return self.lora_link.mode
+    
+    @lora_mode.setter
+    def lora_mode(self, mode: str):
+        self.lora_link.mode = mode
+    
+    @property
+    def lora_connection(self) -> Optional[serial.Serial]:
+        return self.lora_link.connection
+    
+    @lora_connection.setter
+    def lora_connection(self, connection):
+        self.lora_link.connection = connection
+    
+    @property
+    def payload_gps_connection(self) -> Optional[serial.Serial]:
+        return self.payload_link.connection
+    
+    @payload_gps_connection.setter
+    def payload_gps_connection(self, connection):
+        self.payload_link.connection = connection
+    
+    @property
+    def lora_reader(self) -> Optional[SerialReader]:
+        return self.lora_link.reader
+    
+    @property
+    def payload_reader(self) -> Optional[SerialReader]:
+        return self.payload_link.reader
+    
+    def add_link(self, name: str, kind: str, section: str = None, channel: int = None,
+                 latency_key: str = None) -> Link:
+        """Kayıt defterine telemetri kaynağı ekle
+
+        kind: 'lora' veya 'payload' ('stage' = kademe bölümüne yazan payload linki).
+        channel verilmezse uçuş kaydında CHANNEL_LINKS'ten başlayan bir kanal alır.
+        Aynı bölüme bağlı birden fazla link olduğunda start_system onlara ortak
+        bir LinkArbiter atar.
+        """
+        if name in self.links:
+            raise ValueError(f"{name} linki zaten kayıtlı")
+        if kind == 'stage':
+            kind, section = 'payload', 'stage'
+        if channel is None:
+            channel = max([CHANNEL_LINKS - 1] + [link.channel for link in self.links.values()]) + 1
+        link = Link(name, kind, section, channel)
+        if kind == 'payload':
+            for prefix, handler in (PAYLOAD_PREFIXES if link.section == 'payload' else STAGE_PREFIXES):
+                link.dispatch.setdefault(prefix[:3], []).append((prefix, getattr(self, handler)))
+        self.links[name] = link
+        self.latency[latency_key or name] = link.latency
+        if self.metrics is not None:
+            self.register_link_metrics(link)
+            self._register_latency(latency_key or name, link.latency)
+        return link
+    
+    def _update_arbiters(self):
+        """Aynı bölüme bağlı birden fazla link varsa onlara ortak bir LinkArbiter ver"""
+        sections = {}
+        for link in self.links.values():
+            if link.connected:
+                sections.setdefault(link.section, []).append(link)
+        for link in self.links.values():
+            links = sections.get(link.section, ())
+            arbiter = None
+            if len(links) > 1:
+                arbiter = self.arbiters.get(link.section)
+                if arbiter is None:
+                    arbiter = self.arbiters[link.section] = LinkArbiter()
+                arbiter.links = links
+            link.arbiter = arbiter
+    
+    def register_metrics(self):
+        """Sayaç ve histogramları oluştur; başka nesnelerde tutulan sayıları okuma fonksiyonuyla bağla"""
+        metrics = self.metrics
+        for link in self.links.values():
+            self.register_link_metrics(link)
+
+        metrics.gauge_func('log_queue_depth', "Log yazıcısında bekleyen kayıtlar", lambda: len(self.log.records))
+        metrics.counter_func('log_dropped_total', "Kuyruk doluyken atılan log kayıtları", lambda: self.log.dropped)
+        metrics.gauge_func('recorder_queue_bytes', "Uçuş kaydında diske yazılmayı bekleyen byte",
+                           lambda: self.recorder.pending_bytes if self.recorder else 0)
+        metrics.gauge_func('liquid_history_bytes', "Sıvı seviye geçmişinin kodlanmış boyutu",
+                           lambda: self.liquid_history.snapshot()['bytes'])
+        metrics.gauge_func('recorder_queue_records', "Uçuş kaydında diske yazılmayı bekleyen kayıtlar",
+                           lambda: len(self.recorder.pending) if self.recorder else 0)
+        metrics.gauge_func('flight_db_pending_rows', "Uçuş veritabanında diske yazılmayı bekleyen satırlar",
+                           lambda: self.flight_db.pending_rows if self.flight_db else 0)
+        metrics.counter_func('flight_db_dropped_rows_total', "Kuyruk doluyken atılan veritabanı satırları (oturum başına)",
+                             lambda: self.flight_db.dropped_rows if self.flight_db else 0)
+
+        self._hyi_sent = metrics.counter('hyi_packets_sent_total', "HYİ'ye yazılan paketler")
+        dropped = metrics.counter_family('hyi_packets_dropped_total', "Gönderilemeyen HYİ paketleri (sebep)")
+        self._hyi_too_soon = dropped.labels(reason='too_soon')
+        self._hyi_no_connection = dropped.labels(reason='no_connection')
+        self._hyi_write_error = dropped.labels(reason='write_error')
+        self._hyi_write_time = metrics.histogram('hyi_write_seconds', "HYİ seri port yazma süresi")
+        self._hyi_interval = metrics.histogram('hyi_send_interval_seconds', "Ardışık HYİ gönderimleri arası süre")
+        self._hyi_jitter = metrics.histogram('hyi_scheduler_jitter_seconds', "HYİ zamanlayıcı tik gecikmesi")
+
+        for port, stats in self.latency.items():
+            self._register_latency(port, stats)
+
+        for port in ('lora', 'payload'):
+            worker = lambda port=port: self.ingest.workers[port]
+            metrics.counter_func('ingest_samples_total', "Alım işçisinden ana sürece aktarılan örnekler",
+                                 lambda worker=worker: worker().samples, port=port)
+            metrics.counter_func('ingest_lost_samples_total', "Ana süreç geride kaldığı için kaybolan örnekler",
+                                 lambda worker=worker: worker().lost, port=port)
+            metrics.counter_func('ingest_worker_restarts_total', "Yeniden başlatılan alım işçileri",
+                                 lambda worker=worker: worker().restarts, port=port)
+        
+        self.http_requests = metrics.counter_family('http_requests_total', "API istekleri (endpoint, durum)")
+        self.http_seconds = metrics.histogram_family('http_request_seconds', "API handler süresi (endpoint)")
+
+    def _register_latency(self, port: str, stats):
+        stats.histogram = self.metrics.histogram('telemetry_latency_seconds',
+                                                 "İlk byte'tan parse edilmiş telemetriye kadar geçen süre", port=port)
+    
+    def register_link_metrics(self, link: Link):
+        """Linkin port / ayırıcı sayaçlarını bağla ve parse sayaçlarını linke ata"""
+        metrics = self.metrics
+        port = link.name
+        metrics.counter_func('serial_bytes_read_total', "Seri porttan okunan byte (oturum başına)",
+                             lambda: link.reader.bytes_read if link.reader else 0, port=port)
+        metrics.counter_func('serial_reads_total', "Seri port read() turları (oturum başına)",
+                             lambda: link.reader.reads if link.reader else 0, port=port)
+        metrics.gauge_func('serial_input_queue_bytes', "Seri port giriş tamponunda bekleyen byte",
+                           lambda: link.connection.in_waiting if link.connected else 0, port=port)
+        framer = link.framer
+        metrics.counter_func('lines_framed_total', "Satır ayırıcının verdiği satırlar",
+                             lambda: framer.lines, port=port)
+        metrics.counter_func('framer_filtered_lines_total', "İşaretçi içermediği için atlanan satırlar",
+                             lambda: framer.rejected_lines, port=port)
+        metrics.counter_func('framer_dropped_bytes_total', "Sınırı aşan satırlardan atılan byte",
+                             lambda: framer.dropped_bytes, port=port)
+        metrics.counter_func('link_duplicate_samples_total', "Başka linkten daha önce gelmiş örnekler",
+                             lambda: link.duplicates, port=port)
+        metrics.counter_func('link_stale_samples_total', "Son kabul edilenden eski sıra numaralı çerçeveler",
+                             lambda: link.stale, port=port)
+        metrics.counter_func('link_missed_samples_total', "Yedek linklerin aldığı ama bu linkin alamadığı örnekler",
+                             lambda: link.missed, port=port)
+        metrics.gauge_func('link_quality', "Linkin teslim oranı (üstel ortalama, yedek link yoksa 1)",
+                           lambda: link.quality, port=port)
+        
+        parsed_help = "Telemetri güncellemesi üreten satır/çerçeveler"
+        rejected_help = "Parse edilemeyen veya veri içermeyen satır/çerçeveler"
+        parsed = metrics.counter_family('lines_parsed_total', parsed_help)
+        rejected = metrics.counter_family('lines_rejected_total', rejected_help)
+        parse_seconds = metrics.histogram_family('parse_seconds', "Satır/çerçeve başına parse süresi")
+        link.text_parse_time = parse_seconds.labels(port=port, format='text')
+        link.binary_parse_time = parse_seconds.labels(port=port, format='binary')
+        if link.kind == 'lora':
+            link.parsed = parsed.labels(port=port, format='text')
+            link.rejected = rejected.labels(port=port, format='text')
+            # İkili çerçeve sayıları çözücüde tutulur
+            decoder = link.decoder
+            metrics.counter_func('lines_parsed_total', parsed_help, lambda: decoder.frames_ok, port=port, format='binary')
+            metrics.counter_func('lines_rejected_total', rejected_help, lambda: decoder.crc_errors + decoder.length_errors,
+                                 port=port, format='binary')
+        else:
+            link.parsed = {name: parsed.labels(port=port, format=name) for name in PAYLOAD_FORMATS}
+            link.rejected = {name: rejected.labels(port=port, format=name) for name in PAYLOAD_FORMATS}
+            frames = link.frames
+            if frames:
+                metrics.counter_func('lines_parsed_total', parsed_help, lambda: frames.frames_ok,
+                                     port=port, format='liquid_binary')
+                metrics.counter_func('lines_rejected_total', rejected_help, lambda: frames.crc_errors,
+                                     port=port, format='liquid_binary')
+    
     def add_log(self, message):
-        """Log mesajı ekle"""
-        try:
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            log_entry = f"[{timestamp}] {message}"
-            self.log_queue.put(log_entry, block=False)
-            print(log_entry)
-        except queue.Full:
-            # Eski logları temizle
-            try:
-                for _ in range(10):
-                    self.log_queue.get_nowait()
-                self.log_queue.put(f"[{timestamp}] {message}", block=False)
-            except queue.Empty:
-                pass
+        """Log mesajı ekle (kategori: system)"""
+        self.log.info('system', message)
     
-    def get_logs(self):
-        """Son log mesajlarını al"""
-        logs = []
-        try:
-            while not self.log_queue.empty():
-                logs.append(self.log_queue.get_nowait())
-        except queue.Empty:
-            pass
-        return logs
+    def get_logs(self, after: int = None, limit: int = 100) -> dict:
+        """after imlecinden sonraki log mesajlarını al (kayıtlar silinmez)"""
+        return self.log_sink.read(after, limit)
     
     @staticmethod
     def get_available_ports() -> List[dict]:
@@ -115,11 +500,13 @@ class TEKNOFESTGroundStation:
             if self.lora_connection and self.lora_connection.is_open:
                 self.lora_connection.close()
             
-            self.lora_connection = serial.Serial(port, baudrate, timeout=1)
-            self.add_log(f"✅ LoRa bağlandı: {port} ({baudrate} baud)")
+            # serial_for_url: COM/tty adlarının yanında loop:// ve socket:// (simülatör) de açılır
+            self.lora_connection = serial.serial_for_url(port, baudrate, timeout=1)
+            self.lora_link.device = port
+            self.log.info('lora', "✅ LoRa bağlandı: %s (%s baud)", port, baudrate)
             return True
         except Exception as e:
-            self.add_log(f"❌ LoRa bağlantı hatası: {e}")
+            self.log.error('lora', "❌ LoRa bağlantı hatası: %s", e)
             return False
     
     def connect_payload_gps(self, port: str, baudrate: int = 9600) -> bool:
@@ -128,24 +515,25 @@ class TEKNOFESTGroundStation:
             if self.payload_gps_connection and self.payload_gps_connection.is_open:
                 self.payload_gps_connection.close()
             
-            self.payload_gps_connection = serial.Serial(port, baudrate, timeout=1)
+            self.payload_gps_connection = serial.serial_for_url(port, baudrate, timeout=1)
+            self.payload_link.device = port
             
             # Port ayarlarını kontrol et
-            self.add_log(f"✅ Payload GPS bağlandı: {port} ({baudrate} baud)")
-            self.add_log(f"🛰️ Port ayarları: {self.payload_gps_connection.get_settings()}")
+            self.log.info('payload', "✅ Payload GPS bağlandı: %s (%s baud)", port, baudrate)
+            self.log.debug('payload', "🛰️ Port ayarları: %s", self.payload_gps_connection.get_settings())
             
             # Test veri gönder (eğer port yazılabilirse)
             try:
                 if self.payload_gps_connection.writable():
-                    self.add_log("🛰️ Port yazılabilir durumda")
+                    self.log.debug('payload', "🛰️ Port yazılabilir durumda")
                 else:
-                    self.add_log("⚠️ Port yazılamıyor")
+                    self.log.warning('payload', "⚠️ Port yazılamıyor")
             except:
-                self.add_log("⚠️ Port yazma durumu kontrol edilemedi")
+                self.log.warning('payload', "⚠️ Port yazma durumu kontrol edilemedi")
             
             return True
         except Exception as e:
-            self.add_log(f"❌ Payload GPS bağlantı hatası: {e}")
+            self.log.error('payload', "❌ Payload GPS bağlantı hatası: %s", e)
             return False
     
     def connect_hyi(self, port: str) -> bool:
@@ -154,571 +542,725 @@ class TEKNOFESTGroundStation:
             if self.hyi_connection and self.hyi_connection.is_open:
                 self.hyi_connection.close()
                 
-            self.hyi_connection = serial.Serial(
-                port=port,
+            self.hyi_connection = serial.serial_for_url(
+                port,
                 baudrate=19200,
                 bytesize=8,
                 parity=serial.PARITY_NONE,
                 stopbits=1,
                 timeout=1
             )
-            self.add_log(f"✅ HYİ bağlandı: {port} (19200 baud)")
+            self.log.info('hyi', "✅ HYİ bağlandı: %s (19200 baud)", port)
             return True
         except Exception as e:
-            self.add_log(f"❌ HYİ bağlantı hatası: {e}")
+            self.log.error('hyi', "❌ HYİ bağlantı hatası: %s", e)
             return False
     
 
     
-    def parse_lora_data(self, data_str: str) -> bool:
-        """LoRa'dan gelen roket verilerini parse et"""
-        try:
-            # ALT:837.9m|maxALT:838.6m|dY:1.9|F:0|gX:-1.9|gY:-4.2|gZ:0.0|GPS:invalid
-            # veya GPS:39.925019,32.836954
-            
-            self.add_log(f"📡 Raw LoRa: {data_str}")
-            
-            # İrtifa (ALT)
-            alt_match = re.search(r'ALT:([\d.-]+)m', data_str)
-            if alt_match:
-                self.telemetry.altitude = float(alt_match.group(1))
-            
-            # Maksimum İrtifa (maxALT)
-            max_alt_match = re.search(r'maxALT:([\d.-]+)m', data_str)
-            if max_alt_match:
-                self.telemetry.max_altitude = float(max_alt_match.group(1))
-            
-            # Delta Y (dY)
-            dy_match = re.search(r'dY:([\d.-]+)', data_str)
-            if dy_match:
-                self.telemetry.delta_y = float(dy_match.group(1))
-            
-            # Fired (F) - Eski format için geriye uyumluluk
-            f_match = re.search(r'F:([01])', data_str)
-            if f_match:
-                self.telemetry.fired = f_match.group(1) == '1'
-            
-            # P1 (Birincil Paraşüt)
-            p1_match = re.search(r'P1:([01])', data_str)
-            if p1_match:
-                self.telemetry.p1 = p1_match.group(1) == '1'
-            
-            # P2 (İkincil Paraşüt)
-            p2_match = re.search(r'P2:([01])', data_str)
-            if p2_match:
-                self.telemetry.p2 = p2_match.group(1) == '1'
-            
-            # Gyro X (gX)
-            gx_match = re.search(r'gX:([\d.-]+)', data_str)
-            if gx_match:
-                self.telemetry.gyro_x = float(gx_match.group(1))
-            
-            # Gyro Y (gY)
-            gy_match = re.search(r'gY:([\d.-]+)', data_str)
-            if gy_match:
-                self.telemetry.gyro_y = float(gy_match.group(1))
-            
-            # Gyro Z (gZ)
-            gz_match = re.search(r'gZ:([\d.-]+)', data_str)
-            if gz_match:
-                self.telemetry.gyro_z = float(gz_match.group(1))
-            
-            # Accel X (aX)
-            ax_match = re.search(r'aX:([\d.-]+)', data_str)
-            if ax_match:
-                self.telemetry.accel_x = float(ax_match.group(1))
-            
-            # Accel Y (aY)
-            ay_match = re.search(r'aY:([\d.-]+)', data_str)
-            if ay_match:
-                self.telemetry.accel_y = float(ay_match.group(1))
-
-            # Accel Z (aZ)
-            az_match = re.search(r'aZ:([\d.-]+)', data_str)
-            if az_match:
-                self.telemetry.accel_z = float(az_match.group(1))
-
-            # Pitch (P)
-            pitch_match = re.search(r'pitch:([\d.-]+)', data_str)
-            if pitch_match:
-                self.telemetry.pitch = float(pitch_match.group(1))
-            
-            # Roket GPS kontrolü
-            if 'GPS:invalid' in data_str:
-                self.telemetry.gps_valid = False
-                self.telemetry.gps_altitude = 0.0
-                self.telemetry.gps_latitude = 0.0
-                self.telemetry.gps_longitude = 0.0
+    def register_lora_field(self, key: str, attrs, converter):
+        """LoRa satırına yeni bir KEY:değer alanı tanıt (regex gerektirmez)"""
+        if not isinstance(attrs, str) and len(attrs) == 1:
+            attrs = attrs[0]
+        self.lora_fields[key] = (attrs, converter)
+
+    def parse_lora_fields(self, data_str: str) -> dict:
+        """LoRa satırını tek geçişte parçala, güncellenecek alanları döndür
+
+        Kanonik satırlarda sonuç eski regex parser'ıyla aynıdır. Kanonik
+        olmayan girdide bilinçli farklar:
+            "ALT: 120.5 m", "dY: 1.9"  -> boşluklar atlanır, alan okunur (eski: okunmaz)
+            "dY:1e3"                   -> 1000.0 (eski: baştaki "1" -> 1.0)
+            "dY:nan", "dY:inf"         -> alan atlanır
+            "F:1x", "ALT:1.2.3m"       -> yalnızca o alan atlanır (eski: F=1 / tüm satır hata)
+            "xxALT:5m|..."             -> anahtar sonekten bulunur, ALT=5 (eski ile aynı)
+            "ALT:1m,dY:2"              -> virgül ayırıcı desteklenmez, alan çıkmaz
+        Hiç alan çıkmayan satırı parse_lora_data reddeder.
+        """
+        # ALT:837.9m|maxALT:838.6m|dY:1.9|F:0|gX:-1.9|gY:-4.2|gZ:0.0|GPS:invalid
+        updates = {}
+        fields = self.lora_fields
+        for token in data_str.split('|'):
+            key, _, value = token.partition(':')
+            entry = fields.get(key)
+            if entry is None:
+                entry = fields.get(key.strip()) or self._lora_field_by_suffix(key)
+                if entry is None:
+                    continue
+            attrs, converter = entry
+            try:
+                values = converter(value)
+            except ValueError:
+                continue  # Bozuk alan - diğer alanlar yine de işlenir
+            if attrs.__class__ is str:
+                updates[attrs] = values
             else:
-                gps_match = re.search(r'GPS:([\d.-]+),([\d.-]+)', data_str)
-                if gps_match:
-                    self.telemetry.gps_latitude = float(gps_match.group(1))
-                    self.telemetry.gps_longitude = float(gps_match.group(2))
-                    self.telemetry.gps_valid = True
-                    # GPS irtifa ayrı bir değişken olarak alınabilir
-                    alt_gps_match = re.search(r'GPS_ALT:([\d.-]+)', data_str)
-                    if alt_gps_match:
-                        self.telemetry.gps_altitude = float(alt_gps_match.group(1))
-            
-            self.telemetry.last_update = datetime.now().strftime("%H:%M:%S")
-            self.telemetry.packet_count += 1
-            
-            gps_status = f"{self.telemetry.gps_latitude:.6f},{self.telemetry.gps_longitude:.6f}" if self.telemetry.gps_valid else "INVALID"
-            parachute_status = f"P1={'AÇIK' if self.telemetry.p1 else 'KAPALI'}, P2={'AÇIK' if self.telemetry.p2 else 'KAPALI'}"
-            self.add_log(f"📊 Roket Telemetri: Alt={self.telemetry.altitude:.1f}m, GPS={gps_status}, Paraşüt={parachute_status}")
-            
+                for attr, val in zip(attrs, values):
+                    if val is not None:
+                        updates[attr] = val
+
+        # GPS irtifası yalnızca aynı satırda geçerli bir GPS konumu varsa kullanılır
+        gps_valid = updates.get('gps_valid')
+        if gps_valid is None:
+            updates.pop('gps_altitude', None)
+        elif not gps_valid:
+            updates['gps_altitude'] = 0.0
+        return updates
+
+    def _lora_field_by_suffix(self, key: str):
+        """Önünde gürültü olan anahtar (satır başındaki bozuk byte'lar): en uzun eşleşen sonek"""
+        key = key.rstrip()
+        name = max((name for name in self.lora_fields if key.endswith(name)), key=len, default=None)
+        return self.lora_fields[name] if name is not None else None
+
+    def parse_lora_data(self, data_str: str, link: Link = None) -> bool:
+        """LoRa'dan gelen roket verilerini parse et (yedek link varsa alanlar hakemden geçer)"""
+        try:
+            self.log.debug('lora', "📡 Raw LoRa: %s", data_str)
+            updates = self.parse_lora_fields(data_str)
+            if not updates:
+                self.log.debug('lora', "📡 LoRa satırında alan bulunamadı: %s", data_str)
+                return False
+            if link is not None and link.arbiter is not None:
+                link.arbiter.select(link, updates, link.framer.line_started_at)
+                if not updates:
+                    # Tüm alanlar diğer linkten daha taze geldi: örnek sayılmaz
+                    return True
+            self.apply_lora_updates(updates)
             return True
             
         except Exception as e:
-            self.add_log(f"❌ LoRa Parse hatası: {e} - Data: {data_str}")
+            self.log.error('lora', "❌ LoRa Parse hatası: %s - Data: %s", e, data_str)
             return False
+
+    def apply_lora_updates(self, updates: dict):
+        """Metin veya ikili çerçeveden çözülen roket verisini telemetriye işle"""
+        updates['last_update'] = clock_text()
+        telemetry = self.update_telemetry(updates, counter='packet_count')
+        self.rocket_history.append(telemetry)
+        flight_db = self.flight_db
+        if flight_db:
+            flight_db.record('rocket', telemetry)
+        
+        if self.log.enabled(INFO, 'lora'):
+            gps_status = f"{telemetry.gps_latitude:.6f},{telemetry.gps_longitude:.6f}" if telemetry.gps_valid else "INVALID"
+            self.log.info('lora', "📊 Roket Telemetri: Alt=%.1fm, GPS=%s, Paraşüt=P1=%s, P2=%s", telemetry.altitude, gps_status,
+                          'AÇIK' if telemetry.p1 else 'KAPALI', 'AÇIK' if telemetry.p2 else 'KAPALI')
+
+    def update_telemetry(self, updates: dict, counter: str = None) -> TelemetryData:
+        """Güncellemelerle yeni bir telemetri örneği oluştur ve tek referans değişimiyle yayınla
+
+        counter verilirse o sayaç alanı da aynı atomik adımda bir artırılır.
+        Yayınlanan yeni örneği döndürür.
+        """
+        with self._write_lock:
+            current = self.telemetry
+            if counter:
+                updates[counter] = getattr(current, counter) + 1
+            telemetry = current.evolve(updates) if updates else current
+            self.telemetry_version += 1
+            version = self.telemetry_version
+            self.telemetry = telemetry
+        self.commit_telemetry(telemetry, version, updates.keys())
+        return telemetry
+
+    def commit_telemetry(self, telemetry: TelemetryData, version: int, changed=None):
+        """Yeni örneği snapshot'a koy ve yayınla (changed: değişen alan adları)
+
+        Sözlük ve JSON burada üretilmez: snapshot ilk okuyucuda, SSE farkı ilk
+        uyanan istemcide çıkarılır; okuyucular arasındaki örnekler birleşir.
+        """
+        with self._snapshot_lock:
+            # İki alıcı thread'i sırayı değiştirse de eski sürüm yenisinin üzerine yazılmaz
+            if version > self._snapshot[0]:
+                self._snapshot = (version, telemetry, None, None)
+        if changed is not None and 'liquid_levels' in changed:
+            changed = changed | {'all_liquid_data'}
+        self.stream.publish(telemetry.to_dict, version, changed)
+
+    def apply_ingest_sample(self, updates: dict):
+        """Alım işçisinin yayınladığı değişen alanları bu süreçteki telemetriye işle
+
+        Geçmişler işçideki koşullarla güncellenir: paket sayacı artan örnek
+        roket / payload geçmişine, her sıvı seviye çerçevesi sıvı geçmişine eklenir.
+        """
+        telemetry = self.update_telemetry(updates)
+        flight_db = self.flight_db
+        if 'packet_count' in updates:
+            self.rocket_history.append(telemetry)
+            if flight_db:
+                flight_db.record('rocket', telemetry)
+        if 'payload_packet_count' in updates:
+            self.payload_history.append(telemetry)
+            if flight_db:
+                flight_db.record('payload', telemetry)
+        if 'stage_packet_count' in updates and flight_db:
+            flight_db.record('stage', telemetry)
+        if 'liquid_levels' in updates:
+            self.record_liquid(updates['liquid_levels'])
+
+    def start_ingest_workers(self, ports: dict, record: bool):
+        """LoRa / Payload GPS portlarını kendi süreçlerinde okuyan işçileri başlat"""
+        self.ingest = IngestSupervisor(
+            [(field.name, field.default) for field in fields(TelemetryData)], self.apply_ingest_sample, self.log,
+            lora_mode=self.lora_mode, log_level=self.log.level, record=record,
+        )
+        self.ingest.start(ports)
+    
+    def telemetry_snapshot(self):
+        """(sürüm, veri, JSON bytes) döndür
+
+        JSON yalnızca yeni bir örnek işlendikten sonraki ilk istekte üretilir,
+        aynı sürüm için tüm istekler hazır byte'ları paylaşır.
+        """
+        snapshot = self._snapshot
+        if snapshot[3] is None:
+            with self._snapshot_lock:
+                snapshot = self._snapshot
+                if snapshot[3] is None:
+                    version, telemetry, _, _ = snapshot
+                    data = telemetry.to_dict()
+                    snapshot = (version, telemetry, data, json.dumps(data, separators=(',', ':')).encode())
+                    self._snapshot = snapshot
+        return snapshot[0], snapshot[2], snapshot[3]
+
+    def handle_lora_chunk(self, raw: bytes, received_at: float = None, link: Link = None):
+        """LoRa portundan okunan byte'ları işle
+
+        auto modunda ilk geçerli ikili çerçeve veya metin satırı portun modunu belirler.
+        Yedek link varsa örnekler önce bölümün hakeminden geçer: başka linkten
+        gelmiş olanlar parse edilmeden atlanır.
+        """
+        if received_at is None:
+            received_at = time.monotonic()
+        if link is None:
+            link = self.lora_link
+        latency = link.latency
+
+        if link.mode != "text":
+            decoder = link.decoder
+            frame_start = received_at if not decoder.buffer else link.frame_start
+            parse_start = time.perf_counter()
+            frames = decoder.feed(raw)
+            if frames:
+                if link.mode == "auto":
+                    link.mode = "binary"
+                    self.log.info('lora', "📡 %s ikili çerçeve modu algılandı", link.name)
+                    link.framer.reset()
+                arbiter = link.arbiter
+                for seq, updates in frames:
+                    if arbiter is not None:
+                        if not arbiter.admit(link, seq, frame_start):
+                            continue
+                        arbiter.select(link, updates, frame_start)
+                        if not updates:
+                            continue
+                    self.apply_lora_updates(updates)
+                    latency.record(time.monotonic() - frame_start)
+                    frame_start = received_at
+                link.binary_parse_time.observe((time.perf_counter() - parse_start) / len(frames))
+            link.frame_start = frame_start
+            if link.mode == "binary":
+                return
+
+        # Satır sonları ile verileri ayır (yalnızca ALT: içeren satırlar decode edilir)
+        framer = link.framer
+        parse_time = link.text_parse_time
+        arbiter = link.arbiter
+        for raw_line in framer.feed(raw, received_at):
+            line = str(raw_line, 'utf-8', 'ignore').strip()
+            if not line:
+                continue
+            if arbiter is not None and not arbiter.admit(link, line, framer.line_started_at):
+                continue
+            parse_start = time.perf_counter()
+            parsed = self.parse_lora_data(line, link)
+            parse_time.observe(time.perf_counter() - parse_start)
+            if parsed:
+                link.parsed.inc()
+                latency.record(time.monotonic() - framer.line_started_at)
+                if link.mode == "auto":
+                    link.mode = "text"
+                    link.decoder.reset()
+                    self.log.info('lora', "📡 %s metin modu algılandı", link.name)
+            else:
+                link.rejected.inc()
+
+    def handle_payload_chunk(self, raw: bytes, received_at: float = None, link: Link = None):
+        """Payload GPS (veya kademe GPS) portundan okunan byte'ları işle"""
+        if received_at is None:
+            received_at = time.monotonic()
+        if link is None:
+            link = self.payload_link
+        
+        # Debug: Gelen ham veriyi log'la
+        if self.log.enabled(DEBUG, 'payload') and raw.strip():
+            self.log.debug('payload', "🛰️ Raw %s Data: %r", link.name, raw.decode('utf-8', errors='ignore'))
+        
+        # Satırların arasına gömülü ikili sıvı seviye çerçeveleri (yalnızca payload bölümünde)
+        text = raw
+        if link.frames:
+            text, frames = link.frames.feed(raw)
+            for frame in frames:
+                parse_start = time.perf_counter()
+                seq, levels = LIQUID_FRAME.unpack(frame)
+                if link.arbiter is not None and not link.arbiter.admit(link, seq, received_at):
+                    continue
+                self.apply_liquid_levels(levels, "ikili", received_at=received_at)
+                link.binary_parse_time.observe(time.perf_counter() - parse_start)
+                link.latency.record(time.monotonic() - received_at)
+        
+        # Satır sonları ile verileri ayır
+        framer = link.framer
+        parse_time = link.text_parse_time
+        arbiter = link.arbiter
+        for raw_line in framer.feed(text, received_at):
+            line = str(raw_line, 'utf-8', 'ignore').strip()
+            if line:
+                self.log.debug('payload', "🛰️ %s Line: %s", link.name, line)
+                if arbiter is not None and not arbiter.admit(link, line, framer.line_started_at):
+                    continue
+                parse_start = time.perf_counter()
+                parsed = self.parse_payload_gps_data(line, link, framer.line_started_at)
+                parse_time.observe(time.perf_counter() - parse_start)
+                if parsed:
+                    link.latency.record(time.monotonic() - framer.line_started_at)
+
+    def _link_idle(self, link: Link):
+        """Payload / kademe portu sessizken port durumunu 10 saniyede bir log'la"""
+        now = time.monotonic()
+        if now - link.last_status >= 10:
+            link.last_status = now
+            connection = link.connection
+            if connection and connection.is_open:
+                self.log.debug('payload', "🛰️ %s port durumu: %s, in_waiting: %s", link.name, connection.port, connection.in_waiting)
     
-    def parse_all_liquid_data(self, data_str: str) -> bool:
-        """ALL sıvı seviye verisini parse et"""
+    def parse_all_liquid_data(self, data_str: str, updates: dict = None, received_at: float = None) -> bool:
+        """ALL sıvı seviye verisini parse et
+
+        updates verilirse sonuç bu sözlüğe yazılır (çağıran tek seferde yayınlar),
+        verilmezse telemetri doğrudan güncellenir. received_at sıvı geçmişindeki
+        zaman damgasıdır (verilmezse şu an).
+        """
         try:
-            # Yeni format: ALL=000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000
-            # Eski format: ALL:1010101010101010... formatında gelen veri (192-bit)
-            
-            binary_data = None
-            format_type = None
-            
-            # Yeni format kontrolü
-            all_new_match = re.search(r'ALL=([01]{192})', data_str)
-            if all_new_match:
-                binary_data = all_new_match.group(1)
-                format_type = "yeni"
-            
-            # Eski format kontrolü
-            if not binary_data:
-                all_old_match = re.search(r'ALL:([01]{192})', data_str)
-                if all_old_match:
-                    binary_data = all_old_match.group(1)
-                    format_type = "eski"
-            
-            if binary_data:
-                # Veriyi kontrol et - eğer tümü 0 ise bir önceki veriyi koru
-                if binary_data == '0' * 192:
-                    self.add_log(f"⚠️ Sıvı seviye verisi full 0 - önceki veri korunuyor")
-                    return True  # Önceki veriyi koruyarak başarılı dön
-                
-                # 192-bit'i 24 adet 8-bit'e böl
-                levels = []
-                for i in range(24):
-                    start_bit = i * 8
-                    end_bit = start_bit + 8
-                    byte_str = binary_data[start_bit:end_bit]
-                    level = int(byte_str, 2)  # Binary to decimal
-                    levels.append(level)
-                
-                # Tüm level değerleri 0 ise (yine de kontrol et)
-                if all(level == 0 for level in levels):
-                    self.add_log(f"⚠️ Tüm sensör seviyeleri 0 - önceki veri korunuyor")
-                    return True  # Önceki veriyi koruyarak başarılı dön
-                
-                # Geçerli veri var, güncelle
-                self.telemetry.all_liquid_data = binary_data
-                self.telemetry.liquid_levels = levels
-                
-                # Log'da ilk birkaç sensörün değerini göster
-                sample_levels = levels[:5] if len(levels) >= 5 else levels
-                self.add_log(f"🌊 Sıvı seviye verisi ({format_type} format): {len(levels)} sensör, Örnek: {sample_levels}, Raw: {binary_data[:20]}...")
-                return True
+            # Yeni format: ALL=<192 bit>, eski format: ALL:<192 bit>
+            levels, format_type = find_liquid_levels(data_str)
+            if levels is not None:
+                return self.apply_liquid_levels(levels, format_type, updates, received_at)
                 
         except Exception as e:
-            self.add_log(f"❌ ALL parse hatası: {e}")
+            self.log.error('liquid', "❌ ALL parse hatası: %s", e)
             return False
         
         # Veri bulunamadı veya geçersiz format
         if 'NA' in data_str or 'na' in data_str.lower():
-            self.add_log(f"⚠️ Sıvı seviye verisi NA - önceki veri korunuyor")
+            self.log.warning('liquid', "⚠️ Sıvı seviye verisi NA - önceki veri korunuyor")
             return True  # Önceki veriyi koruyarak başarılı dön
         
         return False
 
-    def parse_payload_gps_data(self, data_str: str) -> bool:
-        """Payload GPS'den gelen veriyi parse et"""
+    def apply_liquid_levels(self, levels: bytes, format_type: str, updates: dict = None,
+                            received_at: float = None) -> bool:
+        """24 byte'lık sıvı seviyelerini telemetriye işle (metin veya ikili çerçeveden)"""
+        # Veriyi kontrol et - eğer tümü 0 ise bir önceki veriyi koru
+        if levels == EMPTY_LEVELS:
+            self.log.warning('liquid', "⚠️ Sıvı seviye verisi full 0 - önceki veri korunuyor")
+            return True  # Önceki veriyi koruyarak başarılı dön
+        
+        # Geçerli veri var, güncelle (updates verildiyse geçmişe çağıran işler)
+        liquid = {'liquid_levels': levels}
+        if updates is None:
+            self.update_telemetry(liquid)
+            self.record_liquid(levels, received_at)
+        else:
+            updates.update(liquid)
+        
+        # Log'da ilk birkaç sensörün değerini göster
+        if self.log.enabled(INFO, 'liquid'):
+            self.log.info('liquid', "🌊 Sıvı seviye verisi (%s format): %d sensör, Örnek: %s, Raw: %s...",
+                          format_type, len(levels), list(levels[:5]), liquid_json_fields(levels)[0][:20])
+        return True
+
+    def record_liquid(self, levels: bytes, received_at: float = None):
+        """Sıvı seviye çerçevesini geçmişe ve uçuş veritabanına yaz
+
+        received_at çerçevenin geliş zamanıdır (monotonic; oynatmada kayıt
+        zamanı), analiz penceresi bu zamana göre kayar.
+        """
+        self.liquid_history.append(levels, received_at)
+        flight_db = self.flight_db
+        if flight_db:
+            flight_db.record('liquid', levels)
+
+    def parse_payload_gps_data(self, data_str: str, link: Link = None, received_at: float = None) -> bool:
+        """Payload satırını ön ekine göre tek bir işleyiciye yönlendir ve telemetriye işle
+
+        Payload format örnekleri:
+            "PAYLOAD_GPS nofix lat=11.111110, lon=22.222219, alt=0.0 m" (etiketli)
+            "PAYLOAD_GPS fix 38.388019 33.742263 924.4"
+            "PAYLOAD_GPS:39.925019,32.836954,850.5" (eski format)
+            "$GPGGA,123519,4807.038,N,01131.324,E,1,08,0.9,545.4,M,46.9,M,,*42"
+            "gX(roll)=102.4 gY(pitch)=-8.4 gZ(yaw)=-39.8"
+            "ALL=<192 bit>"
+        Konum formatlarının (fix / nofix / eski) sonuna eklenmiş gyro ve ALL
+        alanları da aynı satırdan çözülür; format adı konum formatınınkidir.
+        Satır, telemetri güncellemesi üretip üretmediğine göre formatıyla
+        birlikte lines_parsed_total / lines_rejected_total sayaçlarına işlenir.
+        Tanınmayan satırlar sayılır, log'a en fazla 10 saniyede bir yazılır.
+        Kademe linkinde yalnızca konum formatları tanınır ve kademe alanlarına yazılır.
+        received_at satırın geliş zamanıdır (sıvı geçmişi; verilmezse şu an).
+        """
+        if link is None:
+            link = self.payload_link
+        line_format = 'unknown'
         try:
-            # Payload GPS format örnekleri:
-            # "PAYLOAD_GPS nofix lat=11.111110, lon=22.222219, alt=0.0 m" (yeni format)
-            # "PAYLOAD_GPS:39.925019,32.836954,850.5" (eski format)
-            # "$GPGGA,123519,4807.038,N,01131.324,E,1,08,0.9,545.4,M,46.9,M,,*42"
-            # "PL_ALT:850.5|PL_LAT:39.925019|PL_LON:32.836954"
-            
-            self.add_log(f"🛰️ Parsing Payload GPS: {data_str}")
-            
-            # Format 1: PAYLOAD_GPS nofix lat=11.111110, lon=22.222219, alt=0.0 m (etiketli format)
-            payload_nofix_match = re.search(r'PAYLOAD_GPS nofix lat=([\d.-]+), lon=([\d.-]+), alt=([\d.-]+) m', data_str)
-            if payload_nofix_match:
-                self.telemetry.payload_latitude = float(payload_nofix_match.group(1))
-                self.telemetry.payload_longitude = float(payload_nofix_match.group(2))
-                self.telemetry.payload_gps_altitude = float(payload_nofix_match.group(3))
-                self.telemetry.payload_gps_valid = False  # nofix = invalid
-                self.add_log(f"🛰️ Format nofix matched: lat={self.telemetry.payload_latitude}, lon={self.telemetry.payload_longitude}, alt={self.telemetry.payload_gps_altitude} (NOFIX)")
-
-            # Format 1b: PAYLOAD_GPS fix 38.388019 33.742263 924.4 (etiket olmadan)
-            elif re.search(r'PAYLOAD_GPS fix [\d.-]+ [\d.-]+ [\d.-]+', data_str):
-                payload_fix_match = re.search(r'PAYLOAD_GPS fix ([\d.-]+) ([\d.-]+) ([\d.-]+)', data_str)
-                if payload_fix_match:
-                    self.telemetry.payload_latitude = float(payload_fix_match.group(1))
-                    self.telemetry.payload_longitude = float(payload_fix_match.group(2))
-                    self.telemetry.payload_gps_altitude = float(payload_fix_match.group(3))
-                    self.telemetry.payload_gps_valid = True  # fix = valid
-                    self.add_log(f"🛰️ Format fix matched: lat={self.telemetry.payload_latitude}, lon={self.telemetry.payload_longitude}, alt={self.telemetry.payload_gps_altitude} (FIX)")
-
-            # Format 1c: PAYLOAD_GPS nofix 11.111110 22.222219 0.0 (etiket olmadan)
-            elif re.search(r'PAYLOAD_GPS nofix [\d.-]+ [\d.-]+ [\d.-]+', data_str):
-                payload_nofix_simple_match = re.search(r'PAYLOAD_GPS nofix ([\d.-]+) ([\d.-]+) ([\d.-]+)', data_str)
-                if payload_nofix_simple_match:
-                    self.telemetry.payload_latitude = float(payload_nofix_simple_match.group(1))
-                    self.telemetry.payload_longitude = float(payload_nofix_simple_match.group(2))
-                    self.telemetry.payload_gps_altitude = float(payload_nofix_simple_match.group(3))
-                    self.telemetry.payload_gps_valid = False  # nofix = invalid
-                    self.add_log(f"🛰️ Format nofix simple matched: lat={self.telemetry.payload_latitude}, lon={self.telemetry.payload_longitude}, alt={self.telemetry.payload_gps_altitude} (NOFIX)")
-
-            # Format 2: PAYLOAD_GPS:lat,lon,alt (eski format)
-            elif re.search(r'PAYLOAD_GPS:([\d.-]+),([\d.-]+),([\d.-]+)', data_str):
-                payload_match = re.search(r'PAYLOAD_GPS:([\d.-]+),([\d.-]+),([\d.-]+)', data_str)
-                if payload_match:
-                    self.telemetry.payload_latitude = float(payload_match.group(1))
-                    self.telemetry.payload_longitude = float(payload_match.group(2))
-                    self.telemetry.payload_gps_altitude = float(payload_match.group(3))
-                    self.telemetry.payload_gps_valid = True
-                    self.add_log(f"🛰️ Format 2 matched: lat={self.telemetry.payload_latitude}, lon={self.telemetry.payload_longitude}, alt={self.telemetry.payload_gps_altitude}")
-
-            # Format 3: Ayrı ayrı değerler
-            else:
-                # Payload LAT LON
-                pl_gps_match = re.search(r'GPS:([\d.-]+),([\d.-]+)', data_str)
-                if pl_gps_match:
-                    self.telemetry.payload_latitude = float(pl_gps_match.group(1))
-                    self.telemetry.payload_longitude = float(pl_gps_match.group(2))
-                
-                # Payload ALT
-                pl_gps_alt_match = re.search(r'GPS_ALT:([\d.-]+)', data_str)
-                if pl_gps_alt_match:
-                    self.telemetry.payload_gps_altitude = float(pl_gps_alt_match.group(1))
-                    
-                # GPS valid kontrolü
-                if any([pl_gps_match, pl_gps_alt_match]):
-                    self.telemetry.payload_gps_valid = True
-                    self.add_log(f"🛰️ Format 3 valid: lat={self.telemetry.payload_latitude}, lon={self.telemetry.payload_longitude}, alt={self.telemetry.payload_gps_altitude}")
-
-            # Format 4: NMEA formatı (GPGGA)
-            if data_str.startswith('$GPGGA'):
-                try:
-                    parts = data_str.split(',')
-                    if len(parts) >= 15 and parts[2] and parts[4] and parts[9]:
-                        # Latitude dönüştürme (DDMM.MMMMM -> DD.DDDDDD)
-                        lat_raw = float(parts[2])
-                        lat_deg = int(lat_raw / 100)
-                        lat_min = lat_raw - (lat_deg * 100)
-                        latitude = lat_deg + (lat_min / 60)
-                        if parts[3] == 'S':
-                            latitude = -latitude
-                        
-                        # Longitude dönüştürme (DDDMM.MMMMM -> DDD.DDDDDD)
-                        lon_raw = float(parts[4])
-                        lon_deg = int(lon_raw / 100)
-                        lon_min = lon_raw - (lon_deg * 100)
-                        longitude = lon_deg + (lon_min / 60)
-                        if parts[5] == 'W':
-                            longitude = -longitude
-                        
-                        # Altitude
-                        altitude = float(parts[9])
-                        
-                        self.telemetry.payload_latitude = latitude
-                        self.telemetry.payload_longitude = longitude
-                        self.telemetry.payload_gps_altitude = altitude
-                        self.telemetry.payload_gps_valid = True
-                        self.add_log(f"🛰️ NMEA format matched: lat={latitude}, lon={longitude}, alt={altitude}")
-                        
-                except (ValueError, IndexError):
-                    self.add_log(f"❌ NMEA parse hatası: {data_str}")
-                    
-            # Invalid durumu kontrolü (sadece GPS:invalid için)
-            if 'GPS:invalid' in data_str:
-                self.telemetry.payload_gps_valid = True
-                # nofix durumunda koordinatları sıfırlama, sadece valid flag'ini false yap
-            
-            # Payload gyro verilerini parse et
-            # gX(roll)=102.4 gY(pitch)=-8.4 gZ(yaw)=-39.8 formatı
-            self.add_log(f"🛰️ Payload gyro parse denemesi: {data_str}")
-            
-            payload_gx_match = re.search(r'gX\(roll\)=([\d.-]+)', data_str)
-            if payload_gx_match:
-                self.telemetry.payload_gyro_x = float(payload_gx_match.group(1))
-                self.add_log(f"🛰️ Payload Gyro X parsed: {self.telemetry.payload_gyro_x}")
-            else:
-                self.add_log(f"🛰️ Payload Gyro X match bulunamadı")
-            
-            payload_gy_match = re.search(r'gY\(pitch\)=([\d.-]+)', data_str)
-            if payload_gy_match:
-                self.telemetry.payload_gyro_y = float(payload_gy_match.group(1))
-                self.add_log(f"🛰️ Payload Gyro Y parsed: {self.telemetry.payload_gyro_y}")
-            else:
-                self.add_log(f"🛰️ Payload Gyro Y match bulunamadı")
-            
-            payload_gz_match = re.search(r'gZ\(yaw\)=([\d.-]+)', data_str)
-            if payload_gz_match:
-                self.telemetry.payload_gyro_z = float(payload_gz_match.group(1))
-                self.add_log(f"🛰️ Payload Gyro Z parsed: {self.telemetry.payload_gyro_z}")
-            else:
-                self.add_log(f"🛰️ Payload Gyro Z match bulunamadı")
-            
-            # Eğer gyro verisi parse edildiyse log'la
-            if payload_gx_match or payload_gy_match or payload_gz_match:
-                self.add_log(f"🛰️ Payload Gyro verileri parse edildi: X={self.telemetry.payload_gyro_x:.1f}, Y={self.telemetry.payload_gyro_y:.1f}, Z={self.telemetry.payload_gyro_z:.1f}")
-            
-            # Sıvı seviye verilerini de parse et (payload portundan geliyor)
-            self.parse_all_liquid_data(data_str)
-            
-            # Payload GPS verileri parse edildiyse (valid veya invalid olsun) güncelle
-            if (self.telemetry.payload_latitude != 0.0 or self.telemetry.payload_longitude != 0.0 or 
-                self.telemetry.payload_gps_altitude != 0.0):
-                self.telemetry.payload_last_update = datetime.now().strftime("%H:%M:%S")
-                self.telemetry.payload_packet_count += 1
-                
-                payload_status = f"{self.telemetry.payload_latitude:.6f},{self.telemetry.payload_longitude:.6f}"
-                #valid_status = "VALID" if self.telemetry.payload_gps_valid else "INVALID (NOFIX)"
-                valid_status = "VALID"
-                self.add_log(f"🛰️ Payload GPS: Alt={self.telemetry.payload_gps_altitude:.1f}m, Pos={payload_status}, Status={valid_status}")
-            else:
-                self.add_log(f"🛰️ Payload GPS parse edilemedi: {data_str}")
+            dispatch = link.dispatch
+            handler = self._payload_handler(data_str, dispatch)
+            if handler is None:
+                # Ön ekten önce gürültü olabilir
+                match = PAYLOAD_PREFIX_SEARCH.search(data_str)
+                if match:
+                    data_str = data_str[match.start():]
+                    handler = self._payload_handler(data_str, dispatch)
+            if handler is None:
+                self._payload_unknown(data_str, link)
+                return False
             
+            current = self.telemetry
+            updates = {}
+            line_format = handler(data_str, updates)
+            if updates and link.arbiter is not None:
+                link.arbiter.select(link, updates, link.framer.line_started_at)
+                if not updates:
+                    # Satır geçerliydi ama alanların hepsi diğer linkten daha taze geldi
+                    link.parsed[line_format].inc()
+                    return True
+            if 'liquid_levels' in updates and link.section == 'payload':
+                self.record_liquid(updates['liquid_levels'], received_at)
+            self._commit_payload(updates, current, data_str, link.section)
+            (link.parsed if updates else link.rejected)[line_format].inc()
             return True
             
         except Exception as e:
-            self.add_log(f"❌ Payload GPS Parse hatası: {e} - Data: {data_str}")
+            link.rejected[line_format].inc()
+            self.log.error('payload', "❌ Payload GPS Parse hatası: %s - Data: %s", e, data_str)
             return False
+
+    @staticmethod
+    def _payload_handler(line: str, dispatch: dict):
+        candidates = dispatch.get(line[:3])
+        if candidates:
+            for prefix, handler in candidates:
+                if line.startswith(prefix):
+                    return handler
+        return None
+
+    def _payload_unknown(self, line: str, link: Link):
+        counter = link.rejected['unknown']
+        counter.inc()
+        now = time.monotonic()
+        if now - self._payload_unknown_logged >= 10:
+            self._payload_unknown_logged = now
+            self.log.info('payload', "🛰️ Payload format tanınmadı (toplam %d satır), örnek: %s", counter.value, line)
+
+    def _commit_payload(self, updates: dict, current: TelemetryData, data_str: str, section: str = 'payload'):
+        """Payload GPS verileri parse edildiyse (valid veya invalid olsun) güncelle"""
+        fields, counter, last_update, label = PAYLOAD_SECTIONS[section]
+        names = PAYLOAD_POSITION_FIELDS
+        if fields:
+            updates = {fields[key]: value for key, value in updates.items() if key in fields}
+            names = tuple(fields[name] for name in names)
+        latitude = updates.get(names[0], getattr(current, names[0]))
+        longitude = updates.get(names[1], getattr(current, names[1]))
+        altitude = updates.get(names[2], getattr(current, names[2]))
+        if latitude != 0.0 or longitude != 0.0 or altitude != 0.0:
+            updates[last_update] = clock_text()
+            telemetry = self.update_telemetry(updates, counter=counter)
+            if section == 'payload':
+                self.payload_history.append(telemetry)
+            flight_db = self.flight_db
+            if flight_db:
+                flight_db.record(section, telemetry)
+            
+            #valid_status = "VALID" if telemetry.payload_gps_valid else "INVALID (NOFIX)"
+            valid_status = "VALID"
+            self.log.info('payload', "🛰️ %s GPS: Alt=%.1fm, Pos=%.6f,%.6f, Status=%s", label, altitude, latitude, longitude, valid_status)
+        else:
+            self.log.debug('payload', "🛰️ Payload GPS parse edilemedi: %s", data_str)
+            if updates:
+                self.update_telemetry(updates)
+
+    def _payload_position(self, match, updates: dict, valid: bool):
+        updates['payload_latitude'] = float(match.group(1))
+        updates['payload_longitude'] = float(match.group(2))
+        updates['payload_gps_altitude'] = float(match.group(3))
+        updates['payload_gps_valid'] = valid
+        self._payload_trailing(match.string, match.end(), updates)
+
+    def _payload_trailing(self, line: str, start: int, updates: dict):
+        """Konumdan sonra aynı satıra eklenmiş gyro / ALL alanlarını da çöz
+
+        Eski parser her satırda gyro ve sıvı seviyesini ayrıca arıyordu;
+        "PAYLOAD_GPS fix ... gX(roll)=..." gibi karma satırlar veri kaybetmesin
+        diye konum formatları satırın kalanına ucuz bir kontrol yapar.
+        """
+        if len(line) <= start:
+            return
+        rest = line[start:]
+        if '(' in rest:
+            self._payload_gyro_axes(rest, updates)
+        if 'ALL' in rest:
+            self.parse_all_liquid_data(rest, updates)
+
+    def _parse_payload_fix(self, line: str, updates: dict) -> str:
+        """PAYLOAD_GPS fix 38.388019 33.742263 924.4"""
+        match = PAYLOAD_FIX.match(line)
+        if match:
+            self._payload_position(match, updates, True)  # fix = valid
+            self.log.debug('payload', "🛰️ Format fix matched: lat=%s, lon=%s, alt=%s (FIX)", updates['payload_latitude'], updates['payload_longitude'], updates['payload_gps_altitude'])
+        return 'fix'
+
+    def _parse_payload_nofix(self, line: str, updates: dict) -> str:
+        """PAYLOAD_GPS nofix lat=11.111110, lon=22.222219, alt=0.0 m veya PAYLOAD_GPS nofix 11.111110 22.222219 0.0"""
+        line_format = 'nofix'
+        match = PAYLOAD_NOFIX_LABELED.match(line)
+        if match is None:
+            line_format = 'nofix_simple'
+            match = PAYLOAD_NOFIX.match(line)
+        if match:
+            self._payload_position(match, updates, False)  # nofix = invalid
+            self.log.debug('payload', "🛰️ Format %s matched: lat=%s, lon=%s, alt=%s (NOFIX)", line_format, updates['payload_latitude'], updates['payload_longitude'], updates['payload_gps_altitude'])
+        return line_format
+
+    def _parse_payload_legacy(self, line: str, updates: dict) -> str:
+        """PAYLOAD_GPS:lat,lon,alt (eski format)"""
+        match = PAYLOAD_LEGACY.match(line)
+        if match:
+            self._payload_position(match, updates, True)
+            self.log.debug('payload', "🛰️ Format 2 matched: lat=%s, lon=%s, alt=%s", updates['payload_latitude'], updates['payload_longitude'], updates['payload_gps_altitude'])
+        return 'legacy'
+
+    def _parse_payload_fields(self, line: str, updates: dict) -> str:
+        """GPS:lat,lon / GPS_ALT:alt ayrı alanları (PL_ ön ekli olabilir)"""
+        gps_match = PAYLOAD_FIELDS_GPS.search(line)
+        if gps_match:
+            updates['payload_latitude'] = float(gps_match.group(1))
+            updates['payload_longitude'] = float(gps_match.group(2))
+        alt_match = PAYLOAD_FIELDS_ALT.search(line)
+        if alt_match:
+            updates['payload_gps_altitude'] = float(alt_match.group(1))
+        # GPS valid kontrolü (GPS:invalid de geçerli sayılır; koordinatlar sıfırlanmaz)
+        if gps_match or alt_match or 'GPS:invalid' in line:
+            updates['payload_gps_valid'] = True
+            self.log.debug('payload', "🛰️ Format 3 valid: lat=%s, lon=%s, alt=%s", updates.get('payload_latitude'), updates.get('payload_longitude'), updates.get('payload_gps_altitude'))
+        return 'fields'
+
+    def _parse_payload_nmea(self, line: str, updates: dict) -> str:
+        """NMEA $GPGGA cümlesi"""
+        try:
+            parts = line.split(',')
+            if len(parts) >= 15 and parts[2] and parts[4] and parts[9]:
+                # Latitude dönüştürme (DDMM.MMMMM -> DD.DDDDDD)
+                lat_raw = float(parts[2])
+                lat_deg = int(lat_raw / 100)
+                lat_min = lat_raw - (lat_deg * 100)
+                latitude = lat_deg + (lat_min / 60)
+                if parts[3] == 'S':
+                    latitude = -latitude
+                
+                # Longitude dönüştürme (DDDMM.MMMMM -> DDD.DDDDDD)
+                lon_raw = float(parts[4])
+                lon_deg = int(lon_raw / 100)
+                lon_min = lon_raw - (lon_deg * 100)
+                longitude = lon_deg + (lon_min / 60)
+                if parts[5] == 'W':
+                    longitude = -longitude
+                
+                # Altitude
+                altitude = float(parts[9])
+                
+                updates['payload_latitude'] = latitude
+                updates['payload_longitude'] = longitude
+                updates['payload_gps_altitude'] = altitude
+                updates['payload_gps_valid'] = True
+                self.log.debug('payload', "🛰️ NMEA format matched: lat=%s, lon=%s, alt=%s", latitude, longitude, altitude)
+                
+        except (ValueError, IndexError):
+            self.log.error('payload', "❌ NMEA parse hatası: %s", line)
+        return 'nmea'
+
+    def _parse_payload_gyro(self, line: str, updates: dict) -> str:
+        """gX(roll)=102.4 gY(pitch)=-8.4 gZ(yaw)=-39.8 (eksik eksenler tek tek aranır)"""
+        match = PAYLOAD_GYRO.match(line)
+        if match:
+            updates['payload_gyro_x'] = float(match.group(1))
+            updates['payload_gyro_y'] = float(match.group(2))
+            updates['payload_gyro_z'] = float(match.group(3))
+        else:
+            self._payload_gyro_axes(line, updates)
+        if updates:
+            self.log.debug('payload', "🛰️ Payload Gyro verileri parse edildi: X=%s, Y=%s, Z=%s", updates.get('payload_gyro_x'), updates.get('payload_gyro_y'), updates.get('payload_gyro_z'))
+        return 'gyro'
+
+    @staticmethod
+    def _payload_gyro_axes(line: str, updates: dict):
+        for name, pattern in PAYLOAD_GYRO_AXES:
+            axis_match = pattern.search(line)
+            if axis_match:
+                updates[name] = float(axis_match.group(1))
+
+    def _parse_payload_liquid(self, line: str, updates: dict) -> str:
+        """ALL=/ALL: sıvı seviye verisi (payload portundan geliyor)"""
+        self.parse_all_liquid_data(line, updates)
+        return 'liquid'
     
-    def create_hyi_packet(self) -> bytes:
+    def create_hyi_packet(self, telemetry: TelemetryData = None) -> bytes:
         """HYİ paketi oluştur - Dokümana uygun format (78 byte)"""
-        packet = bytearray(78)
-        
-        # Header (Byte 1-4: 0xFF, 0xFF, 0x54, 0x52)
-        packet[0:4] = [0xFF, 0xFF, 0x54, 0x52]
-        
-        # Takım ID (Byte 5)
-        packet[4] = self.team_id
+        # Tüm alanlar tek bir tutarlı snapshot'tan okunur
+        if telemetry is None:
+            telemetry = self.telemetry
         
-        # Paket Sayacı (Byte 6)
-        packet[5] = self.packet_counter
+        # Debug: Payload GPS verilerini log'la (hyi kategorisinde debug açıksa)
+        if (telemetry.payload_latitude != 0.0 or telemetry.payload_longitude != 0.0 or
+                telemetry.payload_gps_altitude != 0.0):
+            self.log.debug('hyi', "📡 HYİ'ye gönderilen Payload GPS: Alt=%.1fm, Lat=%.6f, Lon=%.6f",
+                           telemetry.payload_gps_altitude, telemetry.payload_latitude, telemetry.payload_longitude)
         
-        # İrtifa (Byte 7-10) - Basınç sensörü irtifası
-        packet[6:10] = struct.pack('<f', self.telemetry.altitude)
-        
-        # Roket GPS İrtifa (Byte 11-14)
-        packet[10:14] = struct.pack('<f', self.telemetry.gps_altitude if self.telemetry.gps_valid else 0.0)
-        
-        # Roket Enlem (Byte 15-18)
-        packet[14:18] = struct.pack('<f', self.telemetry.gps_latitude if self.telemetry.gps_valid else 0.0)
-        
-        # Roket Boylam (Byte 19-22)
-        packet[18:22] = struct.pack('<f', self.telemetry.gps_longitude if self.telemetry.gps_valid else 0.0)
-        
-        # Görev yükü GPS İrtifa (Byte 23-26) - Payload GPS'den
-        packet[22:26] = struct.pack('<f', self.telemetry.payload_gps_altitude)
-        
-        # Görev yükü Enlem (Byte 27-30) - Payload GPS'den
-        packet[26:30] = struct.pack('<f', self.telemetry.payload_latitude)
-        
-        # Görev yükü Boylam (Byte 31-34) - Payload GPS'den
-        packet[30:34] = struct.pack('<f', self.telemetry.payload_longitude)
-        
-        # Debug: Payload GPS verilerini log'la
-        if (self.telemetry.payload_latitude != 0.0 or self.telemetry.payload_longitude != 0.0 or 
-            self.telemetry.payload_gps_altitude != 0.0):
-            self.add_log(f"📡 HYİ'ye gönderilen Payload GPS: Alt={self.telemetry.payload_gps_altitude:.1f}m, Lat={self.telemetry.payload_latitude:.6f}, Lon={self.telemetry.payload_longitude:.6f}")
-        
-        # Kademe GPS İrtifa (Byte 35-38) - Sıfır
-        packet[34:38] = struct.pack('<f', 0.0)
-        
-        # Kademe Enlem (Byte 39-42) - Sıfır
-        packet[38:42] = struct.pack('<f', 0.0)
-        
-        # Kademe Boylam (Byte 43-46) - Sıfır
-        packet[42:46] = struct.pack('<f', 0.0)
-        
-        # Jiroskop X (Byte 47-50)
-        packet[46:50] = struct.pack('<f', self.telemetry.gyro_x)
-        
-        # Jiroskop Y (Byte 51-54)
-        packet[50:54] = struct.pack('<f', self.telemetry.gyro_y)
-        
-        # Jiroskop Z (Byte 55-58)
-        packet[54:58] = struct.pack('<f', self.telemetry.gyro_z)
-        
-        # İvme X (Byte 59-62)
-        packet[58:62] = struct.pack('<f', self.telemetry.accel_x)
-        
-        # İvme Y (Byte 63-66)
-        packet[62:66] = struct.pack('<f', self.telemetry.accel_y)
-        
-        # İvme Z (Byte 67-70)
-        packet[66:70] = struct.pack('<f', self.telemetry.accel_z)
-        
-        # Açı (Byte 71-74)
-        packet[70:74] = struct.pack('<f', self.telemetry.pitch)
-        
-        # Durum (Byte 75) - Paraşüt durumu
-        # P1 ve P2 değerlerine göre durum hesapla
-        if self.telemetry.p1 and self.telemetry.p2:
-            packet[74] = 4  # Her iki paraşüt de tetiklendi
-        elif self.telemetry.p1 and not self.telemetry.p2:
-            packet[74] = 2  # Sadece birincil paraşüt tetiklendi
-        elif not self.telemetry.p1 and self.telemetry.p2:
-            packet[74] = 3  # Sadece ikincil paraşüt tetiklendi
-        else:
-            packet[74] = 1  # Hiçbir paraşüt tetiklenmedi
-        
-        # CheckSum (Byte 76) - Byte 5'ten Byte 75'e kadar toplam mod 256
-        checksum = sum(packet[4:75]) % 256
-        packet[75] = checksum
-        
-        # Footer (Byte 77-78: 0x0D, 0x0A)
-        packet[76] = 0x0D
-        packet[77] = 0x0A
-        
-        return bytes(packet)
+        return self.hyi_packer.build(self.team_id, self.packet_counter, telemetry)
     
     def send_to_hyi(self) -> bool:
-        """HYİ'ye veri gönder"""
-        if not self.hyi_connection or not self.hyi_connection.is_open:
-            self.add_log("⚠️ HYİ bağlantısı yok - veri gönderilemiyor")
-            return False
-        
+        """HYİ'ye veri gönder (manuel gönderim)"""
         # Minimum 100ms aralık kontrolü (dokümana uygun)
-        now = time.time()
-        if now - self.last_hyi_send < 0.1:
-            return False
+        sent, _ = self.transmit_hyi(min_interval=0.1)
+        return sent
+
+    def transmit_hyi(self, min_interval: float = 0.0):
+        """Güncel snapshot'ı HYİ'ye yaz, (gönderildi_mi, yazma_süresi) döndür"""
+        if not self.hyi_connection or not self.hyi_connection.is_open:
+            self._hyi_no_connection.inc()
+            self.log.warning('hyi', "⚠️ HYİ bağlantısı yok - veri gönderilemiyor")
+            return False, 0.0
         
-        try:
-            packet = self.create_hyi_packet()
-            self.hyi_connection.write(packet)
-            self.packet_counter = (self.packet_counter + 1) % 256
-            self.last_hyi_send = now
+        # Zamanlayıcı ve manuel gönderim aynı anda paket sayacını artırmasın
+        with self._hyi_lock:
+            now = time.time()
+            interval = now - self.last_hyi_send
+            if interval < min_interval:
+                self._hyi_too_soon.inc()
+                return False, 0.0
             
-            # Paket detaylarını log'la
-            checksum = packet[75]
-            payload_status = "VALID" if self.telemetry.payload_gps_valid else "INVALID"
-            parachute_status = f"P1={'AÇIK' if self.telemetry.p1 else 'KAPALI'}, P2={'AÇIK' if self.telemetry.p2 else 'KAPALI'}"
-            status_value = packet[74]
-            self.add_log(f"📤 HYİ Paket #{self.packet_counter}: Alt={self.telemetry.altitude:.1f}m, Payload GPS={payload_status}, Paraşüt={parachute_status}, Durum={status_value}, CRC={checksum:02X}")
-            return True
+            try:
+                telemetry = self.telemetry
+                packet = self.create_hyi_packet(telemetry)
+                write_start = time.perf_counter()
+                self.hyi_connection.write(packet)
+                write_time = time.perf_counter() - write_start
+                self.packet_counter = (self.packet_counter + 1) % 256
+                packet_number = self.packet_counter
+            except Exception as e:
+                self._hyi_write_error.inc()
+                self.log.error('hyi', "❌ HYİ gönderim hatası: %s", e)
+                return False, 0.0
             
-        except Exception as e:
-            self.add_log(f"❌ HYİ gönderim hatası: {e}")
-            return False
+            if self.last_hyi_send:
+                self._hyi_interval.observe(interval)
+            self.last_hyi_send = now
+            self._hyi_sent.inc()
+            self._hyi_write_time.observe(write_time)
+        
+        recorder = self.recorder
+        if recorder:
+            recorder.record(CHANNEL_HYI, packet)
+        flight_db = self.flight_db
+        if flight_db:
+            flight_db.record('hyi', packet)
+        
+        # Paket detaylarını log'la
+        self.log.info('hyi', "📤 HYİ Paket #%d: Alt=%.1fm, Payload GPS=%s, Paraşüt=P1=%s, P2=%s, Durum=%d, CRC=%02X",
+                      packet_number, telemetry.altitude, "VALID" if telemetry.payload_gps_valid else "INVALID",
+                      'AÇIK' if telemetry.p1 else 'KAPALI', 'AÇIK' if telemetry.p2 else 'KAPALI', packet[74], packet[75])
+        return True, write_time
+
+    def start_hyi_scheduler(self):
+        """HYİ paketlerini sabit hızda gönderen zamanlayıcıyı başlat"""
+        if self.hyi_scheduler:
+            self.hyi_scheduler.stop()
+        self.hyi_scheduler = HyiScheduler(
+            self.transmit_hyi, lambda: self.telemetry_version, self.hyi_rate,
+            enabled=lambda: self.running and self.auto_send,
+            jitter_histogram=self._hyi_jitter,
+        )
+        self.hyi_scheduler.start(self.event_loop)
+        self.log.info('hyi', "📤 HYİ zamanlayıcısı başlatıldı (%g Hz)", self.hyi_scheduler.rate_hz)
     
-    def start_lora_receiver(self):
-        """LoRa veri alma döngüsü"""
-        if not self.lora_connection:
-            self.add_log("❌ LoRa bağlantısı yok")
+    def _serial_reader(self, *args, **kwargs) -> SerialReader:
+        """Olay döngüsü varsa ona bağlı, yoksa kendi thread'inde okuyan okuyucu"""
+        if self.event_loop is not None:
+            return AsyncSerialReader(self.event_loop, *args, **kwargs)
+        return SerialReader(*args, **kwargs)
+    
+    def start_link_receiver(self, link: Link):
+        """Linkin portundan veri alma döngüsünü başlat"""
+        category = 'lora' if link.kind == 'lora' else 'payload'
+        if not link.connection:
+            self.log.error(category, "❌ %s bağlantısı yok", link.name)
             return
         
-        def receive_loop():
-            buffer = ""
-            self.add_log("📡 LoRa veri alma başlatıldı")
-            
-            while self.running:
-                try:
-                    if self.lora_connection and self.lora_connection.is_open and self.lora_connection.in_waiting > 0:
-                        data = self.lora_connection.read(self.lora_connection.in_waiting).decode('utf-8', errors='ignore')
-                        buffer += data
-                        
-                        # Satır sonları ile verileri ayır
-                        while '\n' in buffer or '\r' in buffer:
-                            if '\n' in buffer:
-                                line, buffer = buffer.split('\n', 1)
-                            else:
-                                line, buffer = buffer.split('\r', 1)
-                            
-                            line = line.strip()
-                            if line and 'ALT:' in line:
-                                if self.parse_lora_data(line):
-                                    # Otomatik gönderim aktifse HYİ'ye gönder
-                                    if self.auto_send:
-                                        self.send_to_hyi()
-                    
-                    time.sleep(0.01)
-                    
-                except Exception as e:
-                    self.add_log(f"❌ LoRa alma hatası: {e}")
-                    time.sleep(1)
-            
-            self.add_log("🛑 LoRa veri alma durduruldu")
-        
-        receive_thread = threading.Thread(target=receive_loop)
-        receive_thread.daemon = True
-        receive_thread.start()
+        link.reset()
+        self.log.info(category, "📡 %s veri alma başlatıldı (%s)", link.name, link.section)
+        recorder = self.recorder
+        channel = link.channel
+        handler = self.handle_lora_chunk if link.kind == 'lora' else self.handle_payload_chunk
+        link.reader = self._serial_reader(
+            link.name, link.connection, partial(handler, link=link), lambda: self.running,
+            on_error=lambda e: self.log.error(category, "❌ %s alma hatası: %s", link.name, e),
+            on_idle=partial(self._link_idle, link) if link.kind == 'payload' else None,
+            on_stop=lambda: self.log.info(category, "🛑 %s veri alma durduruldu", link.name),
+            tap=(lambda data, received_at: recorder.record(channel, data, received_at)) if recorder else None,
+        )
+        link.reader.start()
+    
+    def start_lora_receiver(self):
+        """LoRa veri alma döngüsü"""
+        self.start_link_receiver(self.lora_link)
     
     def start_payload_gps_receiver(self):
         """Payload GPS veri alma döngüsü"""
-        if not self.payload_gps_connection:
-            self.add_log("❌ Payload GPS bağlantısı yok")
-            return
-        
-        def receive_loop():
-            buffer = ""
-            self.add_log("🛰️ Payload GPS veri alma başlatıldı")
-            
-            while self.running:
-                try:
-                    # Port durumunu kontrol et
-                    if self.payload_gps_connection and self.payload_gps_connection.is_open:
-                        # Gelen veri var mı kontrol et
-                        if self.payload_gps_connection.in_waiting > 0:
-                            data = self.payload_gps_connection.read(self.payload_gps_connection.in_waiting).decode('utf-8', errors='ignore')
-                            buffer += data
-                            
-                            # Debug: Gelen ham veriyi log'la
-                            if data.strip():
-                                self.add_log(f"🛰️ Raw Payload Data: {repr(data)}")
-                            
-                            # Satır sonları ile verileri ayır
-                            while '\n' in buffer or '\r' in buffer:
-                                if '\n' in buffer:
-                                    line, buffer = buffer.split('\n', 1)
-                                else:
-                                    line, buffer = buffer.split('\r', 1)
-                                
-                                line = line.strip()
-                                if line:
-                                    self.add_log(f"🛰️ Payload Line: {line}")
-                                    # Daha geniş format desteği - yeni formatlar eklendi
-                                    if (('GPS:' in line) or ('PL_' in line) or line.startswith('$GPGGA') or 
-                                        'PAYLOAD' in line or 'LAT:' in line or 'LON:' in line or 'ALT:' in line or
-                                        'ALL=' in line or 'PAYLOAD_GPS nofix' in line or 'gX(' in line or 'gY(' in line or 'gZ(' in line):
-                                        self.parse_payload_gps_data(line)
-                                    else:
-                                        self.add_log(f"🛰️ Payload format tanınmadı: {line}")
-                        else:
-                            # Veri yoksa port durumunu log'la
-                            if time.time() % 10 < 0.1:  # Her 10 saniyede bir
-                                self.add_log(f"🛰️ Payload GPS port durumu: {self.payload_gps_connection.port}, in_waiting: {self.payload_gps_connection.in_waiting}")
-                    
-                    time.sleep(0.1)  # Daha sık kontrol et
-                    
-                except Exception as e:
-                    self.add_log(f"❌ Payload GPS alma hatası: {e}")
-                    time.sleep(1)
-            
-            self.add_log("🛑 Payload GPS veri alma durduruldu")
-        
-        receive_thread = threading.Thread(target=receive_loop)
-        receive_thread.daemon = True
-        receive_thread.start()
+        self.start_link_receiver(self.payload_link)
     
-
+    def connect_link(self, link: Link, port: str, baudrate: int = 9600) -> bool:
+        """Kayıtlı bir linkin portunu aç"""
+        category = 'lora' if link.kind == 'lora' else 'payload'
+        try:
+            if link.connected:
+                link.connection.close()
+            link.connection = serial.serial_for_url(port, baudrate, timeout=1)
+            link.device = port
+            self.log.info(category, "✅ %s bağlandı: %s (%s baud)", link.name, port, baudrate)
+            return True
+        except Exception as e:
+            self.log.error(category, "❌ %s bağlantı hatası: %s", link.name, e)
+            return False
     
-    def start_system(self, team_id: int, lora_port: str, payload_gps_port: str, hyi_port: str, auto_send: bool = True):
-        """Tüm sistemi başlat"""
+    def start_system(self, team_id: int, lora_port: str, payload_gps_port: str, hyi_port: str, auto_send: bool = True,
+                     lora_mode: str = "auto", hyi_rate: float = HYI_MAX_RATE, record: bool = True,
+                     ingest_processes: bool = False, links: list = None):
+        """Tüm sistemi başlat
+
+        ingest_processes ile LoRa ve Payload GPS portları ayrı süreçlerde okunur ve
+        parse edilir (ingest_workers); bu süreçte yalnızca HYİ ve API kalır.
+        links ek kaynakları tanımlar (yedek LoRa alıcısı, kademe GPS ...):
+            [{'name': 'lora2', 'kind': 'lora', 'port': 'COM7', 'baudrate': 9600},
+             {'name': 'stage', 'kind': 'stage', 'port': 'COM8'}]
+        Ek linkler her zaman bu süreçte okunur.
+        """
         self.team_id = team_id
         self.auto_send = auto_send
+        self.hyi_rate = hyi_rate
         self.packet_counter = 0
+        lora_mode = lora_mode if lora_mode in ("auto", "text", "binary") else "auto"
         
-        self.add_log(f"🚀 Sistem başlatılıyor - Takım ID: {team_id}")
+        self.log.info('system', "🚀 Sistem başlatılıyor - Takım ID: %s", team_id)
         
         # Önce eski bağlantıları kapat
         self.stop_system()
@@ -726,74 +1268,167 @@ class TEKNOFESTGroundStation:
         # Bağlantı sayacı
         connected_ports = 0
         
+        # Süreç izolasyonlu modda portları işçiler açar (açılamazsa işçi yeniden denenir)
+        ingest_ports = {}
+        if ingest_processes:
+            for port, device in (('lora', lora_port), ('payload', payload_gps_port)):
+                if device and device != "none":
+                    ingest_ports[port] = device
+            connected_ports += len(ingest_ports)
+            lora_port = payload_gps_port = None
+        
         # LoRa bağlantısını kur (opsiyonel)
         if lora_port and lora_port != "none":
             if self.connect_lora(lora_port):
                 connected_ports += 1
             else:
-                self.add_log("⚠️ LoRa bağlantısı başarısız, sadece diğer portlarla devam ediliyor")
+                self.log.warning('system', "⚠️ LoRa bağlantısı başarısız, sadece diğer portlarla devam ediliyor")
         
         # Payload GPS bağlantısını kur (opsiyonel)
         if payload_gps_port and payload_gps_port != "none":
             if self.connect_payload_gps(payload_gps_port):
                 connected_ports += 1
             else:
-                self.add_log("⚠️ Payload GPS bağlantısı başarısız, sadece diğer portlarla devam ediliyor")
+                self.log.warning('system', "⚠️ Payload GPS bağlantısı başarısız, sadece diğer portlarla devam ediliyor")
+        
+        # Ek linkler (kayıtlı değilse kayıt defterine eklenir)
+        for spec in links or ():
+            link = self.links.get(spec['name'])
+            if link is None:
+                try:
+                    link = self.add_link(spec['name'], spec.get('kind', 'lora'), spec.get('section'))
+                except ValueError as e:
+                    self.log.warning('system', "⚠️ %s", e)
+                    continue
+            if spec.get('port') and spec['port'] != "none":
+                if self.connect_link(link, spec['port'], int(spec.get('baudrate', 9600))):
+                    connected_ports += 1
+                else:
+                    self.log.warning('system', "⚠️ %s bağlantısı başarısız, sadece diğer portlarla devam ediliyor", link.name)
+        for link in self.links.values():
+            if link.kind == 'lora':
+                link.mode = lora_mode
+        for arbiter in self.arbiters.values():
+            arbiter.reset()
+        self._update_arbiters()
         
         # HYİ bağlantısını kur (opsiyonel)
         if hyi_port and hyi_port != "none":
             if self.connect_hyi(hyi_port):
                 connected_ports += 1
             else:
-                self.add_log("⚠️ HYİ bağlantısı başarısız, sadece diğer portlarla devam ediliyor")
+                self.log.warning('system', "⚠️ HYİ bağlantısı başarısız, sadece diğer portlarla devam ediliyor")
         
         # En az bir port bağlı olmalı
         if connected_ports == 0:
-            self.add_log("❌ Hiçbir port bağlanamadı, sistem başlatılamıyor")
+            self.log.error('system', "❌ Hiçbir port bağlanamadı, sistem başlatılamıyor")
             return False
         
         # Sistemi başlat
         self.running = True
         
-        # Sadece bağlı olan portların receiver'larını başlat
-        if self.lora_connection and self.lora_connection.is_open:
-            self.start_lora_receiver()
+        # Ham veri kaydı alıcılar başlamadan açılır ki ilk byte'lar da kaydedilsin
+        if record:
+            self.start_recording()
+        
+        # Sadece bağlı olan linklerin receiver'larını başlat
+        for link in self.links.values():
+            if link.connected:
+                self.start_link_receiver(link)
         
-        # Payload GPS varsa onun da receiver'ını başlat
-        if self.payload_gps_connection and self.payload_gps_connection.is_open:
-            self.start_payload_gps_receiver()
+        if ingest_ports:
+            self.start_ingest_workers(ingest_ports, record)
+        
+        # HYİ gönderimi alıcılardan bağımsız, kendi thread'inde (veya olay döngüsünde)
+        if self.hyi_connection and self.hyi_connection.is_open:
+            self.start_hyi_scheduler()
         
 
         
         auto_status = "AKTIF" if auto_send else "PASİF"
-        payload_status = "AKTIF" if self.payload_gps_connection else "PASİF"
-        lora_status = "AKTIF" if self.lora_connection else "PASİF"
+        payload_status = "AKTIF" if self.payload_gps_connection or 'payload' in ingest_ports else "PASİF"
+        lora_status = "AKTIF" if self.lora_connection or 'lora' in ingest_ports else "PASİF"
         hyi_status = "AKTIF" if self.hyi_connection else "PASİF"
         
-        self.add_log(f"✅ Sistem hazır! Bağlı portlar: {connected_ports}")
-        self.add_log(f"   LoRa: {lora_status}, Payload GPS: {payload_status}, HYİ: {hyi_status}")
-        self.add_log(f"   Otomatik gönderim: {auto_status}")
+        self.log.info('system', "✅ Sistem hazır! Bağlı portlar: %s", connected_ports)
+        self.log.info('system', "   LoRa: %s, Payload GPS: %s, HYİ: %s", lora_status, payload_status, hyi_status)
+        self.log.info('system', "   Otomatik gönderim: %s (%g Hz)", auto_status, self.hyi_rate)
+        self.log.info('system', "   LoRa modu: %s", self.lora_mode)
+        extra = [link for link in self.links.values()
+                 if link is not self.lora_link and link is not self.payload_link and link.connected]
+        if extra:
+            self.log.info('system', "   Ek linkler: %s", ", ".join(f"{link.name} ({link.section})" for link in extra))
+        if ingest_ports:
+            self.log.info('system', "   Alım: ayrı süreçler (%s)", ", ".join(ingest_ports))
         return True
     
+    def start_recording(self, database: bool = True):
+        """Bu oturum için yeni bir uçuş kaydı dosyası ve aynı adlı uçuş veritabanı aç
+
+        database=False yalnızca ham kaydı açar (alım işçileri: veritabanına
+        ana süreç, işçilerin yayınladığı örneklerden bir kez yazar).
+        """
+        name = datetime.now().strftime('flight_%Y%m%d_%H%M%S')
+        recorder = FlightRecorder(RECORDINGS_DIR, on_error=lambda e: self.log.error('system', "❌ Uçuş kaydı yazma hatası: %s", e))
+        try:
+            path = recorder.open(name)
+            self.recorder = recorder
+            self.log.info('system', "💾 Uçuş kaydı: %s", path)
+        except OSError as e:
+            self.log.error('system', "❌ Uçuş kaydı açılamadı: %s", e)
+        
+        if not database:
+            return
+        flight_db = FlightDatabase(FLIGHTS_DIR, flight_tables(),
+                                   on_error=lambda e: self.log.error('system', "❌ Uçuş veritabanı yazma hatası: %s", e))
+        try:
+            path = flight_db.open(name)
+            self.flight_db = flight_db
+            self.log.info('system', "🗄️ Uçuş veritabanı: %s", path)
+        except OSError as e:
+            self.log.error('system', "❌ Uçuş veritabanı açılamadı: %s", e)
+    
     def stop_system(self):
         """Sistemi durdur"""
         self.running = False
         
-        if self.lora_connection and self.lora_connection.is_open:
-            self.lora_connection.close()
-            self.add_log("🔌 LoRa bağlantısı kapatıldı")
+        if self.hyi_scheduler:
+            self.hyi_scheduler.stop()
         
-        if self.payload_gps_connection and self.payload_gps_connection.is_open:
-            self.payload_gps_connection.close()
-            self.add_log("🔌 Payload GPS bağlantısı kapatıldı")
+        if self.ingest:
+            ingest, self.ingest = self.ingest, None
+            ingest.stop()
+        
+        # Olay döngüsündeki okuyucular portlar kapanmadan döngüden çıkarılmalı
+        for link in self.links.values():
+            if link.reader:
+                link.reader.stop()
+        
+        for link in self.links.values():
+            if link.connected:
+                link.connection.close()
+                self.log.info('lora' if link.kind == 'lora' else 'payload', "🔌 %s bağlantısı kapatıldı", link.name)
             
         if self.hyi_connection and self.hyi_connection.is_open:
             self.hyi_connection.close()
-            self.add_log("🔌 HYİ bağlantısı kapatıldı")
+            self.log.info('hyi', "🔌 HYİ bağlantısı kapatıldı")
 
 
         
         time.sleep(0.5)  # Thread'lerin kapanması için bekle
+        
+        # Alıcılar durduktan sonra kalan kayıtları yaz ve dosyayı kapat
+        if self.recorder:
+            recorder, self.recorder = self.recorder, None
+            recorder.close()
+            self.log.info('system', "💾 Uçuş kaydı kapatıldı: %s (%d kayıt)", recorder.path, recorder.records)
+        
+        if self.flight_db:
+            flight_db, self.flight_db = self.flight_db, None
+            path = flight_db.path
+            flight_db.close()
+            self.log.info('system', "🗄️ Uçuş veritabanı kapatıldı: %s (%s)", path,
+                          ", ".join(f"{name} {table.rows}" for name, table in flight_db.tables.items()))
 
 # Flask uygulamasına, projenin bir üst klasöründeki "build" klasörünü gösteriyoruz
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # backend klasörü
@@ -807,6 +1442,20 @@ CORS(app)
 # Global ground station instance
 ground_station = TEKNOFESTGroundStation()
 
+# API handler süreleri (/metrics)
+@app.before_request
+def _start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def _record_request_metrics(response):
+    start = g.get('request_start')
+    if start is not None:
+        endpoint = request.endpoint or 'unknown'
+        ground_station.http_seconds.labels(endpoint=endpoint).observe(time.perf_counter() - start)
+        ground_station.http_requests.labels(endpoint=endpoint, status=str(response.status_code)).inc()
+    return response
+
 # React frontend dosyalarını sunan route
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
@@ -844,8 +1493,14 @@ def api_connect():
         payload_gps_port = data.get('payloadGpsPort', 'none')
         hyi_port = data.get('hyiPort', 'none')
         auto_send = data.get('autoSend', True)
+        lora_mode = data.get('loraMode', 'auto')
+        hyi_rate = float(data.get('hyiRate', 10))
+        record = data.get('record', True)
+        ingest_processes = data.get('ingestProcesses', False)
+        links = data.get('links') or []
         
-        success = ground_station.start_system(team_id, lora_port, payload_gps_port, hyi_port, auto_send)
+        success = ground_station.start_system(team_id, lora_port, payload_gps_port, hyi_port, auto_send, lora_mode, hyi_rate,
+                                              record, ingest_processes, links)
         
         return jsonify({
             'success': success,
@@ -873,13 +1528,14 @@ def api_disconnect():
             'error': str(e)
         })
 
-@app.route('/api/telemetry', methods=['GET'])
-def api_telemetry():
-    """Güncel telemetri verisini döndür"""
+@app.route('/api/links', methods=['GET'])
+def api_links():
+    """Kayıtlı telemetri linklerini ve durumlarını listele"""
     try:
         return jsonify({
             'success': True,
-            'data': asdict(ground_station.telemetry)
+            'links': {name: link.snapshot() for name, link in ground_station.links.items()},
+            'arbiters': {section: arbiter.snapshot() for section, arbiter in ground_station.arbiters.items()}
         })
     except Exception as e:
         return jsonify({
@@ -887,14 +1543,149 @@ def api_telemetry():
             'error': str(e)
         })
 
+# Sunucu her başladığında farklı ETag üretilsin
+BOOT_ID = format(int(time.time()), 'x')
+
+@app.route('/api/telemetry', methods=['GET'])
+def api_telemetry():
+    """Güncel telemetri verisini döndür (ETag / If-None-Match destekli)"""
+    try:
+        version, _, data_json = ground_station.telemetry_snapshot()
+        response = Response(b'{"success":true,"data":' + data_json + b'}', mimetype='application/json')
+        response.set_etag(f"{BOOT_ID}-{version}")
+        # Tarayıcı önbelleğe alsın ama her seferinde ETag ile doğrulasın
+        response.headers['Cache-Control'] = 'no-cache'
+        # Veri değişmediyse 304 Not Modified
+        return response.make_conditional(request)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/stream', methods=['GET'])
+def api_stream():
+    """Telemetriyi Server-Sent Events ile anlık yayınla
+
+    İlk olay tam snapshot, sonrakiler yalnızca değişen alanlardır.
+    Yeniden bağlanırken Last-Event-ID başlığı veya ?after=<seq> ile devam edilir.
+    """
+    after = request.headers.get('Last-Event-ID') or request.args.get('after')
+    try:
+        after = int(after) if after is not None else None
+    except ValueError:
+        after = None
+    
+    return Response(
+        ground_station.stream.subscribe(after),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
 @app.route('/api/logs', methods=['GET'])
 def api_logs():
-    """Son log mesajlarını döndür"""
+    """Log mesajlarını imleçle döndür
+
+    ?after=<seq>&limit=N - yanıttaki 'next' bir sonraki isteğin after değeridir.
+    after verilmezse son limit mesaj döner.
+    """
+    try:
+        after = request.args.get('after', type=int)
+        limit = min(max(request.args.get('limit', 100, type=int), 1), 1000)
+        return jsonify({
+            'success': True,
+            **ground_station.get_logs(after, limit)
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/logs/stream', methods=['GET'])
+def api_logs_stream():
+    """Log mesajlarını Server-Sent Events ile canlı yayınla
+
+    Her olayın id'si log sıra numarasıdır; yeniden bağlanırken Last-Event-ID
+    veya ?after=<seq> ile kaldığı yerden devam edilir.
+    """
+    after = request.headers.get('Last-Event-ID') or request.args.get('after')
+    try:
+        after = int(after) if after is not None else None
+    except ValueError:
+        after = None
+    
+    return Response(
+        ground_station.log_sink.subscribe(after),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+@app.route('/api/history', methods=['GET'])
+def api_history():
+    """Zaman aralığına göre telemetri geçmişini döndür
+
+    ?source=rocket|payload&from=<unix|-saniye>&to=<unix|-saniye>&fields=a,b&step=N
+    """
+    try:
+        source = request.args.get('source', 'rocket')
+        history = {
+            'rocket': ground_station.rocket_history,
+            'payload': ground_station.payload_history,
+        }.get(source)
+        if history is None:
+            return jsonify({
+                'success': False,
+                'error': f'Bilinmeyen kaynak: {source}'
+            }), 400
+        
+        fields = request.args.get('fields')
+        try:
+            result = history.query(
+                start=request.args.get('from', type=float),
+                end=request.args.get('to', type=float),
+                fields=fields.split(',') if fields else None,
+                step=request.args.get('step', 1, type=int),
+            )
+        except KeyError as e:
+            return jsonify({
+                'success': False,
+                'error': f'Bilinmeyen alan: {e.args[0]}'
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'source': source,
+            **result
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/api/liquid/history', methods=['GET'])
+def api_liquid_history():
+    """Sıvı seviye çerçeveleri ve çalkalanma analizi
+
+    ?from=<unix|-saniye>&to=<unix|-saniye>&step=N
+    """
     try:
-        logs = ground_station.get_logs()
+        result = ground_station.liquid_history.query(
+            start=request.args.get('from', type=float),
+            end=request.args.get('to', type=float),
+            step=request.args.get('step', 1, type=int),
+        )
         return jsonify({
             'success': True,
-            'logs': logs
+            **result,
+            'storage': ground_station.liquid_history.snapshot()
         })
     except Exception as e:
         return jsonify({
@@ -902,6 +1693,34 @@ def api_logs():
             'error': str(e)
         })
 
+@app.route('/api/log-level', methods=['GET', 'POST'])
+def api_log_level():
+    """Log seviyesini çalışma anında değiştir
+
+    POST {"level": "debug", "category": "payload"} - category verilmezse genel seviye,
+    "level": null ile kategori ayarı kaldırılır.
+    """
+    try:
+        if request.method == 'POST':
+            data = request.get_json() or {}
+            category = data.get('category')
+            ground_station.log.set_level(data.get('level'), category)
+            ground_station.log.info('system', "⚙️ Log seviyesi: %s = %s", category or 'genel', data.get('level'))
+        return jsonify({
+            'success': True,
+            'logging': ground_station.log.snapshot()
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
 @app.route('/api/auto-send', methods=['POST'])
 def api_auto_send():
     """Otomatik gönderim ayarını değiştir"""
@@ -911,7 +1730,7 @@ def api_auto_send():
         ground_station.auto_send = enabled
         
         message = f'Otomatik gönderim {"AKTIF" if enabled else "PASİF"}'
-        ground_station.add_log(f"⚙️ {message}")
+        ground_station.log.info('system', "⚙️ %s", message)
         
         return jsonify({
             'success': True,
@@ -942,7 +1761,7 @@ def api_send_packet():
 def api_export_data():
     """Verileri dışa aktar"""
     try:
-        telemetry_data = asdict(ground_station.telemetry)
+        telemetry_data = ground_station.telemetry.to_dict()
         telemetry_data['timestamp'] = datetime.now().isoformat()
         
         # JSON formatında dışa aktar
@@ -1009,8 +1828,7 @@ Sensör Değerleri:
 """
         
         # Sıvı seviye sensör değerlerini ekle
-        for i, level in enumerate(telemetry.liquid_levels):
-            txt_content += f"Sensör {i+1:2d}: {level:3d} (0-255)\n"
+        txt_content += "".join(f"Sensör {i+1:2d}: {level:3d} (0-255)\n" for i, level in enumerate(telemetry.liquid_levels))
         
         txt_content += f"""
 PAKET BİLGİLERİ:
@@ -1035,11 +1853,83 @@ Export tamamlandı: {timestamp}
             'error': str(e)
         })
 
+@app.route('/api/flights', methods=['GET'])
+def api_flights():
+    """Uçuş veritabanındaki oturumları listele"""
+    try:
+        return jsonify({
+            'success': True,
+            'current': ground_station.flight_db.name if ground_station.flight_db else None,
+            'flights': list_flights(FLIGHTS_DIR)
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+EXPORT_MIMETYPES = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson', 'etudb': 'application/octet-stream'}
+
+@app.route('/api/flights/<flight>/<table>', methods=['GET'])
+def api_flight_export(flight, table):
+    """Oturumun bir tablosunu parça parça dışa aktar (uçuş belleğe alınmaz)
+
+    ?format=csv|jsonl|etudb&fields=a,b - flight 'current' ise açık oturum
+    """
+    try:
+        if flight == 'current':
+            if not ground_station.flight_db:
+                return jsonify({
+                    'success': False,
+                    'error': 'Açık oturum yok'
+                }), 404
+            flight = ground_station.flight_db.name
+        export_format = request.args.get('format', 'csv')
+        exporter = EXPORTERS.get(export_format)
+        if exporter is None:
+            return jsonify({
+                'success': False,
+                'error': f'Bilinmeyen format: {export_format}'
+            }), 400
+        selected = request.args.get('fields')
+        try:
+            chunks = exporter(table_path(FLIGHTS_DIR, flight, table), selected.split(',') if selected else None)
+            # Alan hataları akış başlamadan yakalansın
+            first = next(chunks, b'')
+        except (ValueError, FileNotFoundError) as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 404
+        except KeyError as e:
+            return jsonify({
+                'success': False,
+                'error': f'Bilinmeyen alan: {e.args[0]}'
+            }), 400
+        
+        def stream():
+            yield first
+            yield from chunks
+        
+        return Response(stream(), mimetype=EXPORT_MIMETYPES[export_format], headers={
+            'Content-Disposition': f'attachment; filename={flight}_{table}.{export_format}'
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Sayaç ve histogramları Prometheus metin formatında döndür"""
+    return Response(ground_station.metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Sağlık kontrolü"""
-    return jsonify({
+    health = json.dumps({
         'status': 'healthy',
         'running': ground_station.running,
         'connected': {
@@ -1047,9 +1937,20 @@ def health_check():
             'payload_gps': ground_station.payload_gps_connection is not None and ground_station.payload_gps_connection.is_open,
             'hyi': ground_station.hyi_connection is not None and ground_station.hyi_connection.is_open
         },
-        'telemetry': asdict(ground_station.telemetry),
+        'latency': {port: stats.snapshot() for port, stats in ground_station.latency.items()},
+        'links': {name: link.snapshot() for name, link in ground_station.links.items()},
+        'arbiters': {section: arbiter.snapshot() for section, arbiter in ground_station.arbiters.items()},
+        'logging': ground_station.log.snapshot(),
+        'recorder': ground_station.recorder.snapshot() if ground_station.recorder else None,
+        'flight_db': ground_station.flight_db.snapshot() if ground_station.flight_db else None,
+        'hyi_scheduler': ground_station.hyi_scheduler.snapshot() if ground_station.hyi_scheduler else None,
+        'ingest': ground_station.ingest.snapshot() if ground_station.ingest else None,
+        'metrics': ground_station.metrics.snapshot(),
         'timestamp': datetime.now().isoformat()
-    })
+    }, separators=(',', ':')).encode()
+    # Telemetri kısmı hazır snapshot byte'larından eklenir
+    _, _, telemetry_json = ground_station.telemetry_snapshot()
+    return Response(health[:-1] + b',"telemetry":' + telemetry_json + b'}', mimetype='application/json')
 
 if __name__ == "__main__":
     ascii_banner = pyfiglet.figlet_format("yusufmertusta")
@@ -1062,6 +1963,8 @@ if __name__ == "__main__":
     print("📡 LoRa + Payload GPS Support")
     print("=" * 50)
     
+    ground_station.log.add_sink(RotatingFileSink(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'ground_station.log')))
+    
     try:
         app.run(
             host='0.0.0.0',
@@ -1071,4 +1974,5 @@ if __name__ == "__main__":
         )
     except KeyboardInterrupt:
         print("\n🛑 Server durduruldu")
-        ground_station.stop_system()
\ No newline at end of file
+        ground_station.stop_system()
+        ground_station.log.flush()
\ No newline at end of file
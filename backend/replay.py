@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Kayıtlı seri verinin yer istasyonuna yeniden oynatılması (replay)
+
+Donanım olmadan bir uçuş kaydı (.etulog) veya düz metin LoRa/payload satır
+dökümü gerçek parser'lardan (handle_lora_chunk / handle_payload_chunk) ve
+HYİ paketleyicisinden geçirilir. HYİ çıktısı kayıt zamanına göre sabit hızda
+(varsayılan 10 Hz) üretilir ve bir dosyaya veya sözde terminale (pty) yazılır;
+aynı girdi her zaman aynı HYİ byte'larını üretir.
+
+Kullanım:
+    cd backend
+    python replay.py recordings/flight_20250101_120000.etulog --speed 0
+    python replay.py lora_dump.txt --speed 1 --hyi-pty
+    python replay.py capture.etulog --speed 10 --hyi-out hyi.bin --telemetry-out trace.jsonl
+
+--speed 1 gerçek zamanlı, N N kat hızlı, 0 beklemeden (olabildiğince hızlı).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from flight_recorder import CHANNEL_HYI, CHANNEL_LORA, CHANNEL_PAYLOAD, RECORDING_EXTENSION, read_recording
+from hyi_scheduler import HYI_MAX_RATE
+from main_system import TEKNOFESTGroundStation
+from station_log import OFF
+
+# Her satırda değişen duvar saati alanları; telemetri izinde karşılaştırmayı bozmasın
+TRACE_EXCLUDED = ('last_update', 'payload_last_update', 'stage_last_update')
+
+
+class HyiOutput:
+    """HYİ paketlerini dosyaya veya pty'ye yazan, seri port gibi davranan hedef"""
+
+    def __init__(self, path: str = None, pty: bool = False):
+        self.slave_name = None
+        self._slave = None
+        if pty:
+            master, self._slave = os.openpty()
+            self.slave_name = os.ttyname(self._slave)
+            # Okuyucu yoksa oynatma bloklanmasın; dolu tamponda yazma hatası sayılır
+            os.set_blocking(master, False)
+            self.file = os.fdopen(master, 'wb', buffering=0)
+        elif path:
+            self.file = open(path, 'wb')
+        else:
+            self.file = None
+        self.bytes_written = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.file is not None
+
+    def write(self, data) -> int:
+        self.file.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+        if self._slave is not None:
+            os.close(self._slave)
+            self._slave = None
+
+
+def text_events(path: str, channel: str = 'auto', line_rate: float = 20.0):
+    """Düz metin dökümünden (kanal, zaman, byte) olayları üret
+
+    Metin dökümünde zaman damgası olmadığından satırlar line_rate Hz ile
+    aralıklandırılır. channel='auto' iken roket satırları (ALT: ve maxALT:)
+    LoRa, diğerleri payload kanalına verilir.
+    """
+    fixed = {'lora': CHANNEL_LORA, 'payload': CHANNEL_PAYLOAD}.get(channel)
+    interval = 1.0 / line_rate
+    with open(path, 'rb') as f:
+        for index, line in enumerate(f):
+            line = line.rstrip(b'\r\n')
+            if not line:
+                continue
+            if fixed is None:
+                target = CHANNEL_LORA if b'ALT:' in line and b'maxALT:' in line else CHANNEL_PAYLOAD
+            else:
+                target = fixed
+            yield target, index * interval, line + b'\n'
+
+
+def load_events(path: str, channel: str = 'auto', line_rate: float = 20.0):
+    if path.endswith(RECORDING_EXTENSION):
+        return read_recording(path)
+    return text_events(path, channel, line_rate)
+
+
+class ReplayEngine:
+    """Kayıt olaylarını yer istasyonuna sırayla veren oynatıcı
+
+    speed: 1 gerçek zaman, N kat hızlı, 0 beklemeden.
+    HYİ paketleri kayıt zamanına göre hyi_rate Hz ile üretilir (duvar saatinden
+    bağımsız), bu yüzden çıktı oynatma hızından etkilenmez. Parser'lara geliş
+    zamanı olarak kayıt zamanı verilir (oynatma başlangıcına göre monotonic
+    saate taşınmış): sıvı seviye geçmişi ve analiz penceresi kayıttaki zamanla
+    ilerler, geçmiş sorguları kaydın unix zamanlarını döndürür. Link gecikme
+    istatistikleri bu yüzden yalnızca --speed 1'de anlamlıdır.
+    """
+
+    def __init__(self, station: TEKNOFESTGroundStation = None, speed: float = 1.0,
+                 hyi_output: HyiOutput = None, hyi_rate: float = HYI_MAX_RATE, team_id: int = 0,
+                 trace=None):
+        if station is None:
+            station = TEKNOFESTGroundStation()
+            station.log.set_level(OFF)
+        self.station = station
+        self.speed = speed
+        self.hyi_output = hyi_output
+        self.hyi_period = 1.0 / min(max(hyi_rate, 0.1), HYI_MAX_RATE)
+        self.trace = trace
+        station.team_id = team_id
+        station.hyi_connection = hyi_output if hyi_output and hyi_output.is_open else None
+        station.running = True
+        self.events = 0
+        self.bytes = {CHANNEL_LORA: 0, CHANNEL_PAYLOAD: 0}
+        self.recorded_hyi_packets = 0
+        self.hyi_packets = 0
+        self.elapsed = 0.0
+
+    def _write_trace(self, timestamp: float):
+        sample = self.station.telemetry.to_dict()
+        for name in TRACE_EXCLUDED:
+            sample.pop(name, None)
+        sample['t'] = round(timestamp, 6)
+        self.trace.write(json.dumps(sample, sort_keys=True) + '\n')
+
+    def _send_hyi(self):
+        sent, _ = self.station.transmit_hyi()
+        if sent:
+            self.hyi_packets += 1
+
+    def run(self, events) -> dict:
+        station = self.station
+        handlers = {CHANNEL_LORA: station.handle_lora_chunk, CHANNEL_PAYLOAD: station.handle_payload_chunk}
+        speed = self.speed
+        send_hyi = station.hyi_connection is not None
+        trace = self.trace
+        first = None
+        next_hyi = None
+        clock = None
+        version = station.telemetry_version
+        start = time.perf_counter()
+
+        for channel, timestamp, data in events:
+            if first is None:
+                first = timestamp
+                next_hyi = timestamp
+                clock = time.monotonic()
+                station.liquid_history.epoch_offset = first - clock
+            offset = timestamp - first
+            if speed > 0:
+                delay = offset / speed - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+
+            # HYİ tikleri kayıt zamanına göre: bu olaydan önceki tüm tikler gönderilir
+            if send_hyi:
+                while next_hyi <= timestamp:
+                    self._send_hyi()
+                    next_hyi += self.hyi_period
+
+            if channel == CHANNEL_HYI:
+                self.recorded_hyi_packets += 1
+                continue
+            handler = handlers.get(channel)
+            if handler is None:
+                continue
+            handler(data, clock + offset)
+            self.events += 1
+            self.bytes[channel] += len(data)
+
+            if trace is not None and station.telemetry_version != version:
+                version = station.telemetry_version
+                self._write_trace(offset)
+
+        if send_hyi and first is not None:
+            self._send_hyi()  # Son durumu da gönder
+        self.elapsed = time.perf_counter() - start
+        station.running = False
+        return self.summary()
+
+    def summary(self) -> dict:
+        station = self.station
+        lines = station.lora_framer.lines + station.payload_framer.lines
+        elapsed = self.elapsed or 1e-9
+        return {
+            'events': self.events,
+            'lines': lines,
+            'lora_binary_frames': station.lora_decoder.frames_ok,
+            'lora_packets': station.telemetry.packet_count,
+            'payload_packets': station.telemetry.payload_packet_count,
+            'lora_bytes': self.bytes[CHANNEL_LORA],
+            'payload_bytes': self.bytes[CHANNEL_PAYLOAD],
+            'hyi_packets': self.hyi_packets,
+            'recorded_hyi_packets': self.recorded_hyi_packets,
+            'elapsed_s': round(self.elapsed, 3),
+            'lines_per_s': round(lines / elapsed, 1),
+            'events_per_s': round(self.events / elapsed, 1),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıtlı seri veriyi yer istasyonuna yeniden oynat")
+    parser.add_argument('capture', help=f"Uçuş kaydı ({RECORDING_EXTENSION}) veya düz metin satır dökümü")
+    parser.add_argument('--speed', type=float, default=1.0, help="1 gerçek zaman, N kat hızlı, 0 beklemeden")
+    parser.add_argument('--channel', choices=('auto', 'lora', 'payload'), default='auto',
+                        help="Metin dökümü satırlarının kanalı")
+    parser.add_argument('--line-rate', type=float, default=20.0, help="Metin dökümü için satır/saniye")
+    parser.add_argument('--lora-mode', choices=('auto', 'text', 'binary'), default='auto')
+    parser.add_argument('--team-id', type=int, default=0)
+    parser.add_argument('--hyi-rate', type=float, default=HYI_MAX_RATE)
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--hyi-out', help="HYİ paketlerinin yazılacağı dosya")
+    output.add_argument('--hyi-pty', action='store_true', help="HYİ paketlerini bir pty'ye yaz")
+    parser.add_argument('--telemetry-out', help="Her yeni örnekte telemetriyi JSONL olarak yaz (regresyon izi)")
+    parser.add_argument('--log-level', default='off', help="İstasyon log seviyesi (off, error, info, debug)")
+    args = parser.parse_args(argv)
+
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(args.log_level)
+    station.lora_mode = args.lora_mode
+
+    hyi_output = HyiOutput(args.hyi_out, args.hyi_pty) if (args.hyi_out or args.hyi_pty) else None
+    if hyi_output and hyi_output.slave_name:
+        print(f"📤 HYİ çıktısı: {hyi_output.slave_name}")
+        if args.speed == 0:
+            print("⚠️ --speed 0 ile pty okuyucusu paketlere yetişemeyebilir")
+
+    trace = open(args.telemetry_out, 'w', encoding='utf-8') if args.telemetry_out else None
+    try:
+        engine = ReplayEngine(station, args.speed, hyi_output, args.hyi_rate, args.team_id, trace)
+        summary = engine.run(load_events(args.capture, args.channel, args.line_rate))
+    except KeyboardInterrupt:
+        print("\n🛑 Oynatma durduruldu")
+        return 1
+    finally:
+        if trace:
+            trace.close()
+        if hyi_output:
+            hyi_output.close()
+        station.log.flush()
+
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Seri port okuma katmanı
+
+Alıcı döngüleri in_waiting + time.sleep ile port yoklamak yerine read()
+çağrısında bloklanır: pyserial POSIX'te dosya tanımlayıcısı üzerinde select,
+Windows'ta overlapped I/O kullanır. İlk byte geldiği anda read() döner,
+veri yokken thread zaman aşımına kadar uyur (boşta ~0 CPU).
+
+AsyncSerialReader aynı okuyucuyu bir asyncio olay döngüsüne bağlar: portun
+dosya tanımlayıcısı varsa loop.add_reader ile döngünün kendisi bekler,
+yoksa (loop://, Windows) bloklayan okuma portun tek işçili executor'ında
+yapılır. Her iki durumda da on_data olay döngüsünde çağrılır.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class LatencyStats:
+    """İlk byte'tan parse edilmiş telemetriye kadar geçen süre istatistiği
+
+    histogram atanırsa (station_metrics.Histogram) her ölçüm ona da eklenir.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.last = 0.0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = None
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.last = seconds
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if self.histogram is not None:
+            self.histogram.observe(seconds)
+
+    def snapshot(self) -> dict:
+        return {
+            'count': self.count,
+            'last_ms': round(self.last * 1000, 3),
+            'avg_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+
+class SerialReader:
+    """Bir seri portu kendi thread'inde bloklayarak okuyan okuyucu
+
+    on_data(data, received_at) her okuma sonrası çağrılır; received_at,
+    read() çağrısının döndüğü andaki time.monotonic() değeridir.
+    on_idle() okuma zaman aşımına uğradığında (port sessizken), on_stop()
+    döngü sona erdiğinde çağrılır. tap(data, received_at) verilirse okunan
+    ham byte'lar on_data'dan önce ona da verilir (uçuş kaydı).
+    """
+
+    def __init__(self, name: str, connection, on_data, is_running, on_error=None, on_idle=None,
+                 on_stop=None, read_timeout: float = 0.2, max_read: int = 4096, tap=None):
+        self.name = name
+        self.connection = connection
+        self.on_data = on_data
+        self.tap = tap
+        self.is_running = is_running
+        self.on_error = on_error
+        self.on_idle = on_idle
+        self.on_stop = on_stop
+        self.read_timeout = read_timeout
+        self.max_read = max_read
+        self.bytes_read = 0
+        self.reads = 0
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._loop, name=f"{self.name}-reader")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        """Thread is_running() False olunca zaman aşımı içinde kendiliğinden durur"""
+
+    def _read(self):
+        """Bloklayarak oku, (data, received_at) döndür; zaman aşımında None"""
+        connection = self.connection
+        data = connection.read(min(max(connection.in_waiting, 1), self.max_read))
+        if not data:
+            return None
+        received_at = time.monotonic()
+        # İlk byte'ın arkasından gelen kısmı da aynı turda al
+        waiting = connection.in_waiting
+        if waiting:
+            data += connection.read(min(waiting, self.max_read))
+        return data, received_at
+
+    def _deliver(self, data, received_at: float):
+        self.bytes_read += len(data)
+        self.reads += 1
+        if self.tap:
+            self.tap(data, received_at)
+        self.on_data(data, received_at)
+
+    def _loop(self):
+        # read() ilk byte gelene kadar bloklanır; zaman aşımı yalnızca kapanışı fark etmek için
+        self.connection.timeout = self.read_timeout
+        while self.is_running():
+            try:
+                if not self.connection.is_open:
+                    break
+                chunk = self._read()
+                if chunk is None:
+                    if self.on_idle:
+                        self.on_idle()
+                    continue
+                self._deliver(*chunk)
+            except Exception as e:
+                if not self.is_running():
+                    break
+                if self.on_error:
+                    self.on_error(e)
+                time.sleep(1)
+        if self.on_stop:
+            self.on_stop()
+
+
+class AsyncSerialReader(SerialReader):
+    """SerialReader'ın asyncio olay döngüsünde çalışan karşılığı
+
+    start() ve stop() herhangi bir thread'den çağrılabilir; kayıt işlemleri
+    döngü thread'ine aktarılır. on_idle her read_timeout'ta bir, o aralıkta
+    hiç okuma olmadıysa çağrılır. Hata sonrası okuma 1 s sonra yeniden denenir.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loop = loop
+        self.fd = None
+        self.task = None
+        self.executor = None
+        self._idle_handle = None
+        self._idle_reads = 0
+        self._stopped = threading.Event()
+
+    def start(self):
+        self._stopped.clear()
+        self.loop.call_soon_threadsafe(self._attach)
+
+    def stop(self):
+        """Okumayı bırak; port kapatılmadan önce çağrılmalıdır (fd döngüden çıkarılır)"""
+        if self._in_loop():
+            self._detach()
+        elif not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._detach)
+            self._stopped.wait(1.0)
+
+    def _in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _attach(self):
+        connection = self.connection
+        if not self.is_running() or not connection.is_open:
+            self._detach()
+            return
+        try:
+            self.fd = connection.fileno()
+        except (AttributeError, OSError, ValueError):
+            self.fd = None
+        if self.fd is not None:
+            # Döngü hazır olduğunu bildirir; read() yalnızca bekleyen byte'ları alır
+            connection.timeout = 0
+            self.loop.add_reader(self.fd, self._on_readable)
+        else:
+            connection.timeout = self.read_timeout
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.name}-reader")
+            self.task = self.loop.create_task(self._poll())
+        self._schedule_idle()
+
+    def _detach(self):
+        if self.fd is not None:
+            self.loop.remove_reader(self.fd)
+            self.fd = None
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        if not self._stopped.is_set():
+            self._stopped.set()
+            if self.on_stop:
+                self.on_stop()
+
+    def _schedule_idle(self):
+        self._idle_reads = self.reads
+        self._idle_handle = self.loop.call_later(self.read_timeout, self._check_idle)
+
+    def _check_idle(self):
+        if not self.is_running():
+            self._detach()
+            return
+        if self.reads == self._idle_reads and self.on_idle:
+            self.on_idle()
+        self._schedule_idle()
+
+    def _on_readable(self):
+        try:
+            if not self.is_running() or not self.connection.is_open:
+                self._detach()
+                return
+            data = self.connection.read(self.max_read)
+            if data:
+                self._deliver(data, time.monotonic())
+        except Exception as e:
+            self._failed(e)
+
+    async def _poll(self):
+        loop = self.loop
+        while self.is_running() and self.connection.is_open:
+            try:
+                chunk = await loop.run_in_executor(self.executor, self._read)
+                if chunk is not None:
+                    self._deliver(*chunk)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._failed(e)
+                return
+        self._detach()
+
+    def _failed(self, error: Exception):
+        """Okumayı bırak, 1 s sonra yeniden bağlan (thread sürümündeki bekleme gibi)"""
+        if self.fd is not None:
+            self.loop.remove_reader(self.fd)
+            self.fd = None
+        self.task = None
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if not self.is_running():
+            self._detach()
+            return
+        if self.on_error:
+            self.on_error(error)
+        self._idle_handle = self.loop.call_later(1.0, self._attach)
+
+
+class LineFramer:
+    """bytearray tabanlı, sınırlı tamponlu satır ayırıcı
+
+    Gelen byte'lar tek bir bytearray'e eklenir; ayraçlar (\\n veya \\r) hareketli
+    bir ofsetten find() ile aranır ve satırlar memoryview dilimi olarak verilir.
+    Dilimler yalnızca bir sonraki satıra geçilene kadar geçerlidir, saklanacaksa
+    bytes()/str() ile kopyalanmalıdır. max_line'ı aşan satırlar atılır ve
+    dropped_bytes sayacına eklenir; tampon hiçbir zaman max_line'ı geçmez.
+
+    markers verilirse yalnızca bu byte dizilerinden birini içeren satırlar
+    verilir, diğerleri decode edilmeden sayılıp atlanır.
+    """
+
+    def __init__(self, max_line: int = 1024, markers: tuple = ()):
+        self.buffer = bytearray()
+        self.max_line = max_line
+        self.markers = markers
+        self.lines = 0
+        self.rejected_lines = 0
+        self.dropped_bytes = 0
+        self.line_started_at = 0.0  # Verilen satırın ilk byte'ının geliş zamanı
+        self._discarding = False
+
+    def feed(self, data, received_at: float = 0.0):
+        """Byte'ları ekle ve tamamlanan satırları memoryview olarak üret"""
+        buffer = self.buffer
+        if not buffer:
+            self.line_started_at = received_at
+        buffer += data
+        end = len(buffer)
+        pos = 0
+        max_line = self.max_line
+        markers = self.markers
+        view = memoryview(buffer)
+        try:
+            while pos < end:
+                newline = buffer.find(b'\n', pos)
+                carriage = buffer.find(b'\r', pos, newline if newline >= 0 else end)
+                delimiter = carriage if carriage >= 0 else newline
+                if delimiter < 0:
+                    break
+                start, pos = pos, delimiter + 1
+                if self._discarding:
+                    # Sınırı aşmış satırın kalanı
+                    self._discarding = False
+                    self.dropped_bytes += delimiter - start
+                    continue
+                if delimiter == start:
+                    continue  # Boş satır (\r\n ayraçları arası)
+                if delimiter - start > max_line:
+                    self.dropped_bytes += delimiter - start
+                    continue
+                if markers and not any(buffer.find(marker, start, delimiter) >= 0 for marker in markers):
+                    self.rejected_lines += 1
+                    continue
+                self.lines += 1
+                line = view[start:delimiter]
+                try:
+                    yield line
+                finally:
+                    line.release()
+                self.line_started_at = received_at
+        finally:
+            view.release()
+            if pos:
+                del buffer[:pos]
+            if len(buffer) > max_line:
+                # Ayraç gelmeden sınır aşıldı - satırın sonuna kadar at
+                self.dropped_bytes += len(buffer)
+                buffer.clear()
+                self._discarding = True
+
+    def reset(self):
+        """Tamponu temizle"""
+        self.buffer.clear()
+        self._discarding = False
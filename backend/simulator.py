@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sanal seri port simülatörü (LoRa, payload GPS ve HYİ yük testi)
+
+Donanım olmadan sanal portlar oluşturur ve gerçekçi bir uçuş profilinden
+roket telemetrisi (metin veya ikili çerçeve), payload PAYLOAD_GPS fix/nofix ve
+gyro satırları, NMEA $GPGGA ve ALL= (veya --binary ile ikili) sıvı seviye
+çerçeveleri üretir. HYİ portuna yazılan paketler yakalanıp çerçeve, CheckSum
+ve hız açısından doğrulanır.
+
+Taşıma katmanları:
+    pty     Sözde terminal; istasyon slave yolunu normal seri port gibi açar (Linux/macOS)
+    tcp     socket://127.0.0.1:<port>; istasyon pyserial serial_for_url ile bağlanır
+    loop    loop:// - yalnızca --in-process; simülatör istasyonun bağlantısına yazar
+
+Kullanım:
+    cd backend
+    python simulator.py                              # portları oluştur, yolları yazdır
+    python simulator.py --in-process --duration 10 --rocket-rate 500 --payload-rate 100
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import socket
+import sys
+import threading
+import time
+
+from hyi_packet import CHECKSUM_END, CHECKSUM_START, HYI_HEADER, HYI_PACKET_SIZE
+from lora_frames import encode_liquid_frame, encode_rocket_frame
+
+
+class FlightProfile:
+    """Basit tek kademeli uçuş modeli: itki, süzülme, apoje, sürüklenme paraşütü, ana paraşüt"""
+
+    BURN_TIME = 3.0
+    BURN_ACCEL = 80.0
+    GRAVITY = 9.81
+    DROGUE_RATE = -25.0
+    MAIN_RATE = -8.0
+    MAIN_ALTITUDE = 500.0
+
+    def __init__(self, latitude: float = 39.925019, longitude: float = 32.836954, seed: int = None):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.random = random.Random(seed)
+        burnout_velocity = (self.BURN_ACCEL - self.GRAVITY) * self.BURN_TIME
+        burnout_altitude = 0.5 * (self.BURN_ACCEL - self.GRAVITY) * self.BURN_TIME ** 2
+        self.coast_time = burnout_velocity / self.GRAVITY
+        self.apogee_time = self.BURN_TIME + self.coast_time
+        self.apogee = burnout_altitude + burnout_velocity * self.coast_time - 0.5 * self.GRAVITY * self.coast_time ** 2
+        self.main_time = self.apogee_time + (self.apogee - self.MAIN_ALTITUDE) / -self.DROGUE_RATE
+        self.landing_time = self.main_time + self.MAIN_ALTITUDE / -self.MAIN_RATE
+        self.duration = self.landing_time + 10.0
+
+    def state(self, t: float) -> dict:
+        """Uçuşun t. saniyesindeki roket durumu (profil sonunda başa sarar)"""
+        t %= self.duration
+        g, a = self.GRAVITY, self.BURN_ACCEL
+        if t < self.BURN_TIME:
+            altitude, velocity, accel = 0.5 * (a - g) * t * t, (a - g) * t, a
+        elif t < self.apogee_time:
+            tc = t - self.BURN_TIME
+            v0 = (a - g) * self.BURN_TIME
+            altitude = 0.5 * (a - g) * self.BURN_TIME ** 2 + v0 * tc - 0.5 * g * tc * tc
+            velocity, accel = v0 - g * tc, 0.0
+        elif t < self.main_time:
+            altitude, velocity, accel = self.apogee + self.DROGUE_RATE * (t - self.apogee_time), self.DROGUE_RATE, g
+        elif t < self.landing_time:
+            altitude, velocity, accel = self.MAIN_ALTITUDE + self.MAIN_RATE * (t - self.main_time), self.MAIN_RATE, g
+        else:
+            altitude, velocity, accel = 0.0, 0.0, g
+
+        noise = self.random.gauss
+        drift = max(0.0, t - self.apogee_time) * 2e-5
+        return {
+            'altitude': altitude + noise(0, 0.3),
+            'max_altitude': self.apogee if t >= self.apogee_time else altitude,
+            'delta_y': velocity,
+            'fired': t >= self.apogee_time,
+            'p1': t >= self.apogee_time,
+            'p2': t >= self.main_time,
+            'gyro_x': noise(0, 2.0), 'gyro_y': noise(0, 2.0), 'gyro_z': 30.0 * math.sin(t) + noise(0, 1.0),
+            'accel_x': noise(0, 0.2), 'accel_y': noise(0, 0.2), 'accel_z': accel + noise(0, 0.3),
+            'pitch': 88.0 - min(t, self.apogee_time) * 0.5,
+            'gps_valid': t > 0.5 and self.random.random() > 0.02,
+            'gps_latitude': self.latitude + drift,
+            'gps_longitude': self.longitude + drift * 0.7,
+            'gps_altitude': altitude + noise(0, 2.0),
+        }
+
+
+def rocket_line(sample: dict) -> bytes:
+    """LoRa metin satırı (uçuş bilgisayarı formatı)"""
+    gps = (f"GPS:{sample['gps_latitude']:.6f},{sample['gps_longitude']:.6f}|GPS_ALT:{sample['gps_altitude']:.1f}"
+           if sample['gps_valid'] else "GPS:invalid")
+    return (f"ALT:{sample['altitude']:.1f}m|maxALT:{sample['max_altitude']:.1f}m|dY:{sample['delta_y']:.1f}|"
+            f"F:{int(sample['fired'])}|P1:{int(sample['p1'])}|P2:{int(sample['p2'])}|"
+            f"gX:{sample['gyro_x']:.1f}|gY:{sample['gyro_y']:.1f}|gZ:{sample['gyro_z']:.1f}|"
+            f"aX:{sample['accel_x']:.2f}|aY:{sample['accel_y']:.2f}|aZ:{sample['accel_z']:.2f}|"
+            f"pitch:{sample['pitch']:.1f}|{gps}\r\n").encode()
+
+
+def payload_lines(sample: dict) -> bytes:
+    """Görev yükü PAYLOAD_GPS fix/nofix satırı ve gyro satırı"""
+    latitude, longitude = sample['gps_latitude'] + 1e-4, sample['gps_longitude'] + 1e-4
+    altitude = max(0.0, sample['gps_altitude'] - 5.0)
+    if sample['gps_valid']:
+        gps = f"PAYLOAD_GPS fix {latitude:.6f} {longitude:.6f} {altitude:.1f}"
+    else:
+        gps = f"PAYLOAD_GPS nofix lat={latitude:.6f}, lon={longitude:.6f}, alt={altitude:.1f} m"
+    gyro = f"gX(roll)={sample['gyro_x']:.1f} gY(pitch)={sample['gyro_y']:.1f} gZ(yaw)={sample['gyro_z']:.1f}"
+    return f"{gps}\r\n{gyro}\r\n".encode()
+
+
+def nmea_gpgga(sample: dict, t: float) -> bytes:
+    """Checksum'lı NMEA $GPGGA cümlesi"""
+    def dm(value, width):
+        degrees = int(abs(value))
+        return f"{degrees:0{width}d}{(abs(value) - degrees) * 60:07.4f}"
+    clock = time.gmtime(t)
+    body = (f"GPGGA,{clock.tm_hour:02d}{clock.tm_min:02d}{clock.tm_sec:02d}.00,"
+            f"{dm(sample['gps_latitude'], 2)},{'N' if sample['gps_latitude'] >= 0 else 'S'},"
+            f"{dm(sample['gps_longitude'], 3)},{'E' if sample['gps_longitude'] >= 0 else 'W'},"
+            f"1,08,0.9,{max(0.0, sample['gps_altitude']):.1f},M,36.0,M,,")
+    checksum = 0
+    for char in body.encode():
+        checksum ^= char
+    return f"${body}*{checksum:02X}\r\n".encode()
+
+
+def liquid_levels(t: float) -> bytes:
+    """24 sensörün seviyeleri; zamanla azalır"""
+    return bytes(max(1, int(255 - t * (2 + index % 5)) % 256) for index in range(24))
+
+
+def liquid_frame(t: float) -> bytes:
+    """ALL= 24 sensörlük (192 bit) sıvı seviye çerçevesi"""
+    return ("ALL=" + ''.join(f"{level:08b}" for level in liquid_levels(t)) + "\r\n").encode()
+
+
+class PtyTransport:
+    """Sözde terminal; name istasyonun açacağı slave yoludur"""
+
+    def __init__(self):
+        import tty
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.master)
+        tty.setraw(self.slave)
+        self.name = os.ttyname(self.slave)
+
+    def write(self, data: bytes):
+        os.write(self.master, data)
+
+    def read(self, size: int = 4096, timeout: float = 0.2) -> bytes:
+        import select
+        if not select.select([self.master], [], [], timeout)[0]:
+            return b''
+        try:
+            return os.read(self.master, size)
+        except OSError:
+            return b''
+
+    def close(self):
+        for fd in (self.master, self.slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class TcpTransport:
+    """socket:// sunucusu; istasyon serial_for_url ile bağlanır (tek istemci)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind((host, port))
+        self.server.listen(1)
+        self.name = f"socket://{host}:{self.server.getsockname()[1]}"
+        self.client = None
+        self.dropped_bytes = 0
+        threading.Thread(target=self._accept, name="sim-accept", daemon=True).start()
+
+    def _accept(self):
+        try:
+            client, _ = self.server.accept()
+        except OSError:
+            return
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.client = client
+
+    def write(self, data: bytes):
+        if self.client is None:
+            self.dropped_bytes += len(data)
+            return
+        self.client.sendall(data)
+
+    def read(self, size: int = 4096, timeout: float = 0.2) -> bytes:
+        if self.client is None:
+            time.sleep(timeout)
+            return b''
+        self.client.settimeout(timeout)
+        try:
+            return self.client.recv(size)
+        except socket.timeout:
+            return b''
+
+    def close(self):
+        for sock in (self.client, self.server):
+            if sock:
+                sock.close()
+
+
+class LoopTransport:
+    """loop:// - istasyonun açtığı loopback bağlantısının öbür ucu (aynı süreç)"""
+
+    def __init__(self):
+        self.name = 'loop://'
+        self.connection = None  # start_system sonrası attach() ile bağlanır
+
+    def attach(self, connection):
+        self.connection = connection
+
+    def write(self, data: bytes):
+        if self.connection is not None:
+            self.connection.write(data)
+
+    def read(self, size: int = 4096, timeout: float = 0.2) -> bytes:
+        if self.connection is None:
+            time.sleep(timeout)
+            return b''
+        # Okuma zaman aşımı istasyonun bağlantı ayarından gelir
+        return self.connection.read(max(1, min(self.connection.in_waiting, size)))
+
+    def close(self):
+        pass
+
+
+TRANSPORTS = {'pty': PtyTransport, 'tcp': TcpTransport, 'loop': LoopTransport}
+
+
+class PortStream:
+    """Bir porta birden fazla satır üreticisini kendi hızlarında yazan thread
+
+    Her turda başlangıçtan beri gönderilmesi gereken satır sayısı hesaplanır ve
+    eksik kalanlar tek bir write ile gönderilir; böylece sleep çözünürlüğünün
+    çok üzerindeki hızlar (kHz) da tutturulur.
+    """
+
+    def __init__(self, name: str, transport, generators):
+        self.name = name
+        self.transport = transport
+        self.generators = [(label, rate, make) for label, rate, make in generators if rate > 0]
+        self.sent = {label: 0 for label, _, _ in self.generators}
+        self.bytes_sent = 0
+        self.write_errors = 0
+        self._stop = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._loop, name=f"sim-{self.name}", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        if not self.generators:
+            return
+        start = time.monotonic()
+        tick = min(0.01, 1.0 / max(rate for _, rate, _ in self.generators))
+        while not self._stop.wait(tick):
+            elapsed = time.monotonic() - start
+            chunk = bytearray()
+            for label, rate, make in self.generators:
+                due = int(elapsed * rate) - self.sent[label]
+                for index in range(due):
+                    chunk += make(elapsed - (due - 1 - index) / rate)
+                self.sent[label] += due
+            if chunk:
+                try:
+                    self.transport.write(bytes(chunk))
+                    self.bytes_sent += len(chunk)
+                except OSError:
+                    self.write_errors += 1
+
+
+class HyiCapture:
+    """HYİ portuna yazılan paketleri yakalayıp doğrulayan okuyucu"""
+
+    def __init__(self, transport, output_path: str = None):
+        self.transport = transport
+        self.output = open(output_path, 'wb') if output_path else None
+        self.buffer = bytearray()
+        self.packets = 0
+        self.bad_checksum = 0
+        self.bad_footer = 0
+        self.skipped_bytes = 0
+        self.first_at = None
+        self.last_at = None
+        self.last_counter = None
+        self.counter_gaps = 0
+        self._stop = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._loop, name="sim-hyi-capture", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self.thread:
+            self.thread.join(timeout=1)
+        if self.output:
+            self.output.close()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            data = self.transport.read()
+            if data:
+                self.feed(data)
+
+    def feed(self, data: bytes):
+        buffer = self.buffer
+        buffer += data
+        while True:
+            start = buffer.find(HYI_HEADER)
+            if start < 0:
+                keep = len(HYI_HEADER) - 1
+                self.skipped_bytes += max(0, len(buffer) - keep)
+                del buffer[:-keep or None]
+                return
+            if start:
+                self.skipped_bytes += start
+                del buffer[:start]
+            if len(buffer) < HYI_PACKET_SIZE:
+                return
+            packet = bytes(buffer[:HYI_PACKET_SIZE])
+            del buffer[:HYI_PACKET_SIZE]
+            if packet[-2:] != b'\r\n':
+                self.bad_footer += 1
+                continue
+            if sum(packet[CHECKSUM_START:CHECKSUM_END]) & 0xFF != packet[CHECKSUM_END]:
+                self.bad_checksum += 1
+                continue
+            now = time.monotonic()
+            if self.first_at is None:
+                self.first_at = now
+            self.last_at = now
+            counter = packet[5]
+            if self.last_counter is not None and counter != (self.last_counter + 1) % 256:
+                self.counter_gaps += 1
+            self.last_counter = counter
+            self.packets += 1
+            if self.output:
+                self.output.write(packet)
+
+    def snapshot(self) -> dict:
+        span = (self.last_at - self.first_at) if self.packets > 1 else 0.0
+        return {
+            'packets': self.packets,
+            'rate_hz': round((self.packets - 1) / span, 2) if span else 0.0,
+            'bad_checksum': self.bad_checksum,
+            'bad_footer': self.bad_footer,
+            'counter_gaps': self.counter_gaps,
+            'skipped_bytes': self.skipped_bytes,
+        }
+
+
+class Simulator:
+    """LoRa, payload ve HYİ sanal portlarını ve üreticilerini bir arada yöneten simülatör"""
+
+    def __init__(self, transport: str = 'pty', rocket_rate: float = 20.0, payload_rate: float = 5.0,
+                 nmea_rate: float = 1.0, liquid_rate: float = 2.0, binary: bool = False,
+                 hyi_output: str = None, seed: int = None):
+        factory = TRANSPORTS[transport]
+        self.profile = FlightProfile(seed=seed)
+        self.lora = factory()
+        self.payload = factory()
+        self.hyi = factory()
+        self._seq = 0
+        self._liquid_seq = 0
+        lora_generator = self._rocket_frame if binary else self._rocket_line
+        liquid_generator = self._liquid_frame if binary else liquid_frame
+        self.streams = [
+            PortStream('lora', self.lora, [('rocket', rocket_rate, lora_generator)]),
+            PortStream('payload', self.payload, [
+                ('payload', payload_rate, lambda t: payload_lines(self.profile.state(t))),
+                ('nmea', nmea_rate, lambda t: nmea_gpgga(self.profile.state(t), time.time())),
+                ('liquid', liquid_rate, liquid_generator),
+            ]),
+        ]
+        self.capture = HyiCapture(self.hyi, hyi_output)
+
+    def _rocket_line(self, t: float) -> bytes:
+        return rocket_line(self.profile.state(t))
+
+    def _rocket_frame(self, t: float) -> bytes:
+        self._seq += 1
+        return encode_rocket_frame(self.profile.state(t), self._seq)
+
+    def _liquid_frame(self, t: float) -> bytes:
+        self._liquid_seq += 1
+        return encode_liquid_frame(liquid_levels(t), self._liquid_seq)
+
+    @property
+    def port_names(self) -> dict:
+        return {'lora': self.lora.name, 'payload': self.payload.name, 'hyi': self.hyi.name}
+
+    def attach(self, station):
+        """loop:// taşımasında istasyonun açtığı bağlantıları simülatöre bağla"""
+        for transport, connection in ((self.lora, station.lora_connection),
+                                      (self.payload, station.payload_gps_connection),
+                                      (self.hyi, station.hyi_connection)):
+            if isinstance(transport, LoopTransport):
+                transport.attach(connection)
+
+    def start(self):
+        self.capture.start()
+        for stream in self.streams:
+            stream.start()
+
+    def stop(self):
+        for stream in self.streams:
+            stream.stop()
+        self.capture.stop()
+        for transport in (self.lora, self.payload, self.hyi):
+            transport.close()
+
+    def snapshot(self) -> dict:
+        sent = {}
+        for stream in self.streams:
+            sent.update(stream.sent)
+        return {
+            'ports': self.port_names,
+            'sent': sent,
+            'bytes_sent': {stream.name: stream.bytes_sent for stream in self.streams},
+            'write_errors': sum(stream.write_errors for stream in self.streams),
+            'hyi': self.capture.snapshot(),
+        }
+
+
+def run_in_process(simulator: Simulator, duration: float, lora_mode: str, log_level: str,
+                   async_core: bool = False, ingest_processes: bool = False) -> dict:
+    """İstasyonu aynı süreçte simülatör portlarına bağla, duration saniye çalıştır ve özetle
+
+    async_core ile alıcılar ve HYİ zamanlayıcısı tek bir asyncio döngüsünde çalışır.
+    ingest_processes ile LoRa / Payload GPS ayrı süreçlerde okunur (pty veya tcp gerekir).
+    """
+    from main_system import TEKNOFESTGroundStation
+    from station_async import StationLoop
+
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(log_level)
+    station_loop = StationLoop(station) if async_core else None
+    if station_loop:
+        station_loop.start()
+    ports = simulator.port_names
+    if not station.start_system(0, ports['lora'], ports['payload'], ports['hyi'],
+                                lora_mode=lora_mode, record=False, ingest_processes=ingest_processes):
+        raise RuntimeError("İstasyon simülatör portlarına bağlanamadı")
+    simulator.attach(station)
+    cpu_start = time.process_time()
+    simulator.start()
+    time.sleep(duration)
+    simulator.stop()
+    time.sleep(0.3)  # Yoldaki son satırlar
+    cpu = time.process_time() - cpu_start
+    telemetry = station.telemetry
+    result = {
+        'duration_s': duration,
+        'core': 'asyncio' if async_core else 'threads',
+        'simulator': simulator.snapshot(),
+        'station': {
+            'lora_packets': telemetry.packet_count,
+            'payload_packets': telemetry.payload_packet_count,
+            'lora_lines': station.lora_framer.lines,
+            'payload_lines': station.payload_framer.lines,
+            'lora_binary_frames': station.lora_decoder.frames_ok,
+            'liquid_binary_frames': station.payload_frames.frames_ok,
+            'dropped_bytes': station.lora_framer.dropped_bytes + station.payload_framer.dropped_bytes,
+            'latency': {port: stats.snapshot() for port, stats in station.latency.items()},
+            'ingest': station.ingest.snapshot() if station.ingest else None,
+            'hyi_scheduler': station.hyi_scheduler.snapshot() if station.hyi_scheduler else None,
+            'metrics': station.metrics.snapshot(),
+        },
+        'cpu_s': round(cpu, 3),
+        'cpu_percent': round(cpu / duration * 100, 1),
+    }
+    if station_loop:
+        station_loop.stop()
+    else:
+        station.stop_system()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sanal seri port simülatörü")
+    parser.add_argument('--transport', choices=tuple(TRANSPORTS), default='pty')
+    parser.add_argument('--rocket-rate', type=float, default=20.0, help="LoRa roket satırı/çerçevesi (Hz)")
+    parser.add_argument('--payload-rate', type=float, default=5.0, help="PAYLOAD_GPS + gyro satırı (Hz)")
+    parser.add_argument('--nmea-rate', type=float, default=1.0, help="$GPGGA (Hz)")
+    parser.add_argument('--liquid-rate', type=float, default=2.0, help="ALL= sıvı seviye çerçevesi (Hz)")
+    parser.add_argument('--binary', action='store_true', help="LoRa'da ve sıvı seviyesinde metin yerine ikili çerçeve gönder")
+    parser.add_argument('--hyi-out', help="Yakalanan HYİ paketlerinin yazılacağı dosya")
+    parser.add_argument('--seed', type=int, help="Gürültü üreteci tohumu")
+    parser.add_argument('--in-process', action='store_true', help="İstasyonu aynı süreçte çalıştır ve özetle")
+    parser.add_argument('--duration', type=float, default=10.0, help="--in-process süresi (s)")
+    parser.add_argument('--log-level', default='off', help="--in-process istasyon log seviyesi")
+    parser.add_argument('--async-core', action='store_true', help="--in-process istasyonu asyncio çekirdeğiyle çalıştır")
+    parser.add_argument('--ingest-processes', action='store_true',
+                        help="--in-process LoRa / Payload GPS alımını ayrı süreçlerde çalıştır")
+    args = parser.parse_args(argv)
+
+    if args.transport == 'loop' and (not args.in_process or args.ingest_processes):
+        parser.error("loop:// yalnızca --in-process ile ve işçi süreçleri olmadan kullanılabilir")
+
+    simulator = Simulator(args.transport, args.rocket_rate, args.payload_rate, args.nmea_rate,
+                          args.liquid_rate, args.binary, args.hyi_out, args.seed)
+
+    if args.in_process:
+        result = run_in_process(simulator, args.duration, 'binary' if args.binary else 'auto', args.log_level,
+                                args.async_core, args.ingest_processes)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 0
+
+    ports = simulator.port_names
+    print("🧪 Simülatör portları:")
+    print(f"   LoRa:        {ports['lora']}")
+    print(f"   Payload GPS: {ports['payload']}")
+    print(f"   HYİ:         {ports['hyi']}")
+    print("   /api/connect isteğinde bu adları kullanın. Çıkmak için Ctrl+C.")
+    simulator.start()
+    try:
+        while True:
+            time.sleep(5)
+            print(json.dumps(simulator.snapshot(), ensure_ascii=False))
+    except KeyboardInterrupt:
+        print("\n🛑 Simülatör durduruldu")
+    finally:
+        simulator.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""asyncio istasyon çekirdeği (opsiyonel)
+
+LoRa ve Payload GPS portları tek bir olay döngüsüne bağlanır (AsyncSerialReader:
+fd varsa loop.add_reader, yoksa portun tek işçili executor'ı), parse işlemleri
+ve HYİ zamanlayıcısı aynı döngüde çalışır. Port başına alıcı thread'i ve
+bunların GIL için yarışması ortadan kalkar; port sayısı arttıkça gecikme
+yalnızca döngünün yüküne bağlıdır.
+
+HTTP API aynı döngüde uvicorn ile sunulur, Flask rotaları asgiref'in
+WsgiToAsgi adaptörünün arkasında değişmeden çalışır. Adaptör her isteği
+döngünün varsayılan executor'ında işler; SSE akışları istemci başına bir
+işçi tuttuğundan havuz HTTP_WORKERS ile büyütülür.
+
+Kullanım:
+    pip install uvicorn asgiref
+    cd backend
+    python station_async.py [--host 0.0.0.0] [--port 8000]
+
+Thread tabanlı sunucu (python main_system.py) varsayılan olarak kalır.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:
+    WsgiToAsgi = None
+
+try:
+    import uvicorn
+except ImportError:
+    uvicorn = None
+
+HTTP_WORKERS = 64
+
+
+class StationLoop:
+    """İstasyonun alıcılarını ve HYİ zamanlayıcısını ayrı bir thread'deki döngüde çalıştır
+
+    HTTP sunucusu olmadan (simülatör, benchmark) asyncio çekirdeğini
+    kullanmak içindir. start() start_system'den önce, stop() en sonda çağrılır.
+    """
+
+    def __init__(self, station):
+        self.station = station
+        self.loop = None
+        self.thread = None
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="station-loop")
+        self.thread.daemon = True
+        self.thread.start()
+        self.station.event_loop = self.loop
+        return self.loop
+
+    def stop(self):
+        if self.station.running:
+            self.station.stop_system()
+        self.station.event_loop = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(2.0)
+        self.loop.close()
+
+
+def create_asgi_app(flask_app):
+    """Flask uygulamasını ASGI uygulaması olarak sar"""
+    if WsgiToAsgi is None:
+        raise RuntimeError("asgiref kurulu değil: pip install asgiref")
+    return WsgiToAsgi(flask_app)
+
+
+async def serve(station, flask_app, host: str = '0.0.0.0', port: int = 8000):
+    """HTTP API'yi ve istasyonu çalışan olay döngüsünde sun (sunucu kapanana kadar)"""
+    if uvicorn is None:
+        raise RuntimeError("uvicorn kurulu değil: pip install uvicorn")
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=HTTP_WORKERS, thread_name_prefix="http"))
+    station.event_loop = loop
+    config = uvicorn.Config(create_asgi_app(flask_app), host=host, port=port, lifespan='off', log_level='warning')
+    try:
+        await uvicorn.Server(config).serve()
+    finally:
+        # stop_system kapanışı beklerken döngü okuyucuları ayırmaya devam etmeli
+        await loop.run_in_executor(None, station.stop_system)
+        station.event_loop = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yer istasyonu (asyncio çekirdeği)")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    from main_system import app, ground_station
+    from station_log import RotatingFileSink
+
+    print("🚀 TOBB ETU Yer İstasyonu v2.0 - asyncio çekirdeği")
+    print(f"🔌 Backend: http://localhost:{args.port}")
+    ground_station.log.add_sink(RotatingFileSink(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'ground_station.log')))
+    try:
+        asyncio.run(serve(ground_station, app, args.host, args.port))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    except KeyboardInterrupt:
+        print("\n🛑 Server durduruldu")
+    finally:
+        ground_station.log.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Telemetri kaynak linkleri (port kayıt defteri)
+
+Her link bir seri port, kendi satır ayırıcı / çerçeve çözücü durumu, bir
+parser türü (kind) ve telemetride yazdığı bölümden (section) oluşur:
+
+    kind     section            veri
+    lora     rocket             ALT: satırları veya ikili roket çerçeveleri
+    payload  payload | stage    PAYLOAD_GPS / $GPGGA / GPS: satırları (+ payload'da gyro, ALL=, ikili sıvı)
+
+Kademe (stage) linki payload parser'ının konum formatlarını kullanır ve
+kademe GPS alanlarına yazar; HYİ paketinin kademe GPS byte'ları buradan dolar.
+
+Her link kendi okuyucusunda yalnızca kendi durumuyla çalışır; link eklemek
+mevcut linklerin örnek başına işini artırmaz. Aynı bölüme yazan yedek linkler
+(ör. iki farklı antendeki LoRa alıcısı) bir LinkArbiter paylaşır: her örnek
+bir kez parse edilip işlenir, eski örnekler yenilerin üzerine yazılmaz ve
+link başına kayıp oranı ile ilk linke göre gecikme farkı ölçülür. Tek link
+varken hakem yoktur, örnek yolu değişmez.
+"""
+
+import threading
+from collections import OrderedDict
+
+from lora_frames import LIQUID_FRAME, BinaryFrameDecoder, EmbeddedFrameExtractor
+from serial_io import LatencyStats, LineFramer
+
+# Geçerli (kind, section) çiftleri; ilk bölüm varsayılandır
+LINK_SECTIONS = {
+    'lora': ('rocket',),
+    'payload': ('payload', 'stage'),
+}
+
+# Sıra numarası bu kadar geride kalan çerçeve eski sayılır, daha gerisi
+# göndericinin yeniden başladığı anlamına gelir (20 Hz'de ~3 s)
+SEQUENCE_WINDOW = 64
+
+# Tekrar penceresi: bu süre içinde başka linkten gelen aynı örnek tekrar sayılır
+DEDUP_WINDOW = 2.0
+DEDUP_MAX_KEYS = 512
+
+# Tahmini örnek zamanları bu kadar yakın iki örnek aynı ana aittir (20 Hz'in yarı periyodu)
+SAME_SAMPLE = 0.025
+
+# Link kalitesi (teslim oranı) ve gecikme farkı için üstel ortalama katsayısı
+QUALITY_ALPHA = 0.05
+
+
+class LinkArbiter:
+    """Bir bölümün yedek linkleri için tekrar ayıklama ve alan bazında seçim
+
+    admit() örnek kimliğini (ikili çerçevede sıra numarası, metinde satırın
+    kendisi) kayan pencerede arar. Başka linkten zaten gelmişse tekrardır ve
+    parse edilmeden atlanır; sıra numarası son kabul edilenin gerisindeyse
+    eskidir. Aynı linkin aynı satırı yeniden getirmesi yeni örnektir (rampada
+    değişmeyen satırlar).
+
+    select() kabul edilen örneğin alanlarını tek tek seçer: alan, mevcut
+    değerinden daha yeni bir ana aitse (tahmini örnek zamanı = varış - linkin
+    gecikme farkı) yazılır; aynı ana ait iki farklı örnekte teslim oranı
+    yüksek olan linkin değeri kalır.
+
+    Pencereden düşen her örneğin hangi linklerden geldiği bilindiğinden link
+    başına teslim / kayıp sayıları ve kalite buradan güncellenir.
+
+    Yedek linkler ayrı alıcı thread'lerinden çağırır; admit() ve select()
+    (pencere temizliği dahil) tamamen hakemin kilidi altında çalışır.
+    """
+
+    def __init__(self, links=()):
+        self.links = list(links)
+        self.recent = OrderedDict()  # kimlik -> (ilk varış, teslim eden linkler)
+        self.fields = {}  # alan -> (tahmini örnek zamanı, yazan linkin kalitesi)
+        self.last_seq = None
+        self.last_seq_at = 0.0
+        self.accepted = 0
+        self.duplicates = 0
+        self.stale = 0
+        self.field_rejects = 0
+        self.lock = threading.Lock()
+
+    def admit(self, link, key, now: float) -> bool:
+        """Örnek yeni ise True; tekrar veya eski ise linkte sayıp False döndür"""
+        with self.lock:
+            recent = self.recent
+            if recent:
+                self._expire(now)
+            entry = recent.get(key)
+            if entry is not None and link not in entry[1]:
+                entry[1].append(link)
+                lag = now - entry[0]
+                link.lag.record(lag)
+                link.lag_avg += QUALITY_ALPHA * (lag - link.lag_avg)
+                link.duplicates += 1
+                self.duplicates += 1
+                return False
+            if type(key) is int:
+                last = self.last_seq
+                if last is not None and now - self.last_seq_at < DEDUP_WINDOW and ((last - key) & 0xFFFF) < SEQUENCE_WINDOW:
+                    link.stale += 1
+                    self.stale += 1
+                    return False
+                self.last_seq = key
+                self.last_seq_at = now
+            if entry is not None:
+                # Aynı linkten aynı içerik: öncekinin teslimi kapanır, yeni örnek başlar
+                del recent[key]
+                self._settle(entry[1])
+            recent[key] = (now, [link])
+            link.lag_avg -= QUALITY_ALPHA * link.lag_avg
+            link.samples += 1
+            self.accepted += 1
+            return True
+
+    def select(self, link, updates: dict, received_at: float) -> dict:
+        """Örneğin alanlarından daha taze olmayanları çıkar (updates yerinde değişir)"""
+        with self.lock:
+            fields = self.fields
+            sample_time = received_at - link.lag_avg
+            quality = link.quality
+            for name in list(updates):
+                held = fields.get(name)
+                if held is not None:
+                    age = sample_time - held[0]
+                    if age <= SAME_SAMPLE and (age < -SAME_SAMPLE or quality < held[1]):
+                        del updates[name]
+                        self.field_rejects += 1
+                        continue
+                fields[name] = (sample_time, quality)
+            return updates
+
+    def _expire(self, now: float):
+        recent = self.recent
+        horizon = now - DEDUP_WINDOW
+        while recent:
+            key = next(iter(recent))
+            if recent[key][0] >= horizon and len(recent) <= DEDUP_MAX_KEYS:
+                break
+            self._settle(recent.pop(key)[1])
+
+    def _settle(self, delivered: list):
+        for link in self.links:
+            if link in delivered:
+                link.delivered += 1
+                link.quality += QUALITY_ALPHA * (1.0 - link.quality)
+            else:
+                link.missed += 1
+                link.quality -= QUALITY_ALPHA * link.quality
+
+    def reset(self):
+        with self.lock:
+            self.recent.clear()
+            self.fields.clear()
+            self.last_seq = None
+
+    def snapshot(self) -> dict:
+        return {
+            'links': [link.name for link in self.links],
+            'accepted': self.accepted,
+            'duplicates': self.duplicates,
+            'stale': self.stale,
+            'field_rejects': self.field_rejects,
+            'window': len(self.recent),
+        }
+
+
+class Link:
+    """Bir telemetri kaynağı: port, ayırıcı / çözücü durumu ve hedef bölüm
+
+    Metrik nesneleri (parse süresi, sayaçlar) istasyon tarafından atanır.
+    """
+
+    def __init__(self, name: str, kind: str, section: str = None, channel: int = None):
+        if kind not in LINK_SECTIONS:
+            raise ValueError(f"Bilinmeyen link türü: {kind}")
+        section = section or LINK_SECTIONS[kind][0]
+        if section not in LINK_SECTIONS[kind]:
+            raise ValueError(f"{kind} linki {section} bölümüne yazamaz")
+        self.name = name
+        self.kind = kind
+        self.section = section
+        self.channel = channel  # Uçuş kaydı kanalı
+        self.device = None
+        self.connection = None
+        self.reader = None
+        self.mode = "auto"  # LoRa: auto, text veya binary
+        self.framer = LineFramer(markers=(b'ALT:',)) if kind == 'lora' else LineFramer()
+        self.decoder = BinaryFrameDecoder() if kind == 'lora' else None
+        self.frames = EmbeddedFrameExtractor(LIQUID_FRAME.size) if section == 'payload' else None
+        self.frame_start = 0.0
+        self.latency = LatencyStats()
+        self.arbiter = None  # Yedek link varsa bölümün ortak LinkArbiter'ı
+        self.samples = 0  # Hakemden ilk geçen örnekler
+        self.duplicates = 0  # Başka linkten önce gelmiş örnekler
+        self.stale = 0  # Son kabul edilenden eski sıra numaraları
+        self.delivered = 0  # Penceresi kapanan örneklerden bu linkin getirdikleri
+        self.missed = 0  # ... ve getiremedikleri
+        self.quality = 1.0  # Teslim oranının üstel ortalaması
+        self.lag = LatencyStats()  # Tekrar örneklerde ilk linke göre gecikme
+        self.lag_avg = 0.0
+        self.dispatch = {}  # Payload ön ek tablosu (istasyon doldurur)
+        self.last_status = 0.0
+        self.parsed = None
+        self.rejected = None
+        self.text_parse_time = None
+        self.binary_parse_time = None
+
+    @property
+    def connected(self) -> bool:
+        return self.connection is not None and self.connection.is_open
+
+    def reset(self):
+        self.framer.reset()
+        if self.decoder:
+            self.decoder.reset()
+        if self.frames:
+            self.frames.reset()
+        self.frame_start = 0.0
+
+    def snapshot(self) -> dict:
+        reader = self.reader
+        return {
+            'kind': self.kind,
+            'section': self.section,
+            'device': self.device,
+            'connected': self.connected,
+            'mode': self.mode if self.kind == 'lora' else None,
+            'bytes_read': reader.bytes_read if reader else 0,
+            'lines': self.framer.lines,
+            'binary_frames': (self.decoder or self.frames).frames_ok if (self.decoder or self.frames) else 0,
+            'samples': self.samples,
+            'duplicates': self.duplicates,
+            'stale': self.stale,
+            'delivered': self.delivered,
+            'missed': self.missed,
+            'loss': round(self.missed / (self.delivered + self.missed), 4) if self.missed else 0.0,
+            'quality': round(self.quality, 4),
+            'latency': self.latency.snapshot(),
+            'lag': self.lag.snapshot(),
+        }
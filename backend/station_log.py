@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Yapılandırılmış, asenkron log sistemi
+
+Parser thread'leri log satırını kendisi formatlayıp konsola yazmaz: seviye,
+kategori, format metni ve argümanlardan oluşan bir kayıt kuyruğa eklenir
+(tek bir deque.append). Formatlama, kategori bazlı hız sınırı ve hedeflere
+(konsol, dönen dosya, API) dağıtım arka plandaki yazıcı thread'inde yapılır.
+
+Kapalı bir seviyedeki çağrı yalnızca bir sözlük okuması ve karşılaştırmadır;
+argümanlar hiç formatlanmaz. Debug logları çalışma anında açılıp kapatılabilir.
+
+Kullanım:
+    log.info('lora', "📊 Roket Telemetri: Alt=%.1fm", altitude)
+    log.debug('payload', "🛰️ Payload Line: %s", line)
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from telemetry_stream import HEARTBEAT_INTERVAL
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR', OFF: 'OFF'}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+# Kategori başına saniyede en fazla kayıt (WARNING ve üstü dahil)
+DEFAULT_RATE_LIMITS = {
+    'lora': 20.0,
+    'payload': 20.0,
+    'liquid': 10.0,
+    'hyi': 20.0,
+}
+
+
+def parse_level(value) -> int:
+    """'debug' / 'INFO' / 20 gibi değerleri seviye numarasına çevir"""
+    if isinstance(value, int):
+        return value
+    try:
+        return LEVELS[str(value).upper()]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen log seviyesi: {value}")
+
+
+class ConsoleSink:
+    """Kayıtları standart çıktıya yazar"""
+
+    def emit(self, record, line: str):
+        print(line)
+
+    def close(self):
+        pass
+
+
+class RotatingFileSink:
+    """Boyut sınırına ulaşınca dönen log dosyası (log, log.1, ... log.N)"""
+
+    def __init__(self, path: str, max_bytes: int = 5 * 1024 * 1024, backups: int = 3):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, 'a', encoding='utf-8')
+        self.size = self.file.tell()
+
+    def emit(self, record, line: str):
+        created, level, category = record[0], record[1], record[2]
+        stamp = datetime.fromtimestamp(created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        text = f"{stamp} {LEVEL_NAMES.get(level, level):<7} {category:<8} {record[5]}\n"
+        self.file.write(text)
+        self.size += len(text.encode('utf-8'))
+        if self.size >= self.max_bytes:
+            self._rotate()
+
+    def flush(self):
+        self.file.flush()
+
+    def _rotate(self):
+        self.file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        self.file = open(self.path, 'w', encoding='utf-8')
+        self.size = 0
+
+    def close(self):
+        self.file.close()
+
+
+class ApiSink:
+    """/api/logs için sıra numaralı, sınırlı log halkası
+
+    Okuma kayıt silmez: her istemci kendi imlecinden (after) okur, böylece
+    birden fazla dashboard aynı logları görür. Sıra numaraları ardışık
+    olduğundan yeni kayıtlar deque'nun sonundan indekslenir; okuma maliyeti
+    yalnızca yeni kayıt sayısıyla orantılıdır.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.seq = 0
+        self.entries = deque(maxlen=capacity)  # (seq, satır)
+        self.condition = threading.Condition()
+
+    def emit(self, record, line: str):
+        with self.condition:
+            self.seq += 1
+            self.entries.append((self.seq, line))
+            self.condition.notify_all()
+
+    def _since(self, after: int, limit: int = None):
+        """after'dan sonraki kayıtlar ve pencere dışında kalan (kaçırılan) kayıt sayısı"""
+        entries = self.entries
+        size = len(entries)
+        oldest = self.seq - size + 1
+        missed = max(0, oldest - after - 1)
+        start = size - (self.seq - max(after, oldest - 1))
+        stop = size if limit is None else min(size, start + limit)
+        return [entries[i] for i in range(start, stop)], missed
+
+    def read(self, after: int = None, limit: int = 100) -> dict:
+        """after verilmezse son limit kayıt, verilirse after'dan sonraki ilk limit kayıt"""
+        with self.condition:
+            if after is None:
+                after = self.seq - min(limit, len(self.entries))
+            elif after > self.seq:
+                after = 0  # Sunucu yeniden başlamış - imleç baştan
+            entries, missed = self._since(after, limit)
+            return {
+                'logs': [line for _, line in entries],
+                'next': entries[-1][0] if entries else after,
+                'latest': self.seq,
+                'missed': missed,
+            }
+
+    def subscribe(self, after: int = None, is_running=lambda: True):
+        """Canlı log akışı (SSE) üreten generator"""
+        with self.condition:
+            cursor = self.seq if after is None or after > self.seq else after
+        while is_running():
+            with self.condition:
+                if self.seq == cursor:
+                    self.condition.wait(HEARTBEAT_INTERVAL)
+                entries, missed = self._since(cursor)
+                cursor = self.seq
+            if missed:
+                yield f"event: missed\ndata: {missed}\n\n"
+            if entries:
+                yield ''.join(f"id: {seq}\ndata: {json.dumps(line)}\n\n" for seq, line in entries)
+            else:
+                yield ': heartbeat\n\n'
+
+    def close(self):
+        pass
+
+
+class _RateLimit:
+    """Token bucket; bastırılan kayıt sayısını tutar"""
+
+    __slots__ = ('rate', 'tokens', 'updated', 'suppressed', 'reported')
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = self.reported = time.monotonic()
+        self.suppressed = 0
+
+    def allow(self, now: float) -> bool:
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        self.suppressed += 1
+        return False
+
+
+class StationLogger:
+    """Seviye ve kategori bazlı, arka plan yazıcılı logger"""
+
+    def __init__(self, level: int = INFO, capacity: int = 10000, rate_limits: dict = None,
+                 flush_interval: float = 0.1):
+        self.level = level
+        self.levels = {}  # Kategori bazlı seviye (varsayılanı ezer)
+        self.records = deque(maxlen=capacity)
+        self.capacity = capacity
+        self.sinks = []
+        self.rate_limits = dict(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits)
+        self._buckets = {}
+        self.flush_interval = flush_interval
+        self.enqueued = 0
+        self.dropped = 0  # Kuyruk doluyken üzerine yazılan kayıtlar
+        self.written = 0
+        self.suppressed = 0  # Hız sınırına takılan kayıtlar
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self.thread = None
+
+    # --- Üretici tarafı (parser thread'leri) ---
+
+    def enabled(self, level: int, category: str) -> bool:
+        return level >= self.levels.get(category, self.level)
+
+    def log(self, level: int, category: str, message: str, *args):
+        if level < self.levels.get(category, self.level):
+            return
+        records = self.records
+        if len(records) == self.capacity:
+            self.dropped += 1
+        records.append((time.time(), level, category, message, args))
+        self.enqueued += 1
+        self._wake.set()
+
+    def debug(self, category: str, message: str, *args):
+        self.log(DEBUG, category, message, *args)
+
+    def info(self, category: str, message: str, *args):
+        self.log(INFO, category, message, *args)
+
+    def warning(self, category: str, message: str, *args):
+        self.log(WARNING, category, message, *args)
+
+    def error(self, category: str, message: str, *args):
+        self.log(ERROR, category, message, *args)
+
+    # --- Yapılandırma ---
+
+    def set_level(self, level, category: str = None):
+        """Genel veya kategori seviyesini değiştir; level=None kategori ayarını kaldırır"""
+        if category is None:
+            self.level = parse_level(level)
+        elif level is None:
+            self.levels.pop(category, None)
+        else:
+            self.levels[category] = parse_level(level)
+
+    def add_sink(self, sink):
+        with self._lock:
+            self.sinks = self.sinks + [sink]
+        return sink
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.thread = threading.Thread(target=self._loop, name="log-writer")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def flush(self, timeout: float = 1.0):
+        """Kuyruktaki kayıtlar yazılana kadar bekle (kapanışta)"""
+        deadline = time.monotonic() + timeout
+        while self.records and time.monotonic() < deadline:
+            self._wake.set()
+            time.sleep(0.01)
+
+    def snapshot(self) -> dict:
+        return {
+            'level': LEVEL_NAMES.get(self.level, self.level),
+            'levels': {category: LEVEL_NAMES.get(level, level) for category, level in self.levels.items()},
+            'enqueued': self.enqueued,
+            'written': self.written,
+            'dropped': self.dropped,
+            'suppressed': self.suppressed,
+            'pending': len(self.records),
+        }
+
+    # --- Yazıcı thread'i ---
+
+    def _format(self, record) -> str:
+        message, args = record[3], record[4]
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError) as e:
+                message = f"{message} {args!r} (format hatası: {e})"
+        return message
+
+    def _allow(self, category: str, now: float) -> bool:
+        rate = self.rate_limits.get(category)
+        if not rate:
+            return True
+        bucket = self._buckets.get(category)
+        if bucket is None:
+            bucket = self._buckets[category] = _RateLimit(rate)
+        return bucket.allow(now)
+
+    def _emit(self, record, text: str):
+        line = f"[{datetime.fromtimestamp(record[0]).strftime('%H:%M:%S')}] {text}"
+        full = record[:5] + (text,)
+        for sink in self.sinks:
+            try:
+                sink.emit(full, line)
+            except Exception as e:
+                print(f"❌ Log hedefi hatası ({type(sink).__name__}): {e}")
+        self.written += 1
+
+    def _report_suppressed(self, now: float):
+        # Bastırılan kayıtlar kategori başına en fazla saniyede bir özetlenir
+        for category, bucket in self._buckets.items():
+            if bucket.suppressed and now - bucket.reported >= 1.0:
+                count, bucket.suppressed, bucket.reported = bucket.suppressed, 0, now
+                self._emit((time.time(), WARNING, category, '', ()),
+                           f"⚠️ {category}: hız sınırı nedeniyle {count} log mesajı bastırıldı")
+
+    def _loop(self):
+        records = self.records
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            while records:
+                try:
+                    record = records.popleft()
+                except IndexError:
+                    break
+                now = time.monotonic()
+                if not self._allow(record[2], now):
+                    self.suppressed += 1
+                    continue
+                self._emit(record, self._format(record))
+            self._report_suppressed(time.monotonic())
+            for sink in self.sinks:
+                flush = getattr(sink, 'flush', None)
+                if flush:
+                    flush()
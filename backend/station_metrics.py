@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Hafif sayaç ve histogramlar (Prometheus metin formatı)
+
+Sıcak yoldaki güncellemeler kilit almaz: Counter.inc bir toplama,
+Histogram.observe bir bisect ve iki toplamadır (~0.3 µs). Her metrik
+pratikte tek bir thread'den güncellenir; farklı thread'lerin aynı anda
+güncellediği nadir durumlarda bir artışın kaybolması kabul edilir.
+
+Zaten başka bir nesnede tutulan sayılar (okunan byte, ayrılan satır, kuyruk
+derinliği gibi) kopyalanmaz; kayıt sırasında verilen fonksiyonla okunur
+(counter_func / gauge_func).
+"""
+
+import math
+import threading
+from bisect import bisect_left
+
+# 10 µs .. ~10 s, logaritmik
+DEFAULT_BUCKETS = tuple(round(10 ** (exponent / 4), 9) for exponent in range(-20, 5))
+
+
+def _format_value(value) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def _format_labels(labels: tuple, extra: str = None) -> str:
+    parts = [f'{key}="{value}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+class Counter:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Gauge:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+
+class Histogram:
+    """Sabit sınırlı kovalarla histogram (kümülatif olmayan sayım tutulur)"""
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum', 'max')
+
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Kova sınırlarından yaklaşık yüzdelik (üst sınır)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+
+class _Family:
+    """Aynı adlı, farklı etiketli metrikler"""
+
+    def __init__(self, name: str, kind: str, help_text: str, factory=None):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.factory = factory
+        self.children = {}  # etiket demeti -> metrik veya fonksiyon
+        self.lock = threading.Lock()
+
+    def labels(self, **labels):
+        key = tuple(sorted(labels.items()))
+        child = self.children.get(key)
+        if child is None:
+            with self.lock:
+                child = self.children.get(key)
+                if child is None:
+                    child = self.children[key] = self.factory()
+        return child
+
+
+class MetricsRegistry:
+    """Metrik kayıt defteri; /metrics ve /health için çıktı üretir"""
+
+    def __init__(self, prefix: str = 'ground_'):
+        self.prefix = prefix
+        self.families = {}
+
+    def _family(self, name: str, kind: str, help_text: str, factory=None) -> _Family:
+        name = self.prefix + name
+        family = self.families.get(name)
+        if family is None:
+            family = self.families[name] = _Family(name, kind, help_text, factory)
+        elif family.kind != kind:
+            raise ValueError(f"{name} zaten {family.kind} olarak kayıtlı")
+        return family
+
+    def counter(self, name: str, help_text: str, **labels) -> Counter:
+        return self._family(name, 'counter', help_text, Counter).labels(**labels)
+
+    def gauge(self, name: str, help_text: str, **labels) -> Gauge:
+        return self._family(name, 'gauge', help_text, Gauge).labels(**labels)
+
+    def histogram(self, name: str, help_text: str, buckets=DEFAULT_BUCKETS, **labels) -> Histogram:
+        return self._family(name, 'histogram', help_text, lambda: Histogram(buckets)).labels(**labels)
+
+    def counter_family(self, name: str, help_text: str) -> _Family:
+        """Etiketleri çalışma anında belirlenen sayaçlar: family.labels(format='fix').inc()"""
+        return self._family(name, 'counter', help_text, Counter)
+
+    def histogram_family(self, name: str, help_text: str, buckets=DEFAULT_BUCKETS) -> _Family:
+        return self._family(name, 'histogram', help_text, lambda: Histogram(buckets))
+
+    def counter_func(self, name: str, help_text: str, func, **labels):
+        """Değeri başka bir nesnede tutulan sayaç (okuma anında func() çağrılır)"""
+        self._family(name, 'counter', help_text).children[tuple(sorted(labels.items()))] = func
+
+    def gauge_func(self, name: str, help_text: str, func, **labels):
+        self._family(name, 'gauge', help_text).children[tuple(sorted(labels.items()))] = func
+
+    @staticmethod
+    def _read(child):
+        if callable(child):
+            try:
+                return child()
+            except Exception:
+                return 0
+        return child.value
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for name, family in sorted(self.families.items()):
+            lines.append(f"# HELP {name} {family.help}")
+            lines.append(f"# TYPE {name} {family.kind}")
+            for labels, child in sorted(family.children.items()):
+                if family.kind == 'histogram':
+                    cumulative = 0
+                    for bound, count in zip(child.bounds, child.counts):
+                        cumulative += count
+                        le = 'le="%s"' % _format_value(bound)
+                        lines.append(f"{name}_bucket{_format_labels(labels, le)} {cumulative}")
+                    le = 'le="+Inf"'
+                    lines.append(f"{name}_bucket{_format_labels(labels, le)} {child.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(child.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {child.count}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(self._read(child))}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> dict:
+        """/health için özet: sayaç değerleri, histogramlarda sayı / ortalama / p99 / max (ms)"""
+        result = {}
+        for name, family in sorted(self.families.items()):
+            short = name[len(self.prefix):]
+            values = {}
+            for labels, child in sorted(family.children.items()):
+                key = ','.join(f"{k}={v}" for k, v in labels) or 'value'
+                if family.kind == 'histogram':
+                    values[key] = {
+                        'count': child.count,
+                        'avg_ms': round(child.sum / child.count * 1000, 3) if child.count else 0.0,
+                        'p99_ms': round(child.quantile(0.99) * 1000, 3),
+                        'max_ms': round(child.max * 1000, 3),
+                    }
+                else:
+                    values[key] = self._read(child)
+            result[short] = values['value'] if list(values) == ['value'] else values
+        return result
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sabit kapasiteli, sütun bazlı telemetri geçmişi (ring buffer)
+
+Her alan için önceden ayrılmış bir array('d') ve bir monotonic zaman damgası
+sütunu tutulur; bellek kullanımı kapasite * (alan sayısı + 1) * 8 byte'tır ve
+uçuş boyunca değişmez. 50 Hz'de 30 dakikalık uçuş (90.000 örnek) ve 17 alan
+için ~13 MB.
+"""
+
+import threading
+import time
+from array import array
+from operator import attrgetter
+
+# 30 dakika @ 50 Hz
+HISTORY_CAPACITY = 90_000
+
+ROCKET_HISTORY_FIELDS = (
+    'altitude', 'max_altitude', 'gps_altitude', 'delta_y',
+    'gyro_x', 'gyro_y', 'gyro_z',
+    'accel_x', 'accel_y', 'accel_z',
+    'pitch',
+    'gps_latitude', 'gps_longitude', 'gps_valid',
+    'fired', 'p1', 'p2',
+)
+
+PAYLOAD_HISTORY_FIELDS = (
+    'payload_gps_altitude', 'payload_latitude', 'payload_longitude', 'payload_gps_valid',
+    'payload_gyro_x', 'payload_gyro_y', 'payload_gyro_z',
+)
+
+
+class TelemetryHistory:
+    """Telemetri örneklerini zaman damgasıyla saklayan ring buffer"""
+
+    def __init__(self, fields, capacity: int = HISTORY_CAPACITY):
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.columns = {name: array('d', bytes(8 * capacity)) for name in self.fields}
+        self._column_list = [self.columns[name] for name in self.fields]
+        getter = attrgetter(*self.fields)
+        self._getter = getter if len(self.fields) > 1 else lambda obj: (getter(obj),)
+        self.total = 0  # Şimdiye kadar eklenen örnek sayısı
+        # API'de Unix zamanı kullanılır, içeride monotonic saklanır
+        self.epoch_offset = time.time() - time.monotonic()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, telemetry, timestamp: float = None):
+        """Telemetri nesnesindeki alanların o anki değerlerini ekle"""
+        values = self._getter(telemetry)
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self.lock:
+            index = self.total % self.capacity
+            self.timestamps[index] = timestamp
+            for column, value in zip(self._column_list, values):
+                column[index] = value
+            self.total += 1
+
+    def clear(self):
+        with self.lock:
+            self.total = 0
+
+    def _physical(self, logical: int) -> int:
+        start = self.total - len(self) if self.total > self.capacity else 0
+        return (start + logical) % self.capacity
+
+    def _bisect(self, timestamp: float) -> int:
+        """timestamp'ten küçük olmayan ilk örneğin mantıksal indeksi"""
+        lo, hi = 0, len(self)
+        timestamps = self.timestamps
+        physical = self._physical
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if timestamps[physical(mid)] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _slice(self, column, lo: int, hi: int, step: int) -> list:
+        """Mantıksal [lo, hi) aralığını step adımıyla kopyala (sarmayı dikkate alarak)"""
+        if lo >= hi:
+            return []
+        start = self._physical(lo)
+        length = hi - lo
+        if start + length <= self.capacity:
+            return column[start:start + length:step].tolist()
+        first = self.capacity - start
+        head = column[start:self.capacity:step].tolist()
+        return head + column[(-first) % step:length - first:step].tolist()
+
+    def query(self, start: float = None, end: float = None, fields=None, step: int = 1) -> dict:
+        """Unix zamanı [start, end] aralığındaki örnekleri döndür
+
+        Negatif start/end değerleri "şu andan N saniye önce" olarak yorumlanır.
+        Yalnızca istenen aralık kopyalanır; tüm depo kopyalanmaz.
+        """
+        fields = self.fields if not fields else tuple(fields)
+        unknown = [name for name in fields if name not in self.columns]
+        if unknown:
+            raise KeyError(', '.join(unknown))
+        step = max(1, int(step))
+
+        now = time.monotonic()
+        offset = self.epoch_offset
+        lo_time = float('-inf') if start is None else (now + start if start < 0 else start - offset)
+        hi_time = float('inf') if end is None else (now + end if end < 0 else end - offset)
+
+        with self.lock:
+            lo = self._bisect(lo_time)
+            hi = self._bisect(hi_time) if hi_time != float('inf') else len(self)
+            # end dahil
+            while hi < len(self) and self.timestamps[self._physical(hi)] <= hi_time:
+                hi += 1
+            times = self._slice(self.timestamps, lo, hi, step)
+            data = {name: self._slice(self.columns[name], lo, hi, step) for name in fields}
+
+        return {
+            'count': len(times),
+            'time': [t + offset for t in times],
+            'data': data,
+        }
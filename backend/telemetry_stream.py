@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Server-Sent Events ile telemetri yayını
+
+Her örnek parse edildiğinde bir kez publish() çağrılır; publish yalnızca son
+örneği ve değişen alan adlarını kaydeder. Fark, ilk okuyucu (uyanan istemci
+veya yeni bağlantı) geldiğinde son yayınlanan duruma göre tek seferde JSON'a
+çevrilir ve sıra numarasıyla saklanır: okuyucular arasında gelen örnekler tek
+bir farkta birleşir, bağlı istemci yokken örnek başına serileştirme yapılmaz.
+Bağlı tüm istemciler aynı hazır metni alır; istemci başına serileştirme yapılmaz.
+Yeniden bağlanan istemci Last-Event-ID (veya ?after=) ile kaldığı yerden devam eder,
+geçmiş penceresinin dışına düşmüşse tam snapshot alır.
+"""
+
+import json
+import threading
+from collections import deque
+
+HEARTBEAT_INTERVAL = 15.0
+
+_MISSING = object()
+
+
+def _sse(seq: int, event: str, data: str) -> str:
+    return f"id: {seq}\nevent: {event}\ndata: {data}\n\n"
+
+
+class TelemetryBroadcaster:
+    """Telemetri değişikliklerini sıra numarasıyla yayınlayan yayıncı"""
+
+    def __init__(self, backlog: int = 1000):
+        self.seq = 0
+        self.version = 0
+        self.state = {}
+        self.deltas = deque(maxlen=backlog)  # (seq, hazır SSE metni)
+        self.condition = threading.Condition()
+        self.latest = None  # Henüz farkı çıkarılmamış son örnek (sözlük veya onu üreten fonksiyon)
+        self.changed = set()  # ... ve o zamandan beri değişen alanlar (None: tümü)
+
+    def publish(self, data, version: int = None, changed=None) -> bool:
+        """Yeni örneği kaydet; farkı ilk okuyucu çıkarır
+
+        data bir sözlük veya sözlüğü üreten argümansız fonksiyondur (ör.
+        telemetry.to_dict); fonksiyon yalnızca fark çıkarılırken çağrılır.
+        version verilirse daha eski bir sürümün (geç kalan yazıcı) yayını atlanır.
+        changed verilirse yalnızca bu alanlar karşılaştırılır; araya atlanan
+        bir sürüm girdiyse (sıra bozulduysa) tüm alanlara bakılır.
+        """
+        with self.condition:
+            if version is not None:
+                if version <= self.version:
+                    return False
+                if version != self.version + 1:
+                    changed = None
+                self.version = version
+            if changed is None or self.changed is None:
+                self.changed = None
+            else:
+                self.changed.update(changed)
+            self.latest = data
+            self.condition.notify_all()
+        return True
+
+    def _flush(self):
+        """Bekleyen örneğin son yayınlanan duruma göre farkını çıkar (kilit tutulurken)"""
+        data = self.latest
+        if data is None:
+            return
+        self.latest = None
+        changed, self.changed = self.changed, set()
+        if callable(data):
+            data = data()
+        state = self.state
+        if changed is None or not state:
+            delta = {key: value for key, value in data.items() if state.get(key, _MISSING) != value}
+        else:
+            delta = {key: data[key] for key in changed if state.get(key, _MISSING) != data[key]}
+        if not delta:
+            return
+        state.update(delta)
+        self.seq += 1
+        delta['seq'] = self.seq
+        self.deltas.append((self.seq, _sse(self.seq, 'delta', json.dumps(delta))))
+
+    def snapshot_event(self) -> str:
+        with self.condition:
+            self._flush()
+            return _sse(self.seq, 'snapshot', json.dumps({**self.state, 'seq': self.seq}))
+
+    def _pending(self, after: int):
+        """after'dan sonraki olayları döndür, pencere dışındaysa None"""
+        deltas = self.deltas
+        if after > self.seq or (deltas and after < deltas[0][0] - 1) or (not deltas and after != self.seq):
+            return None
+        # Sıra numaraları ardışık olduğundan yeni olaylar deque'nun sonundadır
+        size = len(deltas)
+        return [deltas[i][1] for i in range(size - (self.seq - after), size)]
+
+    def subscribe(self, after: int = None, is_running=lambda: True):
+        """SSE olay akışı üreten generator"""
+        with self.condition:
+            self._flush()
+            pending = None if after is None else self._pending(after)
+            events = [self.snapshot_event()] if pending is None else pending
+            cursor = self.seq
+
+        while is_running():
+            if events:
+                yield ''.join(events)
+            else:
+                yield ': heartbeat\n\n'
+            with self.condition:
+                if self.seq == cursor and self.latest is None:
+                    self.condition.wait(HEARTBEAT_INTERVAL)
+                self._flush()
+                events = self._pending(cursor)
+                if events is None:
+                    # İstemci çok geride kaldı - yeniden tam snapshot gönder
+                    events = [self.snapshot_event()]
+                cursor = self.seq
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Testler backend modüllerini doğrudan içe aktarır (benchmarks/ ile aynı düzen)"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
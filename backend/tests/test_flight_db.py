@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Uçuş veritabanı: sütun bazlı format, dışa aktarımlar, bozuk batch'ler ve yol doğrulama"""
+
+import csv
+import io
+import json
+import os
+import threading
+
+import pytest
+
+from flight_db import (BATCH_HEADER, EXPORTERS, FlightDatabase, Table, export_columnar, list_flights, read_batches,
+                       read_schema, table_path)
+from main_system import TelemetryData, flight_tables
+
+ROWS = [
+    (10.0, (1.5, 7, True, b'\x00\x01\x02\x03')),
+    (10.5, (-2.25, -1, False, b'abcd')),
+    (11.0, (0.0, 2 ** 40, True, b'\xff\xfe\xfd\xfc')),
+]
+
+
+def _table():
+    return Table('samples', [('altitude', 'd'), ('count', 'q'), ('flag', 'B'), ('raw', '4s')],
+                 getter=lambda row: row)
+
+
+def _database(directory, **kwargs) -> FlightDatabase:
+    db = FlightDatabase(str(directory), [_table()], flush_interval=3600, **kwargs)
+    db.epoch_offset = 0.0
+    return db
+
+
+def _write(directory, batches) -> str:
+    """Her eleman ayrı bir batch olarak yazılır"""
+    db = _database(directory)
+    db.open('flight')
+    for batch in batches:
+        for timestamp, row in batch:
+            db.record('samples', row, timestamp)
+        db._flush()
+    db.close()
+    return table_path(str(directory), 'flight', 'samples')
+
+
+def _expected(rows, fields=('altitude', 'count', 'flag', 'raw')):
+    names = ('altitude', 'count', 'flag', 'raw')
+    result = []
+    for timestamp, row in rows:
+        values = dict(zip(names, row))
+        values['flag'] = int(values['flag'])
+        result.append({'time': timestamp, **{name: values[name] for name in fields}})
+    return result
+
+
+def _read_rows(path, fields=None):
+    rows = []
+    for _, _, data in read_batches(path, fields):
+        names = list(data)
+        rows.extend(dict(zip(names, values)) for values in zip(*(data[name] for name in names)))
+    return rows
+
+
+def test_round_trip(tmp_path):
+    path = _write(tmp_path, [ROWS[:2], ROWS[2:]])
+    assert [count for _, count, _ in read_batches(path)] == [2, 1]
+    assert _read_rows(path) == _expected(ROWS)
+    assert _read_rows(path, ['count']) == _expected(ROWS, ('count',))
+    with pytest.raises(KeyError):
+        list(read_batches(path, ['missing']))
+
+
+def test_export_csv(tmp_path):
+    path = _write(tmp_path, [ROWS])
+    text = b''.join(EXPORTERS['csv'](path)).decode()
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == ['time', 'altitude', 'count', 'flag', 'raw']
+    assert rows[1] == ['10.0', '1.5', '7', '1', '00010203']
+    assert len(rows) == len(ROWS) + 1
+    text = b''.join(EXPORTERS['csv'](path, ['altitude'])).decode()
+    assert text.splitlines() == ['time,altitude', '10.0,1.5', '10.5,-2.25', '11.0,0.0']
+
+
+def test_export_jsonl(tmp_path):
+    path = _write(tmp_path, [ROWS[:1], ROWS[1:]])
+    lines = [json.loads(line) for line in b''.join(EXPORTERS['jsonl'](path)).decode().splitlines()]
+    expected = _expected(ROWS)
+    for row in expected:
+        row['raw'] = row['raw'].hex()
+    assert lines == expected
+
+
+def test_export_columnar(tmp_path):
+    path = _write(tmp_path, [ROWS[:2], ROWS[2:]])
+    copy = tmp_path / 'copy.etudb'
+    copy.write_bytes(b''.join(export_columnar(path)))
+    assert copy.read_bytes() == open(path, 'rb').read()
+
+    subset = tmp_path / 'subset.etudb'
+    subset.write_bytes(b''.join(export_columnar(path, ['flag'])))
+    assert _read_rows(str(subset)) == _expected(ROWS, ('flag',))
+
+
+def test_empty_table_exports(tmp_path):
+    path = _write(tmp_path, [])
+    assert b''.join(EXPORTERS['csv'](path)) == b'time,altitude,count,flag,raw\n'
+    assert b''.join(EXPORTERS['jsonl'](path)) == b''
+    empty = tmp_path / 'empty.etudb'
+    empty.write_bytes(b''.join(export_columnar(path, ['raw'])))
+    assert _read_rows(str(empty)) == []
+
+
+def test_telemetry_tables(tmp_path):
+    db = FlightDatabase(str(tmp_path), flight_tables(), flush_interval=3600)
+    db.open('flight')
+    db.record('rocket', TelemetryData().evolve({'altitude': 12.5, 'p1': True}))
+    db.record('liquid', bytes(range(24)))
+    db.close()
+    rocket = _read_rows(table_path(str(tmp_path), 'flight', 'rocket'), ['altitude', 'p1'])
+    assert [(row['altitude'], row['p1']) for row in rocket] == [(12.5, 1)]
+    liquid = _read_rows(table_path(str(tmp_path), 'flight', 'liquid'))
+    assert [row['levels'] for row in liquid] == [bytes(range(24))]
+    assert list_flights(str(tmp_path))[0]['name'] == 'flight'
+
+
+def _corrupt(path, batch_index, mutate):
+    """batch_index. batch'in baytlarını mutate(data, başlangıç, bitiş) ile değiştir"""
+    with open(path, 'rb') as f:
+        read_schema(f)
+        offset = f.tell()
+        f.seek(0)
+        data = bytearray(f.read())
+    for _ in range(batch_index):
+        _, _, length, _ = BATCH_HEADER.unpack_from(data, offset)
+        offset += BATCH_HEADER.size + length
+    _, _, length, _ = BATCH_HEADER.unpack_from(data, offset)
+    with open(path, 'wb') as f:
+        f.write(mutate(data, offset, offset + BATCH_HEADER.size + length))
+
+
+def _flip_body(data, start, end):
+    data[end - 1] ^= 0xFF
+    return data
+
+
+def _cut_body(data, start, end):
+    return data[:end - 5]
+
+
+def _cut_header(data, start, end):
+    return data[:start + BATCH_HEADER.size - 2]
+
+
+def _bad_magic(data, start, end):
+    return data[:start] + b'XXXX' + data[start + 4:]
+
+
+@pytest.mark.parametrize('mutate', [_flip_body, _cut_body, _cut_header, _bad_magic])
+def test_corrupted_last_batch(tmp_path, mutate):
+    path = _write(tmp_path, [ROWS[:1], ROWS[1:]])
+    _corrupt(path, 1, mutate)
+    assert _read_rows(path) == _expected(ROWS[:1])
+    assert [row['count'] for row in _read_rows(path, ['count'])] == [7]
+
+
+@pytest.mark.parametrize('mutate', [_cut_body, _cut_header, _bad_magic])
+def test_columnar_export_skips_incomplete_batch(tmp_path, mutate):
+    """Ham sütun bazlı dışa aktarım yalnızca tamamlanmış batch'leri gönderir"""
+    path = _write(tmp_path, [ROWS[:1], ROWS[1:]])
+    _corrupt(path, 1, mutate)
+    copy = tmp_path / 'copy.etudb'
+    copy.write_bytes(b''.join(export_columnar(path)))
+    assert _read_rows(str(copy)) == _expected(ROWS[:1])
+
+
+def test_crc_mismatch_stops_reading(tmp_path):
+    path = _write(tmp_path, [ROWS[:1], ROWS[1:2], ROWS[2:]])
+    _corrupt(path, 1, _flip_body)
+    assert _read_rows(path) == _expected(ROWS[:1])
+
+
+class _FailingFile:
+    """İlk batch yazımında verinin yarısını yazıp hata veren dosya (yarım yazım)"""
+
+    def __init__(self, file):
+        self.file = file
+        self.failures = 1
+
+    def write(self, data):
+        if self.failures:
+            self.failures -= 1
+            self.file.write(bytes(data[:len(data) // 2]))
+            raise OSError("disk dolu")
+        return self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+def test_write_error_requeues_and_truncates(tmp_path):
+    errors = []
+    db = _database(tmp_path, on_error=errors.append)
+    db.open('flight')
+    table = db.tables['samples']
+    size = os.path.getsize(table.path)
+    table.file = _FailingFile(table.file)
+    for timestamp, row in ROWS[:2]:
+        db.record('samples', row, timestamp)
+    with pytest.raises(OSError):
+        db._flush()
+    assert os.path.getsize(table.path) == size
+    assert len(table.pending) == 2 and db.pending_rows == 2
+
+    db.record('samples', ROWS[2][1], ROWS[2][0])
+    db.close()
+    assert errors == [] and db.pending_rows == 0
+    assert _read_rows(table.path) == _expected(ROWS)
+
+
+def test_writer_thread_reports_errors(tmp_path):
+    reported = threading.Event()
+    errors = []
+
+    def on_error(e):
+        errors.append(e)
+        reported.set()
+
+    db = FlightDatabase(str(tmp_path), [_table()], flush_interval=0.01, on_error=on_error)
+    db.open('flight')
+    table = db.tables['samples']
+    table.file = _FailingFile(table.file)
+    db.record('samples', ROWS[0][1])
+    assert reported.wait(2.0)
+    db.close()
+    assert [str(e) for e in errors] == ["disk dolu"] and db.write_errors == 1
+    assert len(_read_rows(table.path)) == 1
+
+
+@pytest.mark.parametrize('flight, table', [
+    ('..', 'rocket'), ('../flights', 'rocket'), ('flight', '../rocket'), ('a/b', 'rocket'),
+    ('.hidden', 'rocket'), ('flight', '.rocket'), ('', 'rocket'), ('flight', ''), ('/etc', 'passwd'),
+])
+def test_table_path_rejects_traversal(tmp_path, flight, table):
+    _write(tmp_path, [ROWS])
+    with pytest.raises(ValueError):
+        table_path(str(tmp_path), flight, table)
+
+
+def test_table_path(tmp_path):
+    path = _write(tmp_path, [ROWS])
+    assert table_path(str(tmp_path), 'flight', 'samples') == path
+    with pytest.raises(FileNotFoundError):
+        table_path(str(tmp_path), 'flight', 'rocket')
+    with pytest.raises(FileNotFoundError):
+        table_path(str(tmp_path), 'other', 'samples')
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Uçuş kaydı: chunk formatı, bozuk / yarım chunk'lar ve yazma hatasından kurtulma"""
+
+import os
+import threading
+from zlib import crc32
+
+from flight_recorder import (CHANNEL_HYI, CHANNEL_LORA, CHANNEL_PAYLOAD, CHUNK_HEADER, CHUNK_MAGIC, FILE_HEADER,
+                             FILE_MAGIC, FILE_VERSION, RECORD_HEADER, FlightRecorder, read_recording,
+                             recording_info)
+
+RECORDS = [
+    (CHANNEL_LORA, 100.0, b"ALT:1.0m|maxALT:1.0m\r\n"),
+    (CHANNEL_PAYLOAD, 100.25, b"PAYLOAD_GPS fix 39.9 32.8 900.0\r\n"),
+    (CHANNEL_HYI, 100.5, bytes(range(78))),
+    (CHANNEL_LORA, 101.0, b""),
+]
+
+
+def _chunk(records) -> bytes:
+    body = b''.join(RECORD_HEADER.pack(channel, timestamp, len(data)) + data for channel, timestamp, data in records)
+    return CHUNK_HEADER.pack(CHUNK_MAGIC, len(records), len(body), crc32(body)) + body
+
+
+def _write_file(path, *chunks):
+    with open(path, 'wb') as f:
+        f.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, 100.0))
+        for chunk in chunks:
+            f.write(chunk)
+    return str(path)
+
+
+def test_read_chunks(tmp_path):
+    path = _write_file(tmp_path / 'a.etulog', _chunk(RECORDS[:2]), _chunk(RECORDS[2:]))
+    assert list(read_recording(path)) == RECORDS
+    info = recording_info(path)
+    assert info['records'] == len(RECORDS)
+
+
+def test_crc_mismatch_stops_reading(tmp_path):
+    bad = bytearray(_chunk(RECORDS[2:3]))
+    bad[-1] ^= 0xFF
+    path = _write_file(tmp_path / 'crc.etulog', _chunk(RECORDS[:2]), bytes(bad), _chunk(RECORDS[3:]))
+    assert list(read_recording(path)) == RECORDS[:2]
+
+
+def test_truncated_last_chunk(tmp_path):
+    path = _write_file(tmp_path / 'cut.etulog', _chunk(RECORDS[:2]), _chunk(RECORDS[2:])[:-10])
+    assert list(read_recording(path)) == RECORDS[:2]
+
+
+def test_torn_chunk_header(tmp_path):
+    path = _write_file(tmp_path / 'torn.etulog', _chunk(RECORDS[:2]), _chunk(RECORDS[2:])[:CHUNK_HEADER.size - 3])
+    assert list(read_recording(path)) == RECORDS[:2]
+
+
+def test_bad_magic_chunk(tmp_path):
+    bad = b'XXXX' + _chunk(RECORDS[2:])[4:]
+    path = _write_file(tmp_path / 'magic.etulog', _chunk(RECORDS[:2]), bad)
+    assert list(read_recording(path)) == RECORDS[:2]
+
+
+def test_recorder_round_trip(tmp_path):
+    recorder = FlightRecorder(str(tmp_path), chunk_interval=3600)
+    recorder.epoch_offset = 0.0
+    path = recorder.open('session')
+    for channel, timestamp, data in RECORDS:
+        recorder.record(channel, data, timestamp)
+    recorder.close()
+    assert list(read_recording(path)) == RECORDS
+    assert recorder.records == len(RECORDS) and recorder.pending_bytes == 0
+
+
+class _FailingFile:
+    """İlk chunk yazımında verinin yarısını yazıp hata veren dosya (yarım yazım)"""
+
+    def __init__(self, file):
+        self.file = file
+        self.failures = 1
+
+    def write(self, data):
+        if self.failures:
+            self.failures -= 1
+            self.file.write(bytes(data[:len(data) // 2]))
+            raise OSError("disk dolu")
+        return self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+def test_write_error_requeues_and_truncates(tmp_path):
+    errors = []
+    reported = threading.Event()
+
+    def on_error(e):
+        errors.append(e)
+        reported.set()
+
+    recorder = FlightRecorder(str(tmp_path), chunk_interval=0.01, on_error=on_error)
+    recorder.epoch_offset = 0.0
+    path = recorder.open('session')
+    size = os.path.getsize(path)
+    recorder.file = _FailingFile(recorder.file)
+    for channel, timestamp, data in RECORDS[:2]:
+        recorder.record(channel, data, timestamp)
+    assert reported.wait(2.0)
+    # Yarım chunk dosyadan silindi, kayıtlar kuyrukta bekliyor
+    assert os.path.getsize(path) == size
+    assert len(recorder.pending) == 2 and recorder.pending_bytes > 0
+
+    for channel, timestamp, data in RECORDS[2:]:
+        recorder.record(channel, data, timestamp)
+    recorder.close()
+    assert [str(e) for e in errors] == ["disk dolu"]
+    assert recorder.write_errors == 1
+    assert list(read_recording(path)) == RECORDS
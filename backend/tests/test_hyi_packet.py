@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""HYİ paketleyicisi: hakem dokümanındaki formata göre sabit (golden) paketler"""
+
+import pytest
+
+from hyi_packet import CHECKSUM_END, CHECKSUM_START, HYI_PACKET_SIZE, HyiPacketBuilder
+from main_system import TelemetryData
+
+FLIGHT_SAMPLE = dict(
+    altitude=1204.25, max_altitude=1210.0,
+    gps_altitude=1198.5, gps_latitude=39.925019, gps_longitude=32.836954, gps_valid=True,
+    payload_gps_altitude=1150.0, payload_latitude=39.9251, payload_longitude=32.837, payload_gps_valid=True,
+    gyro_x=12.5, gyro_y=-0.75, gyro_z=3.25, accel_x=-0.5, accel_y=0.25, accel_z=-2.0, pitch=12.0,
+    p1=1, p2=0,
+)
+
+STAGE_SAMPLE = dict(
+    FLIGHT_SAMPLE,
+    stage_gps_altitude=2410.5, stage_latitude=39.93, stage_longitude=32.84, stage_gps_valid=True,
+    p1=0, p2=1,
+)
+
+# (takım ID, paket sayacı, telemetri güncellemeleri, beklenen 78 byte)
+GOLDEN_PACKETS = [
+    # Boş telemetri: tüm float'lar 0, durum 1 (paraşüt yok)
+    (0, 0, {},
+     "ffff5452" "00" "00" + "00" * 68 + "01" "01" "0d0a"),
+    # Uçuş örneği: roket GPS geçerli, P1 açık (durum 2)
+    (42, 7, FLIGHT_SAMPLE,
+     "ffff5452" "2a" "07"
+     "00889644" "00d09544" "38b31f42" "0a590342"
+     "00c08f44" "4db31f42" "17590342"
+     "00000000" "00000000" "00000000"
+     "00004841" "000040bf" "00005040"
+     "000000bf" "0000803e" "000000c0"
+     "00004041"
+     "02" "b1" "0d0a"),
+    # Roket GPS geçersiz: roket GPS alanları 0 gönderilir, iki paraşüt açık (durum 4)
+    (255, 255, {**FLIGHT_SAMPLE, 'gps_valid': False, 'p2': 1},
+     "ffff5452" "ff" "ff"
+     "00889644" "00000000" "00000000" "00000000"
+     "00c08f44" "4db31f42" "17590342"
+     "00000000" "00000000" "00000000"
+     "00004841" "000040bf" "00005040"
+     "000000bf" "0000803e" "000000c0"
+     "00004041"
+     "04" "e3" "0d0a"),
+    # Kademe GPS geçerli: byte 35-46 kademe irtifa/enlem/boylam, sadece P2 açık (durum 3)
+    (42, 8, STAGE_SAMPLE,
+     "ffff5452" "2a" "08"
+     "00889644" "00d09544" "38b31f42" "0a590342"
+     "00c08f44" "4db31f42" "17590342"
+     "00a81645" "52b81f42" "295c0342"
+     "00004841" "000040bf" "00005040"
+     "000000bf" "0000803e" "000000c0"
+     "00004041"
+     "03" "eb" "0d0a"),
+    # Kademe GPS fix yok: koordinatlar dolu olsa da 0 gönderilir
+    (42, 7, {**STAGE_SAMPLE, 'stage_gps_valid': False, 'p1': 1, 'p2': 0},
+     "ffff5452" "2a" "07"
+     "00889644" "00d09544" "38b31f42" "0a590342"
+     "00c08f44" "4db31f42" "17590342"
+     "00000000" "00000000" "00000000"
+     "00004841" "000040bf" "00005040"
+     "000000bf" "0000803e" "000000c0"
+     "00004041"
+     "02" "b1" "0d0a"),
+]
+
+
+@pytest.mark.parametrize('team_id, counter, updates, expected', GOLDEN_PACKETS)
+def test_golden_packet(team_id, counter, updates, expected):
+    packet = HyiPacketBuilder().build(team_id, counter, TelemetryData().evolve(updates))
+    assert len(packet) == HYI_PACKET_SIZE == 78
+    assert packet.hex() == bytes.fromhex(expected).hex()
+
+
+def test_builder_reuse_matches_fresh_builder():
+    """Tampon ve artımlı CheckSum paketler arasında taşınmaz"""
+    builder = HyiPacketBuilder()
+    for _ in range(2):
+        for team_id, counter, updates, expected in GOLDEN_PACKETS:
+            assert builder.build(team_id, counter, TelemetryData().evolve(updates)) == bytes.fromhex(expected)
+
+
+def test_same_snapshot_new_counter():
+    """Aynı snapshot yeniden gönderildiğinde yalnızca sayaç ve CheckSum değişir"""
+    builder = HyiPacketBuilder()
+    telemetry = TelemetryData().evolve(FLIGHT_SAMPLE)
+    for counter in range(256):
+        packet = builder.build(42, counter, telemetry)
+        assert packet[5] == counter
+        assert packet[CHECKSUM_END] == sum(packet[CHECKSUM_START:CHECKSUM_END]) % 256
+        assert packet == HyiPacketBuilder().build(42, counter, telemetry)
+
+
+def test_station_packet_uses_team_and_counter():
+    from main_system import TEKNOFESTGroundStation
+    from station_log import OFF
+
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)
+    team_id, counter, updates, expected = GOLDEN_PACKETS[1]
+    station.team_id, station.packet_counter = team_id, counter
+    assert station.create_hyi_packet(TelemetryData().evolve(updates)) == bytes.fromhex(expected)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""HYİ zamanlayıcısı: olay döngüsünde yavaş port yazımı döngüyü bloklamaz"""
+
+import asyncio
+import threading
+import time
+
+from hyi_scheduler import HyiScheduler
+
+SLOW_WRITE = 0.15
+
+
+def _slow_send():
+    time.sleep(SLOW_WRITE)  # Bloklayan seri port yazımı
+    return True, SLOW_WRITE
+
+
+def test_async_write_does_not_block_loop():
+    async def run():
+        loop = asyncio.get_running_loop()
+        writers = set()
+
+        def send():
+            writers.add(threading.current_thread().name)
+            return _slow_send()
+
+        scheduler = HyiScheduler(send, lambda: 0, rate_hz=10)
+        scheduler.start(loop)
+        worst = 0.0
+        end = time.monotonic() + 0.6
+        while time.monotonic() < end:
+            start = time.monotonic()
+            await asyncio.sleep(0.005)
+            worst = max(worst, time.monotonic() - start)
+        scheduler.stop()
+        await asyncio.sleep(SLOW_WRITE + 0.05)
+        return scheduler, worst, writers
+
+    scheduler, worst, writers = asyncio.run(run())
+    assert scheduler.sent >= 2
+    assert scheduler.failed == 0
+    assert worst < SLOW_WRITE / 2
+    assert writers and all(name.startswith('hyi-writer') for name in writers)
+
+
+def test_thread_mode_sends():
+    sent = threading.Event()
+
+    def send():
+        sent.set()
+        return True, 0.0
+
+    scheduler = HyiScheduler(send, lambda: 0, rate_hz=10)
+    scheduler.start()
+    try:
+        assert sent.wait(1.0)
+    finally:
+        scheduler.stop()
+    scheduler.thread.join(1.0)
+    assert scheduler.sent >= 1
+
+
+def test_disabled_ticks_do_not_send():
+    calls = []
+    scheduler = HyiScheduler(lambda: calls.append(1) or (True, 0.0), lambda: 0, rate_hz=10, enabled=lambda: False)
+    scheduler.start()
+    time.sleep(0.35)
+    scheduler.stop()
+    scheduler.thread.join(1.0)
+    assert scheduler.ticks >= 2
+    assert not calls and scheduler.sent == 0
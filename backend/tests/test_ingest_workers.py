@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Alım işçilerinin paylaşılan bellek halka tamponu ve denetleyicideki okuma tarafı"""
+
+from dataclasses import fields
+
+import pytest
+
+from ingest_workers import HEADER, STRING_SIZE, IngestSupervisor, IngestWorker, TelemetryRing
+from main_system import TelemetryData
+from station_log import OFF, StationLogger
+
+SLOTS = 8
+TELEMETRY_FIELDS = [(field.name, field.default) for field in fields(TelemetryData)]
+
+
+@pytest.fixture
+def ring():
+    ring = TelemetryRing(TELEMETRY_FIELDS, create=True, slots=SLOTS)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+@pytest.fixture
+def supervisor():
+    applied = []
+    supervisor = IngestSupervisor(TELEMETRY_FIELDS, applied.append, StationLogger(level=OFF), slots=SLOTS)
+    supervisor.applied = applied
+    return supervisor
+
+
+def _sample(count: int, **updates) -> TelemetryData:
+    values = {'packet_count': count, 'altitude': count * 10.0, 'last_update': "12:00:00"}
+    values.update(updates)
+    return TelemetryData().evolve(values)
+
+
+def _tear(ring, index: int):
+    """Slotu yazımı yarıda kalmış gibi işaretle (sıra numarası 0)"""
+    offset = HEADER.size + (index % ring.slots) * ring.slot.size
+    ring.buffer[offset:offset + 8] = bytes(8)
+
+
+def _worker(supervisor, ring):
+    worker = supervisor.workers['lora'] = IngestWorker('lora', 'loop://', 9600, ring)
+    return worker
+
+
+def test_round_trip(ring):
+    telemetry = _sample(1, gps_valid=True, liquid_levels=bytes(range(24)))
+    ring.write(telemetry, ('packet_count', 'altitude'))
+    assert ring.head() == 1
+    published_at, updates = ring.read(1)
+    assert published_at > 0
+    assert updates == {'packet_count': 1, 'altitude': 10.0}
+    _, values = ring.read(1, changed_only=False)
+    assert TelemetryData(**values) == telemetry
+
+
+def test_overwritten_slot_returns_none(ring):
+    for count in range(1, SLOTS + 3):
+        ring.write(_sample(count))
+    assert ring.head() == SLOTS + 2
+    assert ring.read(1) is None and ring.read(2) is None
+    assert ring.read(3)[1]['packet_count'] == 3
+    # Yazımı yarıda kalmış slot da okunmaz
+    _tear(ring, SLOTS)
+    assert ring.read(SLOTS) is None
+    assert ring.read(SLOTS + 2)[1]['packet_count'] == SLOTS + 2
+
+
+def test_reader_maps_block_by_name(ring):
+    reader = TelemetryRing(TELEMETRY_FIELDS, ring.name, slots=SLOTS)
+    try:
+        assert reader.head() == 0 and not reader.stop_requested()
+        ring.write(_sample(1, payload_last_update="12:00:01"), ('packet_count', 'payload_last_update'))
+        assert reader.head() == 1
+        assert reader.read(1)[1] == {'packet_count': 1, 'payload_last_update': "12:00:01"}
+        reader.request_stop()
+        assert ring.stop_requested()
+    finally:
+        reader.close()
+
+
+def test_string_longer_than_slot_is_rejected(ring):
+    ring.write(_sample(1, last_update="x" * STRING_SIZE))
+    assert ring.read(1, changed_only=False)[1]['last_update'] == "x" * STRING_SIZE
+    with pytest.raises(ValueError):
+        ring.write(_sample(2, last_update="x" * (STRING_SIZE + 1)))
+    with pytest.raises(ValueError):
+        ring.write(_sample(2, last_update="ğ" * (STRING_SIZE // 2 + 1)))  # UTF-8 byte sayısı
+    assert ring.head() == 1
+    with pytest.raises(ValueError):
+        TelemetryRing([('label', "y" * (STRING_SIZE + 1))], create=True, slots=SLOTS)
+
+
+def test_drain_applies_changed_fields(supervisor, ring):
+    worker = _worker(supervisor, ring)
+    for count in range(1, 4):
+        ring.write(_sample(count), ('packet_count', 'altitude'))
+    ring.write(_sample(3), ())  # Değişiklik yok: örnek sayılır ama uygulanmaz
+    supervisor._drain(worker)
+    assert supervisor.applied == [{'packet_count': count, 'altitude': count * 10.0} for count in range(1, 4)]
+    assert (worker.cursor, worker.samples, worker.lost) == (4, 4, 0)
+    assert worker.delay.snapshot()['count'] == 4
+    supervisor._drain(worker)
+    assert worker.samples == 4
+
+
+def test_drain_counts_lag_beyond_ring(supervisor, ring):
+    worker = _worker(supervisor, ring)
+    ring.write(_sample(1))
+    supervisor._drain(worker)
+    for count in range(2, 2 + SLOTS + 5):
+        ring.write(_sample(count))
+    supervisor._drain(worker)
+    # Halkaya sığmayan en eski 5 örnek kayıp, son SLOTS örnek okunur
+    assert worker.cursor == ring.head() == SLOTS + 6
+    assert worker.lost == 5
+    assert worker.samples == 1 + SLOTS
+    assert [updates['packet_count'] for updates in supervisor.applied] == [1] + list(range(7, SLOTS + 7))
+
+
+def test_drain_counts_overwritten_slot_as_lost(supervisor, ring):
+    worker = _worker(supervisor, ring)
+    for count in range(1, 4):
+        ring.write(_sample(count))
+    _tear(ring, 2)
+    supervisor._drain(worker)
+    assert (worker.samples, worker.lost, worker.cursor) == (2, 1, 3)
+
+
+def test_restart_continues_from_last_sample(supervisor, ring):
+    worker = _worker(supervisor, ring)
+    for count in range(1, 4):
+        ring.write(_sample(count), ('packet_count', 'altitude'))
+    supervisor._drain(worker)
+
+    # Yeniden başlatılan işçi aynı bloğu adıyla açar ve son örnekten devam eder (_run_worker)
+    restarted = TelemetryRing(TELEMETRY_FIELDS, ring.name, slots=SLOTS)
+    try:
+        head = restarted.head()
+        telemetry = TelemetryData(**restarted.read(head, changed_only=False)[1])
+        assert telemetry.packet_count == 3 and telemetry.last_update == "12:00:00"
+        telemetry = telemetry.evolve({'packet_count': telemetry.packet_count + 1})
+        restarted.write(telemetry, ('packet_count',))
+    finally:
+        restarted.close()
+    supervisor._drain(worker)
+    assert supervisor.applied[-1] == {'packet_count': 4}
+    assert (worker.samples, worker.lost) == (4, 0)
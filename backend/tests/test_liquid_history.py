@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Sıvı seviye geçmişi: kodlama/çözme, analiz penceresi sınırı ve kayıt zamanı"""
+
+import threading
+
+import pytest
+
+from liquid_history import ANALYTICS_MAX_FRAMES, LiquidHistory
+from replay import ReplayEngine, load_events
+from tests.test_replay import CAPTURE, CAPTURE_EPOCH
+
+
+def _frame(index: int) -> bytes:
+    # Birkaç sensör değişir, arada tekrarlar (RLE) olur
+    return bytes((255 >> ((index // 3 + sensor) % 9)) for sensor in range(24))
+
+
+def test_query_round_trip():
+    history = LiquidHistory(block_frames=16)
+    history.epoch_offset = 1000.0
+    frames = [_frame(index) for index in range(200)]
+    for index, levels in enumerate(frames):
+        history.append(levels, index * 0.02)
+
+    result = history.query()
+    assert result['count'] == 200
+    assert [bytes(levels) for levels in result['levels']] == frames
+    assert result['time'] == pytest.approx([1000.0 + index * 0.02 for index in range(200)], abs=1e-4)
+
+    result = history.query(start=1000.99, end=1002.01, step=5)
+    assert result['time'] == pytest.approx([1000.0 + index * 0.02 for index in range(50, 101, 5)], abs=1e-4)
+    assert [bytes(levels) for levels in result['levels']] == frames[50:101:5]
+
+
+def test_query_while_appending():
+    """Sorgu yazılmakta olan son bloğun kopyasını çözer; eşzamanlı eklemeler tutarlı kalır"""
+    history = LiquidHistory(capacity=4096, block_frames=64)
+    history.epoch_offset = 0.0
+    stop = threading.Event()
+
+    def writer():
+        index = 0
+        while not stop.is_set():
+            history.append(_frame(index), index * 0.001)
+            index += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while not history.total:
+        pass
+    try:
+        for _ in range(20):
+            result = history.query()
+            # Ring eski blokları atar; indeksler zaman damgasından çıkarılır ve ardışık olmalı
+            indices = [round(timestamp * 1000) for timestamp in result['time']]
+            assert indices == list(range(indices[0], indices[0] + result['count']))
+            assert [bytes(levels) for levels in result['levels']] == [_frame(index) for index in indices]
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_analytics_frame_limit():
+    """Penceredeki çerçeve sayısı 16 bit'lik şeritleri taşırmaz"""
+    history = LiquidHistory()
+    full = b'\xff' * 24
+    frames = ANALYTICS_MAX_FRAMES + 2000
+    for index in range(frames):
+        history.append(full, index * 0.0005)  # 10 s pencerede ~20.000 çerçeve
+
+    analytics = history.query(start=0, end=0)['analytics']
+    assert analytics['frames'] == ANALYTICS_MAX_FRAMES
+    assert analytics['moving_average'] == [8.0] * 24
+    assert analytics['fill_fraction_avg'] == 1.0
+    assert analytics['span_s'] == pytest.approx((ANALYTICS_MAX_FRAMES - 1) * 0.0005, abs=1e-6)
+
+
+def test_replay_uses_capture_time():
+    """Oynatılan sıvı çerçeveleri kaydın zaman damgalarıyla geçmişe yazılır"""
+    engine = ReplayEngine(speed=0)
+    engine.run(load_events(CAPTURE))
+    result = engine.station.liquid_history.query()
+
+    # Kayıtta sıvı çerçeveleri t = 0.25, 0.75, ..., 2.75 s (+3 ms)
+    expected = [CAPTURE_EPOCH + tick / 20 + 0.003 for tick in range(5, 60, 10)]
+    assert result['time'] == pytest.approx(expected, abs=1e-3)
+    assert result['analytics']['span_s'] == pytest.approx(2.5, abs=1e-3)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""İkili LoRa çerçeveleri: senkron arama, CRC, yeniden senkron ve metin/ikili algılama"""
+
+import struct
+from binascii import crc_hqx
+
+import pytest
+
+from lora_frames import (LIQUID_FRAME, ROCKET_FRAME, BinaryFrameDecoder, EmbeddedFrameExtractor,
+                         encode_liquid_frame, encode_rocket_frame)
+
+ROCKET_VALUES = (120.5, 130.0, -1.5, 1.0, 2.0, 3.0, 0.1, 0.2, 9.8, 45.0, 38.388019, 33.742263, 924.4)
+LEVELS = bytes(range(1, 25))
+
+
+def _frame(payload: bytes, length: int = None) -> bytes:
+    """Çerçeveyi protokol tanımından bağımsız olarak elle kur"""
+    body = struct.pack('<B', len(payload) if length is None else length) + payload
+    return b'\xAA\x55' + body + struct.pack('<H', crc_hqx(body, 0xFFFF))
+
+
+def _rocket(seq: int, flags: int = 0x0B, values=ROCKET_VALUES) -> bytes:
+    return _frame(struct.pack('<HB13f', seq, flags, *values))
+
+
+def _liquid(seq: int, levels: bytes = LEVELS) -> bytes:
+    return _frame(struct.pack('<H24s', seq, levels))
+
+
+def _corrupt_crc(frame: bytes) -> bytes:
+    return frame[:-1] + bytes((frame[-1] ^ 0xFF,))
+
+
+def test_frame_layout_matches_encoder():
+    assert ROCKET_FRAME.size == 55 and LIQUID_FRAME.size == 26
+    sample = dict(zip(('altitude', 'max_altitude', 'delta_y', 'gyro_x', 'gyro_y', 'gyro_z',
+                       'accel_x', 'accel_y', 'accel_z', 'pitch',
+                       'gps_latitude', 'gps_longitude', 'gps_altitude'), ROCKET_VALUES))
+    sample.update(fired=True, p1=True, gps_valid=True)
+    assert encode_rocket_frame(sample, 7) == _rocket(7)
+    assert encode_liquid_frame(LEVELS, 7) == _liquid(7)
+
+
+def test_decodes_fields_and_flags():
+    decoder = BinaryFrameDecoder()
+    [(seq, updates)] = decoder.feed(_rocket(513, flags=0x0B))
+    assert seq == 513
+    assert updates['altitude'] == pytest.approx(120.5)
+    assert updates['gps_latitude'] == pytest.approx(38.388019)
+    assert updates['gps_altitude'] == pytest.approx(924.4)
+    assert (updates['fired'], updates['p1'], updates['p2'], updates['gps_valid']) == (True, True, False, True)
+    assert decoder.frames_ok == 1 and not decoder.buffer
+
+
+def test_invalid_gps_clears_position():
+    [(_, updates)] = BinaryFrameDecoder().feed(_rocket(1, flags=0x04))
+    assert updates['p2'] and not updates['gps_valid']
+    assert (updates['gps_latitude'], updates['gps_longitude'], updates['gps_altitude']) == (0.0, 0.0, 0.0)
+
+
+def test_sync_search_skips_noise():
+    decoder = BinaryFrameDecoder()
+    noise = b'\x00\x01\xAA\x02garbage\x55'
+    frames = decoder.feed(noise + _rocket(1) + b'\xFF\xFE' + _rocket(2))
+    assert [seq for seq, _ in frames] == [1, 2]
+    assert decoder.dropped_bytes == len(noise) + 2
+    assert decoder.frames_ok == 2 and decoder.crc_errors == 0
+
+
+def test_crc_mismatch_is_rejected():
+    decoder = BinaryFrameDecoder()
+    frames = decoder.feed(_rocket(1) + _corrupt_crc(_rocket(2)) + _rocket(3))
+    assert [seq for seq, _ in frames] == [1, 3]
+    assert decoder.crc_errors == 1 and decoder.frames_ok == 2
+
+
+def test_resync_after_bad_length_byte():
+    decoder = BinaryFrameDecoder()
+    # Uzunluk byte'ı bozuk çerçevenin ardından gelen geçerli çerçeve kaybolmaz
+    bad = _rocket(1)
+    bad = bad[:2] + b'\x10' + bad[3:]
+    frames = decoder.feed(bad + _rocket(2))
+    assert [seq for seq, _ in frames] == [2]
+    assert decoder.length_errors == 1 and decoder.frames_ok == 1
+    # Beklenen uzunlukta ama CRC'si tutmayan başlık da aynı şekilde atlanır
+    frames = decoder.feed(_frame(bytes(ROCKET_FRAME.size), length=ROCKET_FRAME.size)[:-2] + b'\x00\x00' + _rocket(3))
+    assert [seq for seq, _ in frames] == [3]
+    assert decoder.crc_errors == 1
+
+
+@pytest.mark.parametrize('step', [1, 2, 3, 7, 58, 61])
+def test_frames_split_across_reads(step):
+    decoder = BinaryFrameDecoder()
+    stream = b'\x00' + _rocket(1) + _rocket(2) + b'\xAA' + _rocket(3)
+    seqs = []
+    for index in range(0, len(stream), step):
+        seqs += [seq for seq, _ in decoder.feed(stream[index:index + step])]
+    assert seqs == [1, 2, 3]
+    assert decoder.frames_ok == 3 and decoder.crc_errors == 0 and not decoder.buffer
+
+
+def test_trailing_sync_byte_is_kept():
+    decoder = BinaryFrameDecoder()
+    frame = _rocket(4)
+    assert decoder.feed(b'abc' + frame[:1]) == []
+    assert bytes(decoder.buffer) == frame[:1]
+    assert [seq for seq, _ in decoder.feed(frame[1:])] == [4]
+
+
+def test_embedded_frames_are_split_from_text():
+    extractor = EmbeddedFrameExtractor()
+    text, payloads = extractor.feed(b'PAYLOAD_GPS fix 1 2 3\n' + _liquid(9) + b'gX(roll)=1.0\n')
+    assert text == b'PAYLOAD_GPS fix 1 2 3\ngX(roll)=1.0\n'
+    assert [LIQUID_FRAME.unpack(payload) for payload in payloads] == [(9, LEVELS)]
+    assert extractor.frames_ok == 1
+
+
+def test_embedded_plain_text_is_returned_as_is():
+    extractor = EmbeddedFrameExtractor()
+    chunk = b'PAYLOAD_GPS fix 1 2 3\n'
+    text, payloads = extractor.feed(chunk)
+    assert text is chunk and payloads == ()
+
+
+def test_embedded_bad_crc_is_text():
+    extractor = EmbeddedFrameExtractor()
+    bad = _corrupt_crc(_liquid(1))
+    text, payloads = extractor.feed(b'x' + bad + _liquid(2))
+    assert text == b'x' + bad
+    assert [LIQUID_FRAME.unpack(payload)[0] for payload in payloads] == [2]
+    assert extractor.crc_errors == 1 and extractor.frames_ok == 1
+
+
+def test_embedded_frame_split_across_reads():
+    extractor = EmbeddedFrameExtractor()
+    stream = b'line one\n' + _liquid(5) + b'line two\n'
+    texts, payloads = b'', []
+    for index in range(0, len(stream), 4):
+        text, found = extractor.feed(stream[index:index + 4])
+        texts += bytes(text)
+        payloads += found
+    assert texts == b'line one\nline two\n'
+    assert [LIQUID_FRAME.unpack(payload)[0] for payload in payloads] == [5]
+
+
+@pytest.fixture
+def station():
+    from main_system import TEKNOFESTGroundStation
+    from station_log import OFF
+
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)
+    return station
+
+
+def test_station_detects_binary_mode(station):
+    link = station.lora_link
+    assert link.mode == "auto"
+    station.handle_lora_chunk(b'\x00\x00' + _rocket(1), 1.0)
+    assert link.mode == "binary"
+    assert station.telemetry.packet_count == 1
+    assert station.telemetry.altitude == pytest.approx(120.5)
+    # İkili modda metin satırları parse edilmez
+    station.handle_lora_chunk(b'ALT:1.0m|dY:0.0\n', 1.1)
+    assert station.telemetry.packet_count == 1
+    station.handle_lora_chunk(_rocket(2)[:20], 1.2)
+    station.handle_lora_chunk(_rocket(2)[20:], 1.3)
+    assert station.telemetry.packet_count == 2
+    assert link.decoder.frames_ok == 2
+
+
+def test_station_detects_text_mode(station):
+    link = station.lora_link
+    station.handle_lora_chunk(b'ALT:837.9m|maxALT:838.6m|dY:1.9|GPS:invalid\n', 1.0)
+    assert link.mode == "text"
+    assert station.telemetry.packet_count == 1
+    assert station.telemetry.altitude == pytest.approx(837.9)
+    # Metin modunda ikili çerçeve aranmaz
+    station.handle_lora_chunk(_rocket(1), 1.1)
+    assert link.mode == "text" and link.decoder.frames_ok == 0
+    assert station.telemetry.altitude == pytest.approx(837.9)
+
+
+def test_station_payload_liquid_frames(station):
+    station.handle_payload_chunk(b'PAYLOAD_GPS fix 38.1 33.1 900.0\n' + _liquid(1), 1.0)
+    telemetry = station.telemetry
+    assert telemetry.payload_gps_altitude == pytest.approx(900.0)
+    assert telemetry.liquid_levels == LEVELS
+    assert len(station.liquid_history) == 1
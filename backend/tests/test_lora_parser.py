@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""LoRa metin satırı: alan tablosu, kanonik ve bozuk satırlar"""
+
+import pytest
+
+from main_system import TEKNOFESTGroundStation
+from station_log import OFF
+
+CANONICAL = "ALT:837.9m|maxALT:838.6m|dY:1.9|F:0|P1:1|P2:0|gX:-1.9|gY:-4.2|gZ:0.0|aX:0.1|aY:-0.2|aZ:9.8|pitch:45.5"
+
+
+@pytest.fixture
+def station():
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)
+    return station
+
+
+def test_canonical_line(station):
+    assert station.parse_lora_fields(CANONICAL + "|GPS:invalid") == {
+        'altitude': 837.9, 'max_altitude': 838.6, 'delta_y': 1.9,
+        'fired': False, 'p1': True, 'p2': False,
+        'gyro_x': -1.9, 'gyro_y': -4.2, 'gyro_z': 0.0,
+        'accel_x': 0.1, 'accel_y': -0.2, 'accel_z': 9.8, 'pitch': 45.5,
+        'gps_latitude': 0.0, 'gps_longitude': 0.0, 'gps_valid': False, 'gps_altitude': 0.0,
+    }
+
+
+@pytest.mark.parametrize('line, expected', [
+    ("ALT:1.0m|GPS:39.925019,32.836954|GPS_ALT:850.5",
+     {'altitude': 1.0, 'gps_latitude': 39.925019, 'gps_longitude': 32.836954, 'gps_valid': True,
+      'gps_altitude': 850.5}),
+    # GPS irtifası yalnızca aynı satırda geçerli konumla kullanılır
+    ("ALT:1.0m|GPS_ALT:850.5", {'altitude': 1.0}),
+    ("ALT:1.0m|GPS:invalid|GPS_ALT:850.5",
+     {'altitude': 1.0, 'gps_latitude': 0.0, 'gps_longitude': 0.0, 'gps_valid': False, 'gps_altitude': 0.0}),
+])
+def test_gps_fields(station, line, expected):
+    assert station.parse_lora_fields(line) == expected
+
+
+# Kanonik olmayan girdi: parse_lora_fields docstring'indeki bilinçli sonuçlar
+@pytest.mark.parametrize('line, expected', [
+    ("ALT: 120.5 m|dY: 1.9", {'altitude': 120.5, 'delta_y': 1.9}),
+    ("ALT:120|dY:-0.5", {'altitude': 120.0, 'delta_y': -0.5}),
+    (" ALT:1.0m | P1 : 1 ", {'altitude': 1.0, 'p1': True}),
+    ("ALT:1e3m|dY:1e3", {'altitude': 1000.0, 'delta_y': 1000.0}),
+    ("ALT:1.0m|dY:nan|gX:inf|gY:-inf", {'altitude': 1.0}),
+    ("ALT:1.0m|F:1x|P1:2|P2:", {'altitude': 1.0}),
+    ("ALT:1.2.3m|dY:1.9", {'delta_y': 1.9}),
+    ("\x13xxALT:5m|dY:1.0", {'altitude': 5.0, 'delta_y': 1.0}),
+    ("~~maxALT:7.5m|ALT:5m", {'max_altitude': 7.5, 'altitude': 5.0}),
+    ("ALT:120.5m,dY:1.9,gX:1.0", {}),
+    ("ALT:1.0m|R:2.0|:3|||", {'altitude': 1.0}),
+    ("", {}),
+])
+def test_non_canonical_line(station, line, expected):
+    assert station.parse_lora_fields(line) == expected
+
+
+def test_line_without_fields_is_rejected(station):
+    assert not station.parse_lora_data("ALT:120.5m,dY:1.9,gX:1.0")
+    assert not station.parse_lora_data("hello world")
+    assert station.telemetry.packet_count == 0
+    assert station.parse_lora_data(CANONICAL)
+    assert station.telemetry.packet_count == 1
+    assert station.telemetry.pitch == 45.5
+
+
+def test_text_mode_not_detected_from_noise(station):
+    link = station.lora_link
+    station.handle_lora_chunk(b'\x01\x02ALT:\xaa\x55\n', 1.0)
+    assert link.mode == "auto"
+    assert link.rejected.value == 1
+    station.handle_lora_chunk(CANONICAL.encode() + b'\n', 1.1)
+    assert link.mode == "text" and link.parsed.value == 1
+
+
+def test_registered_field(station):
+    station.register_lora_field('T', ('temperature',), float)
+    assert station.parse_lora_fields("ALT:1.0m|T:21.5") == {'altitude': 1.0, 'temperature': 21.5}
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Payload satır ayrıştırıcısı: ön ek tablosu, gürültü ve karma satırlar"""
+
+import pytest
+
+from liquid_levels import decode_liquid_bits
+from main_system import TEKNOFESTGroundStation
+from station_log import OFF
+
+LIQUID_BITS = '01' * 96
+LIQUID_LEVELS = decode_liquid_bits(LIQUID_BITS)
+GPGGA = "$GPGGA,123519,4807.038,N,01131.324,E,1,08,0.9,545.4,M,46.9,M,,*42"
+
+# Dokümante edilen her format: satır, format adı, beklenen alanlar
+PAYLOAD_FORMATS = [
+    ("PAYLOAD_GPS fix 38.388019 33.742263 924.4", 'fix',
+     {'payload_latitude': 38.388019, 'payload_longitude': 33.742263, 'payload_gps_altitude': 924.4,
+      'payload_gps_valid': True}),
+    ("PAYLOAD_GPS nofix lat=11.111110, lon=22.222219, alt=5.0 m", 'nofix',
+     {'payload_latitude': 11.11111, 'payload_longitude': 22.222219, 'payload_gps_altitude': 5.0,
+      'payload_gps_valid': False}),
+    ("PAYLOAD_GPS nofix 11.111110 22.222219 5.0", 'nofix_simple',
+     {'payload_latitude': 11.11111, 'payload_longitude': 22.222219, 'payload_gps_altitude': 5.0,
+      'payload_gps_valid': False}),
+    ("PAYLOAD_GPS:39.925019,32.836954,850.5", 'legacy',
+     {'payload_latitude': 39.925019, 'payload_longitude': 32.836954, 'payload_gps_altitude': 850.5,
+      'payload_gps_valid': True}),
+    (GPGGA, 'nmea',
+     {'payload_latitude': 48 + 7.038 / 60, 'payload_longitude': 11 + 31.324 / 60, 'payload_gps_altitude': 545.4,
+      'payload_gps_valid': True}),
+    ("PL_GPS:39.925019,32.836954|GPS_ALT:850.5", 'fields',
+     {'payload_latitude': 39.925019, 'payload_longitude': 32.836954, 'payload_gps_altitude': 850.5,
+      'payload_gps_valid': True}),
+    ("GPS:39.925019,32.836954", 'fields',
+     {'payload_latitude': 39.925019, 'payload_longitude': 32.836954, 'payload_gps_valid': True}),
+    ("gX(roll)=102.4 gY(pitch)=-8.4 gZ(yaw)=-39.8", 'gyro',
+     {'payload_gyro_x': 102.4, 'payload_gyro_y': -8.4, 'payload_gyro_z': -39.8}),
+    ("gY(pitch)=-8.4", 'gyro', {'payload_gyro_y': -8.4}),
+    (f"ALL={LIQUID_BITS}", 'liquid', {'liquid_levels': LIQUID_LEVELS}),
+    (f"ALL:{LIQUID_BITS}", 'liquid', {'liquid_levels': LIQUID_LEVELS}),
+]
+
+# Konum satırının sonuna eklenmiş gyro / sıvı seviye alanları da çözülür
+MIXED_LINES = [
+    ("PAYLOAD_GPS fix 38.38 33.74 924.4 gX(roll)=1.0 gY(pitch)=2.0 gZ(yaw)=3.0", 'fix',
+     {'payload_gps_altitude': 924.4, 'payload_gyro_x': 1.0, 'payload_gyro_y': 2.0, 'payload_gyro_z': 3.0}),
+    (f"PAYLOAD_GPS fix 38.38 33.74 924.4 ALL={LIQUID_BITS}", 'fix',
+     {'payload_gps_altitude': 924.4, 'liquid_levels': LIQUID_LEVELS}),
+    (f"PAYLOAD_GPS nofix lat=1.0, lon=2.0, alt=3.0 m gZ(yaw)=-4.5 ALL:{LIQUID_BITS}", 'nofix',
+     {'payload_gps_altitude': 3.0, 'payload_gyro_z': -4.5, 'liquid_levels': LIQUID_LEVELS}),
+    ("PAYLOAD_GPS:39.9,32.8,850.5 gX(roll)=7.5", 'legacy',
+     {'payload_gps_altitude': 850.5, 'payload_gyro_x': 7.5}),
+]
+
+
+@pytest.fixture
+def station():
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)
+    return station
+
+
+def _assert_fields(telemetry, expected: dict):
+    for name, value in expected.items():
+        if isinstance(value, float):
+            assert getattr(telemetry, name) == pytest.approx(value), name
+        else:
+            assert getattr(telemetry, name) == value, name
+
+
+@pytest.mark.parametrize('line, line_format, expected', PAYLOAD_FORMATS + MIXED_LINES)
+def test_line_dispatches_to_format(station, line, line_format, expected):
+    link = station.payload_link
+    assert station.parse_payload_gps_data(line, link, 1.0)
+    _assert_fields(station.telemetry, expected)
+    assert link.parsed[line_format].value == 1
+    assert sum(counter.value for counter in link.parsed.values()) == 1
+    assert sum(counter.value for counter in link.rejected.values()) == 0
+    assert len(station.liquid_history) == ('liquid_levels' in expected)
+
+
+@pytest.mark.parametrize('line, line_format, expected', PAYLOAD_FORMATS)
+def test_noise_before_prefix_is_skipped(station, line, line_format, expected):
+    link = station.payload_link
+    assert station.parse_payload_gps_data("\x00\xff#~" + line, link)
+    _assert_fields(station.telemetry, expected)
+    assert link.parsed[line_format].value == 1
+
+
+@pytest.mark.parametrize('line', ["", "hello", "PAYLOAD_GPS", "ALT:120.5m|dY:1.0", "gx(roll)=1.0"])
+def test_unknown_line_is_counted(station, line):
+    link = station.payload_link
+    before = station.telemetry
+    assert not station.parse_payload_gps_data(line, link)
+    assert station.telemetry is before
+    assert link.rejected['unknown'].value == 1
+    assert sum(counter.value for counter in link.parsed.values()) == 0
+
+
+@pytest.mark.parametrize('line, line_format', [
+    ("PAYLOAD_GPS fix abc def ghi", 'fix'),
+    ("PAYLOAD_GPS nofix lat=?, lon=?", 'nofix_simple'),
+    ("$GPGGA,123519,,N,,E,0,00,,,M,,M,,*42", 'nmea'),
+    ("ALL=0101", 'liquid'),
+])
+def test_known_prefix_without_data_is_rejected(station, line, line_format):
+    link = station.payload_link
+    assert station.parse_payload_gps_data(line, link)
+    assert link.rejected[line_format].value == 1
+    assert link.rejected['unknown'].value == 0
+
+
+def test_stage_link_keeps_position_only(station):
+    stage = station.add_link('stage', 'payload', section='stage')
+    line = f"PAYLOAD_GPS fix 38.38 33.74 924.4 gX(roll)=1.0 ALL={LIQUID_BITS}"
+    assert station.parse_payload_gps_data(line, stage, 1.0)
+    telemetry = station.telemetry
+    assert telemetry.stage_gps_altitude == pytest.approx(924.4)
+    assert telemetry.stage_packet_count == 1
+    assert telemetry.payload_gyro_x == 0.0 and telemetry.payload_packet_count == 0
+    assert len(station.liquid_history) == 0
+    # Kademe linkinde gyro / sıvı formatları tanınmaz
+    assert not station.parse_payload_gps_data(f"ALL={LIQUID_BITS}", stage)
+    assert stage.rejected['unknown'].value == 1
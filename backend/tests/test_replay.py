@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""replay.py regresyonu: küçük bir uçuş kaydı oynatılır, telemetri izi (JSONL)
+ve HYİ byte'ları sabit (golden) çıktılarla birebir karşılaştırılır
+
+Kayıt veya parser/paketleyici davranışı bilerek değiştiğinde:
+    cd backend
+    python -m tests.test_replay --regenerate
+"""
+
+import os
+import sys
+
+from flight_recorder import CHANNEL_LORA, CHANNEL_PAYLOAD, FlightRecorder, read_recording
+from replay import main as replay_main
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+CAPTURE = os.path.join(DATA_DIR, 'replay_capture.etulog')
+GOLDEN_TRACE = os.path.join(DATA_DIR, 'replay_trace.jsonl')
+GOLDEN_HYI = os.path.join(DATA_DIR, 'replay_hyi.bin')
+
+CAPTURE_EPOCH = 1750000000.0
+CAPTURE_SECONDS = 3.0
+TEAM_ID = 42
+
+
+def write_capture(directory: str) -> str:
+    """Simülatör profilinden 3 saniyelik kayıt: roket 20 Hz, payload GPS 5 Hz, sıvı seviye 2 Hz
+
+    Roket satırları iki kayda bölünür (satır birleştirme de oynatılır);
+    zaman damgaları duvar saatinden bağımsızdır.
+    """
+    from simulator import FlightProfile, liquid_frame, payload_lines, rocket_line
+
+    profile = FlightProfile(seed=1)
+    recorder = FlightRecorder(directory, chunk_interval=3600)
+    recorder.epoch_offset = CAPTURE_EPOCH
+    recorder.open('replay_capture')
+    for tick in range(int(CAPTURE_SECONDS * 20)):
+        t = tick / 20
+        sample = profile.state(t)
+        line = rocket_line(sample)
+        recorder.record(CHANNEL_LORA, line[:20], t)
+        recorder.record(CHANNEL_LORA, line[20:], t + 0.001)
+        if tick % 4 == 0:
+            recorder.record(CHANNEL_PAYLOAD, payload_lines(sample), t + 0.002)
+        if tick % 10 == 5:
+            recorder.record(CHANNEL_PAYLOAD, liquid_frame(t), t + 0.003)
+    recorder.close()
+    return recorder.path
+
+
+def run_replay(capture: str, directory: str):
+    trace = os.path.join(directory, 'trace.jsonl')
+    hyi = os.path.join(directory, 'hyi.bin')
+    assert replay_main([capture, '--speed', '0', '--team-id', str(TEAM_ID),
+                        '--hyi-out', hyi, '--telemetry-out', trace]) == 0
+    with open(trace, 'rb') as f, open(hyi, 'rb') as g:
+        return f.read(), g.read()
+
+
+def test_capture_fixture():
+    events = list(read_recording(CAPTURE))
+    assert len(events) == 60 * 2 + 15 + 6
+    assert events[0][1] == CAPTURE_EPOCH
+
+
+def test_replay_matches_golden(tmp_path, capsys):
+    trace, hyi = run_replay(CAPTURE, str(tmp_path))
+    with open(GOLDEN_TRACE, 'rb') as f:
+        golden_trace = f.read()
+    with open(GOLDEN_HYI, 'rb') as f:
+        golden_hyi = f.read()
+
+    assert trace.splitlines() == golden_trace.splitlines()
+    assert len(hyi) % 78 == 0
+    # Paket paket karşılaştır: ilk farklı paket hatada görünsün
+    assert [hyi[i:i + 78].hex() for i in range(0, len(hyi), 78)] == \
+        [golden_hyi[i:i + 78].hex() for i in range(0, len(golden_hyi), 78)]
+
+
+def test_replay_is_deterministic(tmp_path, capsys):
+    first = tmp_path / 'first'
+    second = tmp_path / 'second'
+    first.mkdir()
+    second.mkdir()
+    assert run_replay(CAPTURE, str(first)) == run_replay(CAPTURE, str(second))
+
+
+def regenerate():
+    import shutil
+    import tempfile
+
+    directory = tempfile.mkdtemp(prefix='replay_fixture_')
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        shutil.copyfile(write_capture(directory), CAPTURE)
+        trace, hyi = run_replay(CAPTURE, directory)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    with open(GOLDEN_TRACE, 'wb') as f:
+        f.write(trace)
+    with open(GOLDEN_HYI, 'wb') as f:
+        f.write(hyi)
+
+
+if __name__ == '__main__':
+    if '--regenerate' in sys.argv:
+        regenerate()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Yedek link hakemi: tekrar ayıklama ve alan bazında seçim"""
+
+import sys
+import threading
+import time
+
+from station_links import SAME_SAMPLE, Link, LinkArbiter
+
+ROUNDS = 40
+KEYS_PER_ROUND = 100
+
+
+def _arbiter(count: int = 2):
+    links = [Link(f"lora{index + 1}", 'lora') for index in range(count)]
+    return LinkArbiter(links), links
+
+
+def test_duplicate_from_other_link_is_dropped():
+    arbiter, (first, second) = _arbiter()
+    assert arbiter.admit(first, "ALT:1.0m", 10.0)
+    assert not arbiter.admit(second, "ALT:1.0m", 10.05)
+    assert second.duplicates == 1
+    # Aynı linkin aynı satırı yeniden getirmesi yeni örnektir
+    assert arbiter.admit(first, "ALT:1.0m", 10.1)
+
+
+def test_stale_sequence_is_dropped():
+    arbiter, (first, second) = _arbiter()
+    assert arbiter.admit(first, 10, 1.0)
+    assert not arbiter.admit(second, 9, 1.05)
+    assert second.stale == 1 and arbiter.stale == 1
+
+
+def test_select_keeps_newer_fields():
+    arbiter, (first, second) = _arbiter()
+    assert arbiter.select(first, {'altitude': 2.0}, 5.0) == {'altitude': 2.0}
+    # Daha eski ana ait alan yazılmaz
+    assert arbiter.select(second, {'altitude': 1.0, 'pitch': 3.0}, 5.0 - 4 * SAME_SAMPLE) == {'pitch': 3.0}
+    assert arbiter.field_rejects == 1
+
+
+def test_concurrent_duplicates_admitted_once():
+    """Her örnek her iki linkin thread'inden aynı anda gelir; yalnızca biri kabul edilir"""
+    arbiter, links = _arbiter(4)
+    barrier = threading.Barrier(len(links), timeout=10)
+    admitted = [[] for _ in links]
+    errors = []
+
+    def receiver(index):
+        link = links[index]
+        try:
+            for round_index in range(ROUNDS):
+                barrier.wait()
+                now = time.monotonic()
+                for key in range(round_index * KEYS_PER_ROUND, (round_index + 1) * KEYS_PER_ROUND):
+                    if arbiter.admit(link, f"ALT:{key}m", now):
+                        admitted[index].append(key)
+                        arbiter.select(link, {'altitude': float(key)}, now)
+        except Exception as e:
+            errors.append(e)
+            barrier.abort()
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Thread'ler sık sık yer değiştirsin
+    try:
+        threads = [threading.Thread(target=receiver, args=(index,)) for index in range(len(links))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not [e for e in errors if not isinstance(e, threading.BrokenBarrierError)], errors
+    total = ROUNDS * KEYS_PER_ROUND
+    keys = sorted(key for keys in admitted for key in keys)
+    assert keys == list(range(total))
+    assert arbiter.accepted == total
+    assert arbiter.duplicates == total * (len(links) - 1)
+    assert sum(link.duplicates for link in links) == arbiter.duplicates
+    assert sum(link.samples for link in links) == total
+
+
+def _station_with_backup(kind: str):
+    from main_system import TEKNOFESTGroundStation
+    from station_log import OFF
+
+    station = TEKNOFESTGroundStation()
+    station.log.set_level(OFF)
+    primary = station.links[kind]
+    backup = station.add_link(f"{kind}2", kind)
+    primary.arbiter = backup.arbiter = LinkArbiter([primary, backup])
+    return station, primary, backup
+
+
+def test_lora_sample_with_no_fresh_fields_is_not_applied():
+    station, primary, backup = _station_with_backup('lora')
+    primary.framer.line_started_at = 10.0
+    assert station.parse_lora_data("ALT:120.5m|dY:1.0|gX:2.0", primary)
+    before = station.telemetry
+    history = len(station.rocket_history)
+    # Yedek linkten aynı alanların daha eski hali: hepsi hakemde elenir
+    backup.framer.line_started_at = 10.0 - 4 * SAME_SAMPLE
+    assert station.parse_lora_data("ALT:118.0m|dY:0.5|gX:1.5", backup)
+    assert station.telemetry is before
+    assert station.telemetry.packet_count == 1
+    assert len(station.rocket_history) == history
+
+
+def test_payload_sample_with_no_fresh_fields_is_not_committed():
+    station, primary, backup = _station_with_backup('payload')
+    primary.framer.line_started_at = 10.0
+    assert station.parse_payload_gps_data("PAYLOAD_GPS fix 38.388019 33.742263 924.4", primary)
+    before = station.telemetry
+    backup.framer.line_started_at = 10.0 - 4 * SAME_SAMPLE
+    assert station.parse_payload_gps_data("PAYLOAD_GPS fix 38.1 33.1 900.0", backup)
+    assert station.telemetry is before
+    assert station.telemetry.payload_packet_count == 1
+    assert backup.parsed['fix'].value == 1 and backup.rejected['fix'].value == 0
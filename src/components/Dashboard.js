@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { Activity, Wifi, WifiOff, Settings, Send, RefreshCw, Satellite } from 'lucide-react';
 import LiquidLevel3D from './LiquidLevel3D';
 import Rocket3D from './Rocket3D';
@@ -96,13 +96,18 @@ const Dashboard = () => {
     }
   };
 
-  // Log mesajlarını al
+  // Log mesajlarını al (imleçle - loglar sunucuda silinmez, her dashboard kendi imlecinden okur)
+  const logCursor = useRef(null);
   const fetchLogs = async () => {
     try {
-      const response = await fetch(`${API_BASE}/logs`);
+      const after = logCursor.current === null ? '' : `?after=${logCursor.current}`;
+      const response = await fetch(`${API_BASE}/logs${after}`);
       const data = await response.json();
-      if (data.success && data.logs.length > 0) {
-        setLogs(prev => [...prev, ...data.logs].slice(-50)); // Son 50 log
+      if (data.success) {
+        logCursor.current = data.next;
+        if (data.logs.length > 0) {
+          setLogs(prev => [...prev, ...data.logs].slice(-50)); // Son 50 log
+        }
       }
     } catch (error) {
       console.error('Log alınamadı:', error);
@@ -137,12 +142,50 @@ const Dashboard = () => {
     loadAvailablePorts();
     checkSystemStatus();
     
-    // Periyodik veri alma
-    const telemetryInterval = setInterval(fetchTelemetry, 500);
-    const logInterval = setInterval(fetchLogs, 1000);
+    // Telemetri akışı (SSE): önce tam snapshot, sonra sadece değişen alanlar.
+    // EventSource yeniden bağlanırken Last-Event-ID ile kaldığı yerden devam eder.
+    let telemetrySource = null;
+    let telemetryInterval = null;
+    if (window.EventSource) {
+      telemetrySource = new EventSource(`${API_BASE}/stream`);
+      telemetrySource.addEventListener('snapshot', (event) => {
+        setTelemetryData(JSON.parse(event.data));
+      });
+      telemetrySource.addEventListener('delta', (event) => {
+        const delta = JSON.parse(event.data);
+        setTelemetryData(prev => ({ ...prev, ...delta }));
+      });
+    } else {
+      // SSE desteklenmiyorsa periyodik veri alma
+      telemetryInterval = setInterval(fetchTelemetry, 500);
+    }
+    // Son loglar bir kez alınır, ardından canlı akış (SSE) imleçten devam eder;
+    // EventSource yoksa imleçli polling
+    let logSource = null;
+    let logInterval = null;
+    let unmounted = false;
+    fetchLogs().then(() => {
+      if (unmounted) return;
+      if (window.EventSource) {
+        logSource = new EventSource(`${API_BASE}/logs/stream?after=${logCursor.current || 0}`);
+        logSource.onmessage = (event) => {
+          const log = JSON.parse(event.data);
+          setLogs(prev => [...prev.slice(-49), log]);
+        };
+      } else {
+        logInterval = setInterval(fetchLogs, 1000);
+      }
+    });
     const statusInterval = setInterval(checkSystemStatus, 5000);
     
     return () => {
+      if (telemetrySource) {
+        telemetrySource.close();
+      }
+      unmounted = true;
+      if (logSource) {
+        logSource.close();
+      }
       clearInterval(telemetryInterval);
       clearInterval(logInterval);
       clearInterval(statusInterval);
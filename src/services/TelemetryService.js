@@ -67,7 +67,12 @@ class TelemetryService {
         }
         
         // Log mesajları al
-        const logsResponse = await axios.get(`${this.baseURL}/api/logs`);
+        const logsResponse = await axios.get(`${this.baseURL}/api/logs`, {
+          params: this.logCursor == null ? {} : { after: this.logCursor }
+        });
+        if (logsResponse.data.success) {
+          this.logCursor = logsResponse.data.next;
+        }
         if (logsResponse.data.success && logsResponse.data.logs.length > 0) {
           logsResponse.data.logs.forEach(log => {
             if (this.onLogReceived) {
@@ -249,11 +254,15 @@ class TelemetryService {
     }
   }
 
-  // Log mesajlarını al
+  // Log mesajlarını al (imleçle - sunucudaki loglar silinmez)
   async getLogs() {
     try {
-      const response = await fetch(`${this.baseURL}/logs`);
+      const after = this.logCursor == null ? '' : `?after=${this.logCursor}`;
+      const response = await fetch(`${this.baseURL}/logs${after}`);
       const data = await response.json();
+      if (data.success) {
+        this.logCursor = data.next;
+      }
       
       if (data.success && data.logs.length > 0 && this.onLogReceived) {
         data.logs.forEach(log => {
@@ -402,6 +411,8 @@ class TelemetryService {
     this.onLogReceived = null;
     this.telemetryInterval = null;
     this.logInterval = null;
+    this.telemetrySource = null;
+    this.telemetryState = {};
   }
 
   // Mevcut COM portlarını al
@@ -490,45 +501,7 @@ class TelemetryService {
       const data = await response.json();
       
       if (data.success && this.onDataReceived) {
-        // Backend'den gelen veriyi frontend formatına dönüştür
-        const telemetryData = {
-          // Roket verileri
-          altitude: data.data.altitude || 0.0,
-          maxAltitude: data.data.max_altitude || 0.0,
-          gpsAltitude: data.data.gps_altitude || 0.0,
-          deltaY: data.data.delta_y || 0.0,
-          fired: data.data.fired || false,
-          gyroX: data.data.gyro_x || 0.0,
-          gyroY: data.data.gyro_y || 0.0,
-          gyroZ: data.data.gyro_z || 0.0,
-          accelX: data.data.accel_x || 0.00,
-          accelY: data.data.accel_y || 0.00,
-          accelZ: data.data.accel_z || 0.00,
-          pitch: data.data.pitch || 0.0,
-          
-          // Roket GPS verileri
-          gpsLatitude: data.data.gps_latitude || 0.0,
-          gpsLongitude: data.data.gps_longitude || 0.0,
-          gpsValid: data.data.gps_valid || false,
-          
-          // Payload GPS verileri
-          payloadGpsAltitude: data.data.payload_gps_altitude || 0.0,
-          payloadLatitude: data.data.payload_latitude || 0.0,
-          payloadLongitude: data.data.payload_longitude || 0.0,
-          payloadGpsValid: data.data.payload_gps_valid || false,
-          
-          // Sıvı seviye verileri (ALL: formatından gelen)
-          allLiquidData: data.data.all_liquid_data || "",
-          liquidLevels: data.data.liquid_levels || [],
-          
-          // Zaman damgaları ve sayaçlar
-          lastUpdate: data.data.last_update || null,
-          packetCount: data.data.packet_count || 0,
-          payloadLastUpdate: data.data.payload_last_update || null,
-          payloadPacketCount: data.data.payload_packet_count || 0
-        };
-        
-        this.onDataReceived(telemetryData);
+        this.onDataReceived(this.mapTelemetry(data.data));
       }
       
       return data.success ? data.data : null;
@@ -538,11 +511,84 @@ class TelemetryService {
     }
   }
 
-  // Log mesajlarını al
+  // Backend'den gelen veriyi frontend formatına dönüştür
+  mapTelemetry(raw) {
+    return {
+      // Roket verileri
+      altitude: raw.altitude || 0.0,
+      maxAltitude: raw.max_altitude || 0.0,
+      gpsAltitude: raw.gps_altitude || 0.0,
+      deltaY: raw.delta_y || 0.0,
+      fired: raw.fired || false,
+      gyroX: raw.gyro_x || 0.0,
+      gyroY: raw.gyro_y || 0.0,
+      gyroZ: raw.gyro_z || 0.0,
+      accelX: raw.accel_x || 0.00,
+      accelY: raw.accel_y || 0.00,
+      accelZ: raw.accel_z || 0.00,
+      pitch: raw.pitch || 0.0,
+      
+      // Roket GPS verileri
+      gpsLatitude: raw.gps_latitude || 0.0,
+      gpsLongitude: raw.gps_longitude || 0.0,
+      gpsValid: raw.gps_valid || false,
+      
+      // Payload GPS verileri
+      payloadGpsAltitude: raw.payload_gps_altitude || 0.0,
+      payloadLatitude: raw.payload_latitude || 0.0,
+      payloadLongitude: raw.payload_longitude || 0.0,
+      payloadGpsValid: raw.payload_gps_valid || false,
+      
+      // Sıvı seviye verileri (ALL: formatından gelen)
+      allLiquidData: raw.all_liquid_data || "",
+      liquidLevels: raw.liquid_levels || [],
+      
+      // Zaman damgaları ve sayaçlar
+      lastUpdate: raw.last_update || null,
+      packetCount: raw.packet_count || 0,
+      payloadLastUpdate: raw.payload_last_update || null,
+      payloadPacketCount: raw.payload_packet_count || 0
+    };
+  }
+
+  // Telemetri akışını (SSE) başlat: ilk olay tam snapshot, sonrakiler sadece değişen alanlar
+  startDataStream() {
+    this.stopDataStream();
+    this.telemetryState = {};
+    this.telemetrySource = new EventSource(`${this.baseURL}/stream`);
+
+    this.telemetrySource.addEventListener('snapshot', (event) => {
+      this.telemetryState = JSON.parse(event.data);
+      if (this.onDataReceived) {
+        this.onDataReceived(this.mapTelemetry(this.telemetryState));
+      }
+    });
+
+    this.telemetrySource.addEventListener('delta', (event) => {
+      Object.assign(this.telemetryState, JSON.parse(event.data));
+      if (this.onDataReceived) {
+        this.onDataReceived(this.mapTelemetry(this.telemetryState));
+      }
+    });
+  }
+
+  // Telemetri akışını durdur
+  stopDataStream() {
+    if (this.telemetrySource) {
+      this.telemetrySource.close();
+      this.telemetrySource = null;
+    }
+  }
+
+  // Log mesajlarını al (imleçle - sunucudaki loglar silinmez)
   async getLogs() {
     try {
-      const response = await fetch(`${this.baseURL}/logs`);
+      const after = this.logCursor == null ? '' : `?after=${this.logCursor}`;
+      const response = await fetch(`${this.baseURL}/logs${after}`);
       const data = await response.json();
+      if (data.success) {
+        this.logCursor = data.next;
+      }
       
       if (data.success && data.logs.length > 0 && this.onLogReceived) {
         data.logs.forEach(log => {
@@ -797,12 +843,16 @@ class TelemetryService {
       clearInterval(this.logInterval);
     }
 
-    // Telemetri verilerini her 500ms'de al
-    this.telemetryInterval = setInterval(() => {
-      if (this.isConnected) {
-        this.getTelemetryData();
-      }
-    }, 500);
+    // Telemetri verilerini SSE ile al, desteklenmiyorsa her 500ms'de sorgula
+    if (typeof window !== 'undefined' && window.EventSource) {
+      this.startDataStream();
+    } else {
+      this.telemetryInterval = setInterval(() => {
+        if (this.isConnected) {
+          this.getTelemetryData();
+        }
+      }, 500);
+    }
 
     // Log mesajlarını her 1 saniyede al
     this.logInterval = setInterval(() => {
@@ -814,6 +864,7 @@ class TelemetryService {
 
   // Veri polling'ini durdur
   stopDataPolling() {
+    this.stopDataStream();
     if (this.telemetryInterval) {
       clearInterval(this.telemetryInterval);
       this.telemetryInterval = null;